@@ -0,0 +1,4 @@
+# Imported by admin autodiscovery; registers the communications ModelAdmins
+from .email_admin import EmailTemplateAdmin, QueuedEmailAdmin
+
+__all__ = ['EmailTemplateAdmin', 'QueuedEmailAdmin']
@@ -0,0 +1,43 @@
+# admin/apps/communications/admin/email_admin.py
+from django.contrib import admin
+from django.utils import timezone
+
+from apps.accounts.admin_site import admin_site
+
+from ..constants import EmailStatus
+from ..models.email_template import EmailTemplate
+from ..models.queued_email import QueuedEmail
+
+
+@admin.register(EmailTemplate, site=admin_site)
+class EmailTemplateAdmin(admin.ModelAdmin):
+    list_display = ['template_name', 'slug', 'subject', 'is_system', 'updated_at']
+    search_fields = ['template_name', 'slug', 'subject']
+    readonly_fields = ['created_at', 'updated_at']
+
+    def get_readonly_fields(self, request, obj=None):
+        # The application sends system templates by slug
+        if obj and obj.is_system:
+            return [*self.readonly_fields, 'slug']
+        return self.readonly_fields
+
+
+@admin.register(QueuedEmail, site=admin_site)
+class QueuedEmailAdmin(admin.ModelAdmin):
+    list_display = ['id', 'to_email', 'subject_or_template', 'status', 'priority', 'retry_count', 'next_attempt_at', 'sent_at']
+    list_filter = ['status', 'template_slug']
+    search_fields = ['to_email', 'subject', 'reference']
+    readonly_fields = ['sent_at', 'created_at']
+    actions = ['retry_now']
+    show_full_result_count = False  # Skip the unfiltered COUNT(*) on a growing table
+
+    @admin.display(description='Subject')
+    def subject_or_template(self, obj):
+        return obj.subject or f'[{obj.template_slug}]'
+
+    @admin.action(description='Retry selected emails now')
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status=EmailStatus.SENT).update(
+            status=EmailStatus.PENDING, next_attempt_at=timezone.now(), error_message=None,
+        )
+        self.message_user(request, f'{updated} email(s) queued for delivery.')
@@ -1,2 +1,12 @@
-# apps.py
-# Empty file - content will be added later
+# admin/apps/communications/apps.py
+from django.apps import AppConfig
+
+
+class CommunicationsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.communications'
+    verbose_name = 'Communications'
+
+    def ready(self):
+        # Queue notifications for new submissions
+        from . import signals  # noqa: F401
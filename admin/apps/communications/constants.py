@@ -0,0 +1,28 @@
+# admin/apps/communications/constants.py
+from django.db import models
+
+
+class EmailStatus(models.TextChoices):
+    PENDING = 'pending', 'Pending'
+    SENDING = 'sending', 'Sending'
+    SENT = 'sent', 'Sent'
+    FAILED = 'failed', 'Failed'
+
+
+class DeliveryStatus(models.TextChoices):
+    DELIVERED = 'delivered', 'Delivered'
+    BOUNCED = 'bounced', 'Bounced'
+    COMPLAINED = 'complained', 'Complained'
+
+
+# System template slugs (seeded by migration 0002)
+SUBMISSION_RECEIVED = 'submission-received'
+SUBMISSION_STAFF_ALERT = 'submission-staff-alert'
+
+# The client acknowledgement goes to whatever address the public form was
+# given, so the submitted name it repeats is cut to this many characters
+SUBMISSION_ACK_NAME_MAX_LENGTH = 40
+
+# Lower sends first
+PRIORITY_HIGH = 3
+PRIORITY_NORMAL = 5
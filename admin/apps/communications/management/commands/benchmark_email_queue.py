@@ -0,0 +1,81 @@
+# admin/apps/communications/management/commands/benchmark_email_queue.py
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.test import override_settings
+
+from ...constants import SUBMISSION_RECEIVED
+from ...models.queued_email import QueuedEmail
+from ...models.sent_email import SentEmail
+from ...services.email_service import process_queued_emails
+
+BENCHMARK_REFERENCE = 'benchmark:email-queue'
+
+
+class Command(BaseCommand):
+    help = (
+        'Queue N templated emails and time the delivery workers draining them. Point --smtp at a local '
+        'stand-in such as `python -m aiosmtpd -n -l localhost:1025`; without it the locmem backend is used '
+        'and only the queue and rendering are measured.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--emails', type=int, default=5000)
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument('--workers', type=int, default=1, help='Concurrent delivery workers (threads)')
+        parser.add_argument('--smtp', help='host:port of an SMTP server without TLS or auth')
+        parser.add_argument('--keep', action='store_true', help='Keep the queued and sent rows afterwards')
+
+    def handle(self, *args, **options):
+        email_settings = {'EMAIL_BACKEND': 'django.core.mail.backends.locmem.EmailBackend'}
+        if options['smtp']:
+            host, port = options['smtp'].rsplit(':', 1)
+            email_settings = {
+                'EMAIL_BACKEND': 'django.core.mail.backends.smtp.EmailBackend',
+                'EMAIL_HOST': host,
+                'EMAIL_PORT': int(port),
+                'EMAIL_USE_TLS': False,
+                'EMAIL_HOST_USER': '',
+                'EMAIL_HOST_PASSWORD': '',
+            }
+
+        QueuedEmail.objects.bulk_create([
+            QueuedEmail(
+                to_email=f'client{i}@example.com',
+                to_name=f'Client {i}',
+                template_slug=SUBMISSION_RECEIVED,
+                context={'reference': i, 'first_name': f'Client {i}', 'services': ['software', 'design']},
+                reference=BENCHMARK_REFERENCE,
+            )
+            for i in range(options['emails'])
+        ], batch_size=1000)
+
+        def worker(_):
+            processed = 0
+            try:
+                while True:
+                    batch = process_queued_emails(batch_size=options['batch_size'], reference=BENCHMARK_REFERENCE)
+                    if not batch:
+                        return processed
+                    processed += batch
+            finally:
+                close_old_connections()
+
+        try:
+            with override_settings(**email_settings):
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=options['workers']) as pool:
+                    processed = sum(pool.map(worker, range(options['workers'])))
+                elapsed = time.perf_counter() - started
+
+            sent = QueuedEmail.objects.filter(reference=BENCHMARK_REFERENCE, status='sent').count()
+            self.stdout.write(
+                f'{processed} email(s) processed, {sent} sent in {elapsed:.2f}s by {options["workers"]} worker(s): '
+                f'{sent / elapsed * 60:,.0f} emails/minute'
+            )
+        finally:
+            if not options['keep']:
+                SentEmail.objects.filter(queued_email__reference=BENCHMARK_REFERENCE).delete()
+                QueuedEmail.objects.filter(reference=BENCHMARK_REFERENCE).delete()
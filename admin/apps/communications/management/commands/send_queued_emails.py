@@ -0,0 +1,29 @@
+# admin/apps/communications/management/commands/send_queued_emails.py
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...services.email_service import process_queued_emails
+
+
+class Command(BaseCommand):
+    help = 'Send queued emails in batches over one SMTP connection per batch (pending -> sent/failed)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain the queue once and exit')
+        parser.add_argument('--batch-size', type=int, default=settings.EMAIL_QUEUE_BATCH_SIZE)
+        parser.add_argument('--interval', type=float, default=2.0, help='Seconds to sleep when nothing is due')
+
+    def handle(self, *args, **options):
+        total = 0
+        while True:
+            processed = process_queued_emails(batch_size=options['batch_size'])
+            total += processed
+            if processed:
+                continue
+            if options['once']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(f'Processed {total} email(s)'))
@@ -0,0 +1,66 @@
+from django.db import migrations
+
+
+SYSTEM_TEMPLATES = [
+    {
+        'slug': 'submission-received',
+        'template_name': 'Submission received (client)',
+        'subject': "We've received your request, {{ first_name }}",
+        'body': (
+            'Hi {{ first_name }},\n'
+            '\n'
+            'Thanks for getting in touch with DyceTix. We have received your project request '
+            'and a member of our team will get back to you within one business day.\n'
+            '\n'
+            'Your reference number is #{{ reference }}.\n'
+            '{% if services %}Services: {{ services|join:", " }}\n{% endif %}'
+            '\n'
+            'The DyceTix Team\n'
+        ),
+        'variables': ['reference', 'first_name', 'services'],
+    },
+    {
+        'slug': 'submission-staff-alert',
+        'template_name': 'New submission (staff)',
+        'subject': 'New client requirement #{{ reference }} from {{ full_name }}',
+        'body': (
+            'A new client requirement was submitted{% if source %} via {{ source }}{% endif %}.\n'
+            '\n'
+            'Name: {{ full_name }}\n'
+            'Email: {{ email }}\n'
+            '{% if phone %}Phone: {{ phone }}\n{% endif %}'
+            '{% if company %}Company: {{ company }}\n{% endif %}'
+            'Services: {{ services|join:", " }}{% if other_service %} ({{ other_service }}){% endif %}\n'
+            '\n'
+            '{{ project_description }}\n'
+            '\n'
+            'Open it in the admin: {{ admin_url }}\n'
+        ),
+        'variables': [
+            'reference', 'full_name', 'email', 'phone', 'company', 'services',
+            'other_service', 'project_description', 'source', 'admin_url',
+        ],
+    },
+]
+
+
+def create_system_templates(apps, schema_editor):
+    EmailTemplate = apps.get_model('communications', 'EmailTemplate')
+    for template in SYSTEM_TEMPLATES:
+        EmailTemplate.objects.get_or_create(slug=template['slug'], defaults={**template, 'is_system': True})
+
+
+def delete_system_templates(apps, schema_editor):
+    EmailTemplate = apps.get_model('communications', 'EmailTemplate')
+    EmailTemplate.objects.filter(slug__in=[template['slug'] for template in SYSTEM_TEMPLATES]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_system_templates, delete_system_templates),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2 on 2026-10-18 16:52
+
+from django.db import migrations, models
+
+
+# The client acknowledgement's subject no longer repeats the submitted name
+OLD_ACK_SUBJECT = "We've received your request, {{ first_name }}"
+NEW_ACK_SUBJECT = "We've received your request (#{{ reference }})"
+
+
+def update_ack_subject(apps, schema_editor):
+    EmailTemplate = apps.get_model('communications', 'EmailTemplate')
+    # Leaves a subject staff have since edited alone
+    EmailTemplate.objects.filter(slug='submission-received', subject=OLD_ACK_SUBJECT).update(subject=NEW_ACK_SUBJECT)
+
+
+def revert_ack_subject(apps, schema_editor):
+    EmailTemplate = apps.get_model('communications', 'EmailTemplate')
+    EmailTemplate.objects.filter(slug='submission-received', subject=NEW_ACK_SUBJECT).update(subject=OLD_ACK_SUBJECT)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communications', '0002_system_templates'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='queuedemail',
+            index=models.Index(fields=['template_slug', 'created_at'], name='email_queue_template_idx'),
+        ),
+        migrations.RunPython(update_ack_subject, revert_ack_subject),
+    ]
@@ -0,0 +1,5 @@
+from .email_template import EmailTemplate
+from .queued_email import QueuedEmail
+from .sent_email import SentEmail
+
+__all__ = ['EmailTemplate', 'QueuedEmail', 'SentEmail']
@@ -0,0 +1,25 @@
+# admin/apps/communications/models/email_template.py
+from django.db import models
+
+
+class EmailTemplate(models.Model):
+    """
+    Subject and plain-text body in Django template syntax, rendered with
+    the queued email's context when it is sent
+    """
+    template_name = models.CharField(max_length=100)
+    slug = models.SlugField(max_length=100, unique=True)
+    subject = models.CharField(max_length=200)
+    body = models.TextField()
+    variables = models.JSONField(default=list, blank=True)  # Context names the template expects, for editors
+    is_system = models.BooleanField(default=True)  # Sent by the application; keep the slug
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'email_templates'
+        ordering = ['template_name']
+
+    def __str__(self):
+        return self.template_name
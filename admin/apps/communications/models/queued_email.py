@@ -0,0 +1,55 @@
+# admin/apps/communications/models/queued_email.py
+from django.db import models
+from django.utils import timezone
+
+from ..constants import PRIORITY_NORMAL, EmailStatus
+
+
+class QueuedEmail(models.Model):
+    """
+    One outgoing email. Rows are written by the request (in its
+    transaction) and sent by the delivery worker (services/email_service.py).
+
+    Templated mails carry ``template_slug`` and ``context``; the subject and
+    body are rendered and stored when they are sent.
+    """
+    to_email = models.EmailField()
+    to_name = models.CharField(max_length=100, blank=True)
+    from_email = models.EmailField(blank=True)  # DEFAULT_FROM_EMAIL when empty
+    from_name = models.CharField(max_length=100, blank=True)
+    subject = models.CharField(max_length=200, blank=True)
+    body = models.TextField(blank=True)
+    template_slug = models.CharField(max_length=100, blank=True)
+    context = models.JSONField(default=dict, blank=True)
+
+    # Delivery
+    status = models.CharField(max_length=20, choices=EmailStatus.choices, default=EmailStatus.PENDING)
+    priority = models.PositiveSmallIntegerField(default=PRIORITY_NORMAL)  # Lower sends first
+    retry_count = models.PositiveSmallIntegerField(default=0)
+    # Pending: when to (re)try. Sending: when the worker's claim expires
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    error_message = models.TextField(blank=True, null=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+
+    # What the mail is about, e.g. 'client_requirement:42'
+    reference = models.CharField(max_length=100, blank=True, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'email_queue'
+        ordering = ['-created_at']
+        verbose_name = 'Queued Email'
+        verbose_name_plural = 'Email Queue'
+        indexes = [
+            # The worker's claim query; sent and failed rows stay out of it
+            models.Index(
+                fields=['priority', 'next_attempt_at', 'id'],
+                name='email_queue_due_idx',
+                condition=models.Q(status__in=['pending', 'sending']),
+            ),
+            # Recent mails per template: the client acknowledgement limits
+            models.Index(fields=['template_slug', 'created_at'], name='email_queue_template_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.to_email}: {self.subject or self.template_slug} ({self.status})'
@@ -0,0 +1,28 @@
+# admin/apps/communications/models/sent_email.py
+from django.db import models
+
+from ..constants import DeliveryStatus
+
+
+class SentEmail(models.Model):
+    """Delivery log: one row per email accepted by the SMTP server"""
+    queued_email = models.ForeignKey(
+        'QueuedEmail',
+        on_delete=models.SET_NULL,
+        related_name='deliveries',
+        null=True,
+        blank=True
+    )
+    to_email = models.EmailField()
+    subject = models.CharField(max_length=200)
+    template_slug = models.CharField(max_length=100, blank=True)
+    status = models.CharField(max_length=20, choices=DeliveryStatus.choices, default=DeliveryStatus.DELIVERED)
+    external_id = models.CharField(max_length=255, blank=True)  # Message-ID header
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'sent_emails'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f'{self.to_email}: {self.subject}'
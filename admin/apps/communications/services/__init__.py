@@ -0,0 +1 @@
+# admin/apps/communications/services/__init__.py
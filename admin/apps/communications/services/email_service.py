@@ -0,0 +1,241 @@
+# admin/apps/communications/services/email_service.py
+"""
+Durable email queue and batched delivery.
+
+Requests only insert ``email_queue`` rows (``queue_emails``); nothing
+talks to the mail server on the request path. The delivery worker claims
+due rows with SELECT ... FOR UPDATE SKIP LOCKED, so several workers can
+run at once. It marks them ``sending`` with a lease, then sends the whole
+batch over one SMTP connection and records the outcomes in two bulk
+writes.
+
+Failed sends are retried with exponential backoff (EMAIL_QUEUE_RETRY_DELAY
+doubled per attempt, with jitter). Permanent SMTP errors (5xx) and
+missing templates fail at once. If a worker dies mid-batch its lease
+expires and the rows are claimed again, so delivery is at least once.
+
+The worker runs as an in-process thread woken after each commit
+(EMAIL_QUEUE_IN_PROCESS) and/or as ``manage.py send_queued_emails``.
+"""
+import logging
+import random
+import smtplib
+import threading
+from datetime import timedelta
+from email.utils import formataddr, make_msgid
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.mail.utils import DNS_NAME
+from django.db import close_old_connections, transaction
+from django.template import TemplateSyntaxError
+from django.utils import timezone
+
+from ..constants import EmailStatus
+from ..models.queued_email import QueuedEmail
+from ..models.sent_email import SentEmail
+from .template_service import load_templates, render_template
+
+logger = logging.getLogger(__name__)
+
+
+class PermanentEmailError(Exception):
+    """Sending can never succeed (bad template, address rejected); don't retry"""
+
+
+# ==================== QUEUEING (request path) ====================
+
+def queue_emails(emails):
+    """
+    Insert unsaved QueuedEmail rows in one statement and wake the worker
+    once the current transaction commits
+    """
+    created = QueuedEmail.objects.bulk_create(emails)
+    schedule_delivery()
+    return created
+
+
+# ==================== DELIVERY (off the request path) ====================
+
+def claim_batch(batch_size, reference=None):
+    """Lock and lease up to `batch_size` due emails (only those with `reference` if given), most urgent first"""
+    now = timezone.now()
+    due = QueuedEmail.objects.filter(status__in=[EmailStatus.PENDING, EmailStatus.SENDING], next_attempt_at__lte=now)
+    if reference is not None:
+        due = due.filter(reference=reference)
+    with transaction.atomic():
+        ids = list(
+            due
+            .select_for_update(skip_locked=True)
+            .order_by('priority', 'next_attempt_at', 'id')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return []
+        QueuedEmail.objects.filter(id__in=ids).update(
+            status=EmailStatus.SENDING,
+            next_attempt_at=now + timedelta(seconds=settings.EMAIL_QUEUE_LEASE),
+        )
+    return list(QueuedEmail.objects.filter(id__in=ids).order_by('priority', 'id'))
+
+
+def build_message(email, templates, connection):
+    if email.template_slug:
+        template = templates.get(email.template_slug)
+        if template is None:
+            raise PermanentEmailError(f'Unknown email template "{email.template_slug}"')
+        try:
+            email.subject, email.body = render_template(template, email.context)
+        except TemplateSyntaxError as e:
+            raise PermanentEmailError(f'Template "{email.template_slug}" is invalid: {e}') from e
+
+    from_email = settings.DEFAULT_FROM_EMAIL
+    if email.from_email:
+        from_email = formataddr((email.from_name, email.from_email)) if email.from_name else email.from_email
+    return EmailMessage(
+        subject=email.subject,
+        body=email.body,
+        from_email=from_email,
+        to=[formataddr((email.to_name, email.to_email)) if email.to_name else email.to_email],
+        headers={'Message-ID': make_msgid(domain=DNS_NAME)},
+        connection=connection,
+    )
+
+
+def is_permanent(error):
+    if isinstance(error, (PermanentEmailError, smtplib.SMTPRecipientsRefused)):
+        return True
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500
+
+
+def retry_delay(retry_count):
+    delay = min(settings.EMAIL_QUEUE_RETRY_DELAY * 2 ** retry_count, settings.EMAIL_QUEUE_MAX_RETRY_DELAY)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))  # Jitter spreads retries of one outage
+
+
+def mark_failed(email, error, now):
+    email.error_message = str(error)[:1000] or error.__class__.__name__
+    if is_permanent(error) or email.retry_count >= settings.EMAIL_QUEUE_MAX_RETRIES:
+        email.status = EmailStatus.FAILED
+        logger.warning('Email %s to %s failed: %s', email.pk, email.to_email, email.error_message)
+    else:
+        email.status = EmailStatus.PENDING
+        email.next_attempt_at = now + retry_delay(email.retry_count)
+        email.retry_count += 1
+
+
+def send_batch(emails):
+    """Send claimed emails over one SMTP connection and record the outcome of each"""
+    templates = load_templates(email.template_slug for email in emails)
+    connection = get_connection(fail_silently=False)
+    sent = []
+    failed = []
+
+    try:
+        connection.open()
+    except Exception as e:
+        # Server unreachable: the whole batch backs off
+        logger.warning('Could not connect to the mail server: %s', e)
+        now = timezone.now()
+        for email in emails:
+            mark_failed(email, e, now)
+        failed = emails
+        emails = []
+
+    try:
+        for index, email in enumerate(emails):
+            try:
+                message = build_message(email, templates, connection)
+                connection.send_messages([message])
+                email.external_id = message.extra_headers['Message-ID']
+                sent.append(email)
+            except Exception as e:
+                mark_failed(email, e, timezone.now())
+                failed.append(email)
+                if not isinstance(e, smtplib.SMTPServerDisconnected):
+                    continue
+                # Reconnect for the rest of the batch, or back it all off
+                connection.close()
+                try:
+                    connection.open()
+                except Exception as reconnect_error:
+                    for remaining in emails[index + 1:]:
+                        mark_failed(remaining, reconnect_error, timezone.now())
+                        failed.append(remaining)
+                    break
+    finally:
+        connection.close()
+
+    now = timezone.now()
+    with transaction.atomic():
+        for email in sent:
+            email.status = EmailStatus.SENT
+            email.sent_at = now
+            email.error_message = None
+        QueuedEmail.objects.bulk_update(
+            sent + failed,
+            ['subject', 'body', 'status', 'sent_at', 'retry_count', 'next_attempt_at', 'error_message'],
+        )
+        SentEmail.objects.bulk_create([
+            SentEmail(
+                queued_email=email,
+                to_email=email.to_email,
+                subject=email.subject,
+                template_slug=email.template_slug,
+                external_id=email.external_id,
+            )
+            for email in sent
+        ])
+    return len(sent)
+
+
+def process_queued_emails(batch_size=None, reference=None):
+    """
+    Claim and send one batch of due emails. Returns the number of emails
+    processed (sent or not), 0 when nothing is due.
+    """
+    emails = claim_batch(batch_size or settings.EMAIL_QUEUE_BATCH_SIZE, reference)
+    if emails:
+        send_batch(emails)
+    return len(emails)
+
+
+# ==================== IN-PROCESS WORKER ====================
+
+_wakeup = threading.Event()
+_worker_lock = threading.Lock()
+_worker_thread = None
+
+
+def _worker_loop():
+    while True:
+        # Also wake up periodically for retries that have come due
+        _wakeup.wait(timeout=settings.EMAIL_QUEUE_POLL_INTERVAL)
+        _wakeup.clear()
+        try:
+            while process_queued_emails():
+                pass
+        except Exception:
+            logger.exception('Email delivery worker failed')
+        finally:
+            close_old_connections()
+
+
+def schedule_delivery():
+    """
+    Wake the in-process delivery thread once the current transaction
+    commits. A no-op when EMAIL_QUEUE_IN_PROCESS is off, in which case the
+    ``send_queued_emails`` command drains the queue.
+    """
+    if not settings.EMAIL_QUEUE_IN_PROCESS:
+        return
+
+    def wake():
+        global _worker_thread
+        with _worker_lock:
+            if _worker_thread is None or not _worker_thread.is_alive():
+                _worker_thread = threading.Thread(target=_worker_loop, name='email-delivery', daemon=True)
+                _worker_thread.start()
+        _wakeup.set()
+
+    transaction.on_commit(wake)
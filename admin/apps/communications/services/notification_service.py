@@ -0,0 +1,100 @@
+# admin/apps/communications/services/notification_service.py
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.text import Truncator
+
+from apps.forms.models.client_requirement import ClientRequirement
+
+from ..constants import (
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    SUBMISSION_ACK_NAME_MAX_LENGTH,
+    SUBMISSION_RECEIVED,
+    SUBMISSION_STAFF_ALERT,
+)
+from ..models.queued_email import QueuedEmail
+from .email_service import queue_emails
+
+logger = logging.getLogger(__name__)
+
+
+def submission_reference(requirement_id):
+    return f'client_requirement:{requirement_id}'
+
+
+def should_acknowledge(email):
+    """
+    Whether the client acknowledgement may go to `email`. Anyone can submit
+    the public form with any address, so each address gets at most one per
+    SUBMISSION_ACK_COOLDOWN and the site sends at most
+    SUBMISSION_ACK_HOURLY_LIMIT an hour.
+    """
+    now = timezone.now()
+    acks = QueuedEmail.objects.filter(template_slug=SUBMISSION_RECEIVED)
+    recent = acks.filter(created_at__gte=now - timedelta(seconds=settings.SUBMISSION_ACK_COOLDOWN))
+    if recent.filter(to_email__iexact=email).exists():
+        return False
+    limit = settings.SUBMISSION_ACK_HOURLY_LIMIT
+    return acks.filter(created_at__gte=now - timedelta(hours=1))[:limit].count() < limit
+
+
+def acknowledgement_context(requirement):
+    """
+    The client acknowledgement's context. Only the reference, the name cut to
+    SUBMISSION_ACK_NAME_MAX_LENGTH and known service codes: nothing else a
+    stranger typed into the form is mailed back out.
+    """
+    return {
+        'reference': requirement.pk,
+        'first_name': Truncator(requirement.first_name).chars(SUBMISSION_ACK_NAME_MAX_LENGTH),
+        'services': [
+            ClientRequirement.SERVICE_LABELS[service]
+            for service in requirement.services or []
+            if service in ClientRequirement.SERVICE_LABELS
+        ],
+    }
+
+
+def notify_submission(requirement):
+    """Queue the client's acknowledgement and the staff alerts for a new client requirement"""
+    full_name = f'{requirement.first_name} {requirement.last_name}'.strip()
+    context = {
+        'reference': requirement.pk,
+        'first_name': requirement.first_name,
+        'full_name': full_name,
+        'email': requirement.email,
+        'phone': requirement.phone or '',
+        'company': requirement.company or '',
+        'services': list(requirement.services or []),
+        'other_service': requirement.other_service or '',
+        'project_description': requirement.project_description,
+        'source': requirement.source or '',
+        'admin_url': f'{settings.ADMIN_SITE_URL}/admin/forms/clientrequirement/{requirement.pk}/change/',
+    }
+    reference = submission_reference(requirement.pk)
+
+    emails = []
+    if should_acknowledge(requirement.email):
+        emails.append(QueuedEmail(
+            to_email=requirement.email,  # No display name: it would be submitted text in the To header
+            template_slug=SUBMISSION_RECEIVED,
+            context=acknowledgement_context(requirement),
+            priority=PRIORITY_NORMAL,
+            reference=reference,
+        ))
+    else:
+        logger.info('Not acknowledging submission %s: acknowledgement limit reached', requirement.pk)
+    emails.extend(
+        QueuedEmail(
+            to_email=staff_email,
+            template_slug=SUBMISSION_STAFF_ALERT,
+            context=context,
+            priority=PRIORITY_HIGH,
+            reference=reference,
+        )
+        for staff_email in settings.SUBMISSION_NOTIFY_EMAILS
+    )
+    return queue_emails(emails)
@@ -0,0 +1,35 @@
+# admin/apps/communications/services/template_service.py
+"""
+Email template rendering.
+
+Template sources are compiled once per process and cached by their text,
+so an edited template is simply a new cache entry. The worker loads every
+template a batch needs in one query (``load_templates``).
+"""
+from functools import lru_cache
+
+from django.template import engines
+
+from ..models.email_template import EmailTemplate
+
+
+@lru_cache(maxsize=256)
+def compile_template(source):
+    # Plain-text mail: nothing to escape
+    return engines['django'].from_string('{% autoescape off %}' + source + '{% endautoescape %}')
+
+
+def load_templates(slugs):
+    """{slug: EmailTemplate} for the given slugs"""
+    slugs = {slug for slug in slugs if slug}
+    if not slugs:
+        return {}
+    return {template.slug: template for template in EmailTemplate.objects.filter(slug__in=slugs)}
+
+
+def render_template(template, context):
+    """(subject, body) of `template` rendered with `context`"""
+    subject = compile_template(template.subject).render(context)
+    body = compile_template(template.body).render(context)
+    # Header injection guard: subjects are a single line
+    return ' '.join(subject.split())[:200], body
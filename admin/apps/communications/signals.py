@@ -0,0 +1,14 @@
+# admin/apps/communications/signals.py
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.forms.models.client_requirement import ClientRequirement
+
+from .services.notification_service import notify_submission
+
+
+@receiver(post_save, sender=ClientRequirement)
+def client_requirement_submitted(sender, instance, created=False, raw=False, **kwargs):
+    """Queue notification emails in the submission's transaction; they are sent after it commits"""
+    if created and not raw:
+        notify_submission(instance)
@@ -0,0 +1,90 @@
+# admin/apps/communications/tests.py
+import json
+import smtplib
+from datetime import timedelta
+from unittest import mock
+
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .constants import SUBMISSION_RECEIVED, SUBMISSION_STAFF_ALERT, EmailStatus
+from .models import QueuedEmail, SentEmail
+from .services.email_service import process_queued_emails
+
+
+@override_settings(SUBMISSION_NOTIFY_EMAILS=['staff@dycetix.test'], RATE_LIMIT_ENABLED=False)
+class SubmissionEmailTests(TestCase):
+
+    def submit(self, email='ada@example.com', first_name='Ada'):
+        return self.client.post('/api/forms/submit/client-requirement/', json.dumps({
+            'firstName': first_name,
+            'lastName': 'Lovelace',
+            'email': email,
+            'services': ['software'],
+            'projectDetails': 'Build an analytical engine',
+        }), content_type='application/json')
+
+    def acknowledged(self):
+        return list(QueuedEmail.objects.filter(template_slug=SUBMISSION_RECEIVED).values_list('to_email', flat=True))
+
+    def test_submission_queues_without_sending(self):
+        self.assertEqual(self.submit().status_code, 200)
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(
+            sorted(QueuedEmail.objects.values_list('template_slug', 'to_email')),
+            [(SUBMISSION_RECEIVED, 'ada@example.com'), (SUBMISSION_STAFF_ALERT, 'staff@dycetix.test')],
+        )
+
+    def test_batch_is_rendered_and_sent(self):
+        self.submit()
+        with mock.patch('django.core.mail.backends.locmem.EmailBackend.open') as opened:
+            self.assertEqual(process_queued_emails(), 2)
+        self.assertEqual(opened.call_count, 1)  # One connection for the batch
+        self.assertEqual(len(mail.outbox), 2)
+        staff_alert = next(message for message in mail.outbox if message.to == ['staff@dycetix.test'])
+        self.assertIn('Ada Lovelace', staff_alert.subject)
+        self.assertIn('Build an analytical engine', staff_alert.body)
+        self.assertEqual(QueuedEmail.objects.filter(status=EmailStatus.SENT).count(), 2)
+        self.assertEqual(SentEmail.objects.exclude(external_id='').count(), 2)
+        self.assertEqual(process_queued_emails(), 0)
+
+    def test_acknowledgement_repeats_no_free_text(self):
+        self.submit(first_name='Cheap pills at spam.example ' * 10)
+        process_queued_emails()
+        ack = next(message for message in mail.outbox if message.to == ['ada@example.com'])
+        self.assertNotIn('spam.example', ack.subject)
+        self.assertLessEqual(ack.body.count('Cheap pills'), 2)  # Name cut to 40 characters
+        self.assertIn('Software Development', ack.body)
+        self.assertNotIn('analytical engine', ack.body)
+
+    def test_one_acknowledgement_per_address(self):
+        self.submit()
+        self.submit(email='ADA@example.com')
+        self.assertEqual(self.acknowledged(), ['ada@example.com'])
+        self.assertEqual(QueuedEmail.objects.filter(template_slug=SUBMISSION_STAFF_ALERT).count(), 2)
+
+        QueuedEmail.objects.update(created_at=timezone.now() - timedelta(days=2))
+        self.submit()
+        self.assertEqual(len(self.acknowledged()), 2)
+
+    @override_settings(SUBMISSION_ACK_HOURLY_LIMIT=2)
+    def test_hourly_acknowledgement_cap(self):
+        for i in range(3):
+            self.assertEqual(self.submit(email=f'client{i}@example.com').status_code, 200)
+        self.assertEqual(sorted(self.acknowledged()), ['client0@example.com', 'client1@example.com'])
+
+    def test_failures_back_off_then_fail(self):
+        QueuedEmail.objects.create(to_email='x@example.com', subject='Hi', body='Body')
+        error = smtplib.SMTPServerDisconnected('Connection lost')
+        with mock.patch('django.core.mail.backends.locmem.EmailBackend.send_messages', side_effect=error), \
+                override_settings(EMAIL_QUEUE_MAX_RETRIES=1):
+            self.assertEqual(process_queued_emails(), 1)
+            email = QueuedEmail.objects.get()
+            self.assertEqual((email.status, email.retry_count), (EmailStatus.PENDING, 1))
+            self.assertGreater(email.next_attempt_at, timezone.now() + timedelta(seconds=30))
+            self.assertEqual(process_queued_emails(), 0)  # Not due yet
+
+            QueuedEmail.objects.update(next_attempt_at=timezone.now())
+            self.assertEqual(process_queued_emails(), 1)
+            self.assertEqual(QueuedEmail.objects.get().status, EmailStatus.FAILED)
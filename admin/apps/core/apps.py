@@ -1,2 +1,8 @@
-# apps.py
-# Empty file - content will be added later
+# admin/apps/core/apps.py
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.core'
+    verbose_name = 'Core'
@@ -0,0 +1,34 @@
+# Generated by Django 5.2 on 2026-10-18 16:14
+
+from django.db import migrations, models
+
+
+# PostgreSQL only: counters are short-lived and rewritten on every checked
+# request, so skip the WAL. A crash truncates the table, which just resets
+# the limits.
+def set_unlogged(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('ALTER TABLE rate_limit_counters SET UNLOGGED;')
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RateLimitCounter',
+            fields=[
+                ('key', models.CharField(max_length=200, primary_key=True, serialize=False)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('expires_at', models.BigIntegerField(db_index=True)),
+            ],
+            options={
+                'db_table': 'rate_limit_counters',
+            },
+        ),
+        migrations.RunPython(set_unlogged, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# admin/apps/core/models.py
+from django.db import models
+
+
+class RateLimitCounter(models.Model):
+    """
+    One fixed window of one rate-limit counter (apps/core/ratelimit.py).
+
+    Rows are upserted on every checked request and only live for two
+    windows, so the table is UNLOGGED on PostgreSQL: no WAL per hit, and a
+    crash simply resets the limits.
+    """
+    key = models.CharField(max_length=200, primary_key=True)  # policy:scope:window:identifier digest:window index
+    count = models.PositiveIntegerField(default=0)
+    expires_at = models.BigIntegerField(db_index=True)  # Unix time after which the row can be deleted
+
+    class Meta:
+        db_table = 'rate_limit_counters'
+
+    def __str__(self):
+        return f'{self.key} = {self.count}'
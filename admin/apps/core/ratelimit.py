@@ -0,0 +1,170 @@
+# admin/apps/core/ratelimit.py
+"""
+Sliding-window rate limiting for public endpoints.
+
+Policies live in ``settings.RATE_LIMITS``: for each endpoint, a rate such
+as ``'10/m'`` per scope (``ip``, ``email``). A check counts the hit in the
+current fixed window and adds the previous window's count, weighted by
+how much of it the sliding window still covers. That costs one increment
+and one key lookup per scope and never scans.
+
+Counters must be shared by every gunicorn worker. RATE_LIMIT_STORE selects
+where they are kept:
+    database  the UNLOGGED rate_limit_counters table, updated with
+              INSERT ... ON CONFLICT (default, no extra service needed)
+    cache     the RATE_LIMIT_CACHE cache alias, e.g. Redis
+"""
+import functools
+import hashlib
+import logging
+import math
+import random
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.http import JsonResponse
+
+from .models import RateLimitCounter
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+PURGE_PROBABILITY = 0.001  # Share of database hits that also delete expired counters
+
+
+def parse_rate(rate):
+    """'10/m' -> (10, 60). Periods are s, m, h or d; a full word like 'min' works too"""
+    count, period = rate.split('/')
+    return int(count), PERIODS[period.strip()[0]]
+
+
+def client_ip(request):
+    """
+    The client's address. Behind RATE_LIMIT_PROXY_COUNT trusted proxies it is
+    the X-Forwarded-For entry the outermost proxy appended; anything to its
+    left was sent by the client and can be forged.
+    """
+    proxies = settings.RATE_LIMIT_PROXY_COUNT
+    if proxies:
+        forwarded = [part.strip() for part in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if part.strip()]
+        if len(forwarded) >= proxies:
+            return forwarded[-proxies]
+    return request.META.get('REMOTE_ADDR', '')
+
+
+# ==================== STORES ====================
+
+
+class DatabaseCounterStore:
+    """Counters in the rate_limit_counters table: one upsert and one primary-key read per hit"""
+
+    def hit(self, key, previous_key, ttl):
+        now = int(time.time())
+        table = connection.ops.quote_name(RateLimitCounter._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {table} ("key", "count", "expires_at") VALUES (%s, 1, %s) '
+                f'ON CONFLICT ("key") DO UPDATE SET "count" = {table}."count" + 1 '
+                f'RETURNING "count"',
+                [key, now + ttl],
+            )
+            current = cursor.fetchone()[0]
+            cursor.execute(f'SELECT "count" FROM {table} WHERE "key" = %s', [previous_key])
+            row = cursor.fetchone()
+            if random.random() < PURGE_PROBABILITY:
+                cursor.execute(f'DELETE FROM {table} WHERE "expires_at" < %s', [now])
+        return (row[0] if row else 0), current
+
+
+class CacheCounterStore:
+    """Counters in a Django cache; incr is atomic on Redis, Memcached and (per process) LocMem"""
+
+    def __init__(self, alias):
+        self.cache = caches[alias]
+
+    def hit(self, key, previous_key, ttl):
+        self.cache.add(key, 0, ttl)
+        try:
+            current = self.cache.incr(key)
+        except ValueError:  # Expired between add() and incr()
+            self.cache.set(key, 1, ttl)
+            current = 1
+        return self.cache.get(previous_key, 0), current
+
+
+def get_store():
+    if settings.RATE_LIMIT_STORE == 'cache':
+        return CacheCounterStore(settings.RATE_LIMIT_CACHE)
+    return DatabaseCounterStore()
+
+
+# ==================== CHECKS ====================
+
+
+def retry_after(limit, window, elapsed, previous, current):
+    """Seconds until one more hit fits under `limit` if nothing else arrives"""
+    room = limit - 1 - current
+    if room >= 0 and previous:
+        # Still inside this window: wait for the previous window's weight to fade
+        wait = window * (1 - room / previous) - elapsed
+        if wait < window - elapsed:
+            return max(wait, 0)
+    # After this window ends its count becomes the fading previous count
+    return window - elapsed + max(0.0, window * (1 - (limit - 1) / current))
+
+
+def check_rate_limit(policy, **identifiers):
+    """
+    Count one hit against `policy` for each scope given, e.g.
+    ``check_rate_limit('client_requirement_submit', ip='203.0.113.7')``.
+    Returns 0 when every scope is within its limit, otherwise the seconds
+    to wait. Scopes the policy doesn't configure and empty identifiers are
+    skipped. If the store fails the request is let through.
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return 0
+
+    rates = settings.RATE_LIMITS.get(policy, {})
+    wait = 0
+    for scope, identifier in identifiers.items():
+        if scope not in rates or not identifier:
+            continue
+        limit, window = parse_rate(rates[scope])
+        now = time.time()
+        index, elapsed = divmod(now, window)
+        digest = hashlib.blake2b(str(identifier).encode(), digest_size=12).hexdigest()  # No raw IPs/emails stored
+        prefix = f'rl:{policy}:{scope}:{window}:{digest}'
+        try:
+            previous, current = get_store().hit(f'{prefix}:{int(index)}', f'{prefix}:{int(index) - 1}', 2 * window)
+        except Exception:
+            logger.exception('Rate limit store failed; allowing %s/%s', policy, scope)
+            continue
+
+        estimate = previous * (1 - elapsed / window) + current
+        if estimate > limit:
+            wait = max(wait, 1, math.ceil(retry_after(limit, window, elapsed, previous, current)))
+    return wait
+
+
+def rate_limited_response(wait):
+    response = JsonResponse({
+        'success': False,
+        'error': f'Too many requests. Please try again in {wait} seconds.'
+    }, status=429)
+    response['Retry-After'] = str(wait)
+    return response
+
+
+def rate_limit(policy):
+    """View decorator: reject with 429 when the client's IP exceeds `policy`"""
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapped(request, *args, **kwargs):
+            wait = check_rate_limit(policy, ip=client_ip(request))
+            if wait:
+                return rate_limited_response(wait)
+            return view(request, *args, **kwargs)
+        return wrapped
+    return decorator
@@ -0,0 +1 @@
+# admin/apps/core/services/__init__.py
@@ -0,0 +1,21 @@
+# admin/apps/core/views.py
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_http_methods
+
+from dycetix_common.metrics import render_metrics
+
+
+@never_cache
+@require_http_methods(["GET"])
+def metrics(request):
+    """Prometheus scrape endpoint; requires `Authorization: Bearer <METRICS_TOKEN>` when a token is set"""
+    if settings.METRICS_TOKEN:
+        supplied = request.META.get('HTTP_AUTHORIZATION', '').removeprefix('Bearer ')
+        if not constant_time_compare(supplied, settings.METRICS_TOKEN):
+            return HttpResponseForbidden()
+
+    body, content_type = render_metrics()
+    return HttpResponse(body, content_type=content_type)
@@ -0,0 +1 @@
+# admin/apps/forms/__init__.py
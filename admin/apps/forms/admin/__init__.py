@@ -0,0 +1,6 @@
+# admin/apps/forms/admin/__init__.py
+# Imported by admin autodiscovery; registers the forms ModelAdmins
+from .archived_requirement_admin import ArchivedClientRequirementAdmin
+from .client_requirement_admin import ClientRequirementAdmin
+
+__all__ = ['ArchivedClientRequirementAdmin', 'ClientRequirementAdmin']
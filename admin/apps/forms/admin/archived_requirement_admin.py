@@ -0,0 +1,60 @@
+# admin/apps/forms/admin/archived_requirement_admin.py
+from django.contrib import admin
+from django.utils.html import format_html
+from apps.accounts.admin_site import admin_site
+from ..models.archived_client_requirement import ArchivedClientRequirement
+from ..models.archived_form_attachment import ArchivedFormAttachment
+from ..services.archive_service import restore_requirements
+from ..services.requirement_service import attachments_total
+
+
+class ArchivedFormAttachmentInline(admin.TabularInline):
+    model = ArchivedFormAttachment
+    extra = 0
+    can_delete = False
+    readonly_fields = ['original_filename', 'file_size_mb', 'status', 'download_link', 'created_at']
+    fields = ['original_filename', 'file_size_mb', 'status', 'download_link', 'created_at']
+    
+    def has_add_permission(self, request, obj=None):
+        return False
+    
+    def download_link(self, obj):
+        if obj.file:
+            return format_html(
+                '<a href="{}" download>Download</a>',
+                obj.download_url
+            )
+        return "-"
+    download_link.short_description = "File"
+
+
+@admin.register(ArchivedClientRequirement, site=admin_site)
+class ArchivedClientRequirementAdmin(admin.ModelAdmin):
+    """Read-only: archived requirements are changed by restoring them first"""
+    list_display = ['id', 'full_name', 'email', 'company', 'priority', 'created_at', 'archived_at', 'attachments_count']
+    list_filter = ['priority', 'created_at', 'archived_at']
+    list_select_related = ['assigned_to']
+    search_fields = ['first_name', 'last_name', 'email', 'company', 'project_description']
+    inlines = [ArchivedFormAttachmentInline]
+    actions = ['restore']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            attachments_total=attachments_total(ArchivedFormAttachment)
+        )
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+    
+    def attachments_count(self, obj):
+        return obj.attachments_total
+    attachments_count.short_description = 'Files'
+    attachments_count.admin_order_field = 'attachments_total'
+    
+    def restore(self, request, queryset):
+        restored = restore_requirements(queryset)
+        self.message_user(request, f"{restored} requirement(s) restored to the live list.")
+    restore.short_description = "Restore selected to the live list"
@@ -1,27 +1,31 @@
 # admin/apps/forms/admin/client_requirement_admin.py
 from django.contrib import admin
 from django.utils.html import format_html
+from apps.accounts.admin_site import admin_site
 from ..models.client_requirement import ClientRequirement
 from ..models.form_attachment import FormAttachment
+from ..constants import PriorityType, RequirementStatus
+from ..services.bulk_service import bulk_update_requirements
+from ..services.requirement_service import attachments_total
 
 
 class FormAttachmentInline(admin.TabularInline):
     model = FormAttachment
     extra = 0
-    readonly_fields = ['original_filename', 'file_size_mb', 'created_at']
-    fields = ['original_filename', 'file_size_mb', 'download_link', 'created_at']
+    readonly_fields = ['original_filename', 'file_size_mb', 'status', 'error_message', 'download_link', 'created_at']
+    fields = ['original_filename', 'file_size_mb', 'status', 'error_message', 'download_link', 'created_at']
     
     def download_link(self, obj):
         if obj.file:
             return format_html(
                 '<a href="{}" download>Download</a>',
-                obj.file.url
+                obj.download_url
             )
         return "-"
     download_link.short_description = "File"
 
 
-@admin.register(ClientRequirement)
+@admin.register(ClientRequirement, site=admin_site)
 class ClientRequirementAdmin(admin.ModelAdmin):
     list_display = [
         'id', 'full_name', 'email', 'get_services_display', 
@@ -29,6 +33,7 @@ class ClientRequirementAdmin(admin.ModelAdmin):
     ]
     
     list_filter = ['status', 'priority', 'created_at']
+    list_select_related = ['assigned_to']
     search_fields = ['first_name', 'last_name', 'email', 'company', 'project_description']
     readonly_fields = ['created_at', 'updated_at', 'ip_address', 'user_agent', 'attachments_count']
     inlines = [FormAttachmentInline]
@@ -52,6 +57,10 @@ class ClientRequirementAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        # One annotated query instead of a COUNT per changelist row
+        return super().get_queryset(request).annotate(attachments_total=attachments_total())
+    
     def get_services_display(self, obj):
         return obj.selected_services
     get_services_display.short_description = 'Services'
@@ -61,17 +70,51 @@ class ClientRequirementAdmin(admin.ModelAdmin):
     created_at_short.short_description = 'Submitted'
     
     def attachments_count(self, obj):
+        if hasattr(obj, 'attachments_total'):
+            return obj.attachments_total
         return obj.attachments.count()
     attachments_count.short_description = 'Files'
+    attachments_count.admin_order_field = 'attachments_total'
+    
+    actions = [
+        'mark_as_contacted', 'mark_as_quoted', 'archive',
+        'set_priority_high', 'set_priority_medium', 'set_priority_low',
+        'assign_to_me', 'unassign',
+    ]
     
-    actions = ['mark_as_contacted', 'mark_as_quoted']
+    def apply_bulk_change(self, request, queryset, changes, description):
+        # Works on "select all" across a filtered changelist too: rows are never loaded
+        changed = bulk_update_requirements(queryset, changes)
+        self.message_user(request, f"{changed} requirement(s) {description}.")
     
     def mark_as_contacted(self, request, queryset):
-        queryset.update(status='contacted')
-        self.message_user(request, f"{queryset.count()} requirements marked as contacted.")
+        self.apply_bulk_change(request, queryset, {'status': RequirementStatus.CONTACTED}, 'marked as contacted')
     mark_as_contacted.short_description = "Mark selected as contacted"
     
     def mark_as_quoted(self, request, queryset):
-        queryset.update(status='quoted')
-        self.message_user(request, f"{queryset.count()} requirements marked as quoted.")
-    mark_as_quoted.short_description = "Mark selected as quoted"
\ No newline at end of file
+        self.apply_bulk_change(request, queryset, {'status': RequirementStatus.QUOTED}, 'marked as quoted')
+    mark_as_quoted.short_description = "Mark selected as quoted"
+    
+    def archive(self, request, queryset):
+        self.apply_bulk_change(request, queryset, {'status': RequirementStatus.ARCHIVED}, 'archived')
+    archive.short_description = "Archive selected"
+    
+    def set_priority_high(self, request, queryset):
+        self.apply_bulk_change(request, queryset, {'priority': PriorityType.HIGH}, 'set to high priority')
+    set_priority_high.short_description = "Set priority: high"
+    
+    def set_priority_medium(self, request, queryset):
+        self.apply_bulk_change(request, queryset, {'priority': PriorityType.MEDIUM}, 'set to medium priority')
+    set_priority_medium.short_description = "Set priority: medium"
+    
+    def set_priority_low(self, request, queryset):
+        self.apply_bulk_change(request, queryset, {'priority': PriorityType.LOW}, 'set to low priority')
+    set_priority_low.short_description = "Set priority: low"
+    
+    def assign_to_me(self, request, queryset):
+        self.apply_bulk_change(request, queryset, {'assigned_to': request.user}, 'assigned to you')
+    assign_to_me.short_description = "Assign selected to me"
+    
+    def unassign(self, request, queryset):
+        self.apply_bulk_change(request, queryset, {'assigned_to': None}, 'unassigned')
+    unassign.short_description = "Unassign selected"
@@ -0,0 +1,50 @@
+# admin/apps/forms/api/pagination.py
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from ..pagination import InvalidCursor, paginate_keyset, parse_page_size
+
+
+class KeysetCursorPagination(BasePagination):
+    """DRF wrapper around the (created_at, id) keyset paginator (a queryset, or a list of them)"""
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'limit'
+    
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = parse_page_size(request.query_params.get(self.page_size_query_param))
+        try:
+            rows, self.next_cursor = paginate_keyset(
+                queryset,
+                cursor=request.query_params.get(self.cursor_query_param),
+                page_size=page_size
+            )
+        except InvalidCursor as e:
+            raise ValidationError({self.cursor_query_param: str(e)})
+        return rows
+    
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+    
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'next_cursor': self.next_cursor,
+            'results': data
+        })
+    
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'next_cursor': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
@@ -1,5 +1,9 @@
 # admin/apps/forms/api/serializers.py
+from django.contrib.auth import get_user_model
 from rest_framework import serializers
+
+from apps.core.ratelimit import client_ip
+
 from ..models.client_requirement import ClientRequirement
 from ..constants import ServiceType
 
@@ -22,7 +26,7 @@ class ClientRequirementSerializer(serializers.ModelSerializer):
             'email',
             'phone',
             'company',
-            'service_needed',
+            'services',
             'service_display',
             'other_service',
             'project_description',
@@ -40,15 +44,15 @@ class ClientRequirementSerializer(serializers.ModelSerializer):
         return f"{obj.first_name} {obj.last_name}"
     
     def get_service_display(self, obj):
-        return obj.get_final_service()
+        return obj.selected_services
     
     def get_created_at_formatted(self, obj):
         return obj.created_at.strftime("%b %d, %Y %I:%M %p")
     
     def validate(self, data):
         """Custom validation for form data"""
-        # If service is "other", require other_service field
-        if data.get('service_needed') == ServiceType.OTHER and not data.get('other_service'):
+        # If "other" is among the services, require other_service field
+        if ServiceType.OTHER in (data.get('services') or []) and not data.get('other_service'):
             raise serializers.ValidationError({
                 'other_service': 'Please specify the service when selecting "Other"'
             })
@@ -58,7 +62,7 @@ class ClientRequirementSerializer(serializers.ModelSerializer):
         """Create a new client requirement with IP address"""
         request = self.context.get('request')
         if request:
-            validated_data['ip_address'] = request.META.get('REMOTE_ADDR')
+            validated_data['ip_address'] = client_ip(request) or None
             validated_data['user_agent'] = request.META.get('HTTP_USER_AGENT', '')
         
         return super().create(validated_data)
@@ -68,4 +72,21 @@ class ClientRequirementStatusSerializer(serializers.ModelSerializer):
     """Serializer for updating status only"""
     class Meta:
         model = ClientRequirement
-        fields = ['status', 'assigned_to', 'internal_notes']
\ No newline at end of file
+        fields = ['status', 'assigned_to', 'internal_notes']
+
+
+class ClientRequirementBulkUpdateSerializer(serializers.Serializer):
+    """Body of the bulk_update action: the changes to apply, optionally limited to `ids`"""
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, allow_empty=False, max_length=10000
+    )
+    status = serializers.ChoiceField(choices=ClientRequirement.STATUS_CHOICES, required=False)
+    priority = serializers.ChoiceField(choices=ClientRequirement.PRIORITY_CHOICES, required=False)
+    assigned_to = serializers.PrimaryKeyRelatedField(
+        queryset=get_user_model().objects.filter(is_active=True), allow_null=True, required=False
+    )
+    
+    def validate(self, data):
+        if not {'status', 'priority', 'assigned_to'} & set(data):
+            raise serializers.ValidationError('Provide at least one of status, priority or assigned_to')
+        return data
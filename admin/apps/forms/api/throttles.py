@@ -0,0 +1,41 @@
+# admin/apps/forms/api/throttles.py
+from rest_framework.throttling import BaseThrottle
+
+from apps.core.ratelimit import check_rate_limit, client_ip
+
+from ..constants import SUBMISSION_RATE_LIMIT
+
+
+class PolicyThrottle(BaseThrottle):
+    """
+    DRF throttle backed by a settings.RATE_LIMITS policy (apps/core/ratelimit.py),
+    so the API and the plain submission view share the same counters.
+    """
+    policy = None
+    scope = None
+
+    def get_identifier(self, request):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        self.wait_seconds = check_rate_limit(self.policy, **{self.scope: self.get_identifier(request)})
+        return not self.wait_seconds
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class SubmissionIPThrottle(PolicyThrottle):
+    policy = SUBMISSION_RATE_LIMIT
+    scope = 'ip'
+
+    def get_identifier(self, request):
+        return client_ip(request)
+
+
+class SubmissionEmailThrottle(PolicyThrottle):
+    policy = SUBMISSION_RATE_LIMIT
+    scope = 'email'
+
+    def get_identifier(self, request):
+        return (request.data.get('email') or '').strip().lower()
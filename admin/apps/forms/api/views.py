@@ -1,13 +1,24 @@
 # admin/apps/forms/api/views.py
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
-from django.db.models import Count, Q
+from django.db.models import Q
+from django.http import Http404
 from django.utils import timezone
 from datetime import timedelta
 
 from ..models.client_requirement import ClientRequirement
-from .serializers import ClientRequirementSerializer, ClientRequirementStatusSerializer
+from ..services.bulk_service import bulk_update_requirements
+from ..services.requirement_service import LIST_FILTER_PARAMS, archive_mode, filter_requirements, requirement_models
+from ..services.stats_service import get_requirement_stats
+from .pagination import KeysetCursorPagination
+from .serializers import (
+    ClientRequirementBulkUpdateSerializer,
+    ClientRequirementSerializer,
+    ClientRequirementStatusSerializer,
+)
+from .throttles import SubmissionEmailThrottle, SubmissionIPThrottle
 
 
 class ClientRequirementViewSet(viewsets.ModelViewSet):
@@ -18,6 +29,7 @@ class ClientRequirementViewSet(viewsets.ModelViewSet):
     """
     queryset = ClientRequirement.objects.all()
     serializer_class = ClientRequirementSerializer
+    pagination_class = KeysetCursorPagination
     
     def get_permissions(self):
         """
@@ -31,76 +43,69 @@ class ClientRequirementViewSet(viewsets.ModelViewSet):
             permission_classes = [permissions.IsAuthenticated]
         return [permission() for permission in permission_classes]
     
+    def get_throttles(self):
+        """Public submissions are rate limited per IP and per email (429 with Retry-After)"""
+        if self.action == 'create':
+            return [SubmissionIPThrottle(), SubmissionEmailThrottle()]
+        return super().get_throttles()
+    
+    def get_querysets(self):
+        """
+        Filter querysets based on user role and query params: the live
+        requirements, and for list/retrieve (read-only there) the archive
+        too with ?archive=1 or instead with ?archive=only
+        """
+        mode = archive_mode(self.request.query_params) if self.action in ('list', 'retrieve') else None
+        querysets = []
+        for model in requirement_models(mode):
+            # Same ?status=, ?assigned_to=, ?service=, ?search= filters as the list and export endpoints
+            queryset = filter_requirements(model.objects.all(), self.request.query_params)
+            
+            # For non-super users, show only assigned or unassigned
+            if not self.request.user.is_superuser:
+                queryset = queryset.filter(
+                    Q(assigned_to=self.request.user) | 
+                    Q(assigned_to__isnull=True)
+                )
+            querysets.append(queryset)
+        return querysets
+    
     def get_queryset(self):
-        """Filter queryset based on user role and query params"""
-        queryset = super().get_queryset()
-        
-        # Filter by status if provided
-        status_filter = self.request.query_params.get('status')
-        if status_filter:
-            queryset = queryset.filter(status=status_filter)
-        
-        # Filter by assigned_to if provided
-        assigned_to = self.request.query_params.get('assigned_to')
-        if assigned_to:
-            queryset = queryset.filter(assigned_to_id=assigned_to)
-        
-        # Filter by service if provided
-        service = self.request.query_params.get('service')
-        if service:
-            queryset = queryset.filter(service_needed=service)
-        
-        # Filter by search term if provided
-        search = self.request.query_params.get('search')
-        if search:
-            queryset = queryset.filter(
-                Q(first_name__icontains=search) |
-                Q(last_name__icontains=search) |
-                Q(email__icontains=search) |
-                Q(company__icontains=search) |
-                Q(project_description__icontains=search)
-            )
-        
-        # For non-super users, show only assigned or unassigned
-        if not self.request.user.is_superuser:
-            queryset = queryset.filter(
-                Q(assigned_to=self.request.user) | 
-                Q(assigned_to__isnull=True)
-            )
-        
-        return queryset
+        return self.get_querysets()[0]
+    
+    def list(self, request, *args, **kwargs):
+        """With ?archive=1 live and archived requirements are paged together"""
+        querysets = self.get_querysets()
+        if len(querysets) == 1:
+            return super().list(request, *args, **kwargs)
+        page = self.paginate_queryset(querysets)
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
+    
+    def get_object(self):
+        """With ?archive=1 a requirement may be live or archived: each table is tried in turn"""
+        lookup = {self.lookup_field: self.kwargs[self.lookup_url_kwarg or self.lookup_field]}
+        *others, last = self.get_querysets()
+        for queryset in others:
+            try:
+                requirement = get_object_or_404(queryset, **lookup)
+                break
+            except Http404:
+                continue
+        else:
+            requirement = get_object_or_404(last, **lookup)
+        self.check_object_permissions(self.request, requirement)
+        return requirement
     
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """Get statistics for dashboard"""
-        # Total counts by status
-        status_counts = ClientRequirement.objects.values('status').annotate(
-            count=Count('id')
-        )
-        
-        # Today's submissions
-        today = timezone.now().date()
-        today_count = ClientRequirement.objects.filter(
-            created_at__date=today
-        ).count()
-        
-        # Unassigned requirements
-        unassigned_count = ClientRequirement.objects.filter(
-            assigned_to__isnull=True,
-            status='new'
-        ).count()
-        
-        # Service breakdown
-        service_counts = ClientRequirement.objects.values('service_needed').annotate(
-            count=Count('id')
-        )
+        stats = get_requirement_stats()
         
         return Response({
-            'status_counts': dict(status_counts),
-            'today_count': today_count,
-            'unassigned_count': unassigned_count,
-            'service_counts': dict(service_counts),
-            'total': ClientRequirement.objects.count()
+            'status_counts': stats['status_counts'],
+            'today_count': stats['today'],
+            'unassigned_count': stats['unassigned'],
+            'total': stats['total']
         })
     
     @action(detail=True, methods=['post'])
@@ -119,6 +124,31 @@ class ClientRequirementViewSet(viewsets.ModelViewSet):
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
+    @action(detail=False, methods=['post'])
+    def bulk_update(self, request):
+        """
+        Set status, priority and/or assigned_to on many requirements at once.
+        Targets the rows the list filters in the query string match
+        (?status=new&search=acme), narrowed to the body's `ids` if given.
+        One of the two is required so an empty request can't touch every row.
+        """
+        serializer = ClientRequirementBulkUpdateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        changes = dict(serializer.validated_data)
+        ids = changes.pop('ids', None)
+        queryset = self.filter_queryset(self.get_queryset())
+        if ids:
+            queryset = queryset.filter(pk__in=ids)
+        elif not any(request.query_params.get(param) for param in LIST_FILTER_PARAMS):
+            return Response(
+                {'detail': f'Pass ids or at least one filter ({", ".join(LIST_FILTER_PARAMS)})'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response({'updated': bulk_update_requirements(queryset, changes)})
+    
     @action(detail=False, methods=['get'])
     def recent(self, request):
         """Get recent submissions (last 7 days)"""
@@ -7,9 +7,6 @@ class FormsConfig(AppConfig):
     name = 'apps.forms'
     verbose_name = 'Forms Management'
     
-    # def ready(self):
-    #     # Import signals when app is ready
-    #     try:
-    #         import admin.apps.forms.signals  # noqa: F401
-    #     except ImportError:
-    #         pass
\ No newline at end of file
+    def ready(self):
+        # Import signals when app is ready
+        from . import signals  # noqa: F401
\ No newline at end of file
@@ -2,6 +2,13 @@
 from django.db import models
 
 
+# settings.RATE_LIMITS policy for public client requirement submissions
+SUBMISSION_RATE_LIMIT = 'client_requirement_submit'
+
+# settings.RATE_LIMITS policy for direct attachment upload slots
+ATTACHMENT_UPLOAD_RATE_LIMIT = 'attachment_upload'
+
+
 class ServiceType(models.TextChoices):
     SOFTWARE = 'software', 'Software Development'
     DESIGN = 'design', 'Design'
@@ -19,6 +26,12 @@ class RequirementStatus(models.TextChoices):
     ARCHIVED = 'archived', 'Archived'
 
 
+class AttachmentStatus(models.TextChoices):
+    PENDING = 'pending', 'Pending'
+    STORED = 'stored', 'Stored'
+    FAILED = 'failed', 'Failed'
+
+
 class PriorityType(models.TextChoices):
     LOW = 'low', 'Low'
     MEDIUM = 'medium', 'Medium'
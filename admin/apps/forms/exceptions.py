@@ -0,0 +1,9 @@
+# admin/apps/forms/exceptions.py
+
+
+class AttachmentIngestError(Exception):
+    """Raised when a staged attachment fails verification and cannot be stored"""
+
+
+class AttachmentUploadError(Exception):
+    """Raised when a direct upload slot can't be issued or claimed"""
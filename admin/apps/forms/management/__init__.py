@@ -0,0 +1 @@
+# admin/apps/forms/management/__init__.py
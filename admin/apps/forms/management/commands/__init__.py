@@ -0,0 +1 @@
+# admin/apps/forms/management/commands/__init__.py
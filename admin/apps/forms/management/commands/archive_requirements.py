@@ -0,0 +1,51 @@
+# admin/apps/forms/management/commands/archive_requirements.py
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...models.archived_client_requirement import ArchivedClientRequirement
+from ...services.archive_service import (
+    ARCHIVE_CHUNK_SIZE,
+    archivable_requirements,
+    archive_requirements,
+    restore_requirements,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Move client requirements archived more than REQUIREMENT_ARCHIVE_AFTER_DAYS ago, with their '
+        'attachments, to the archive tables. Run it daily from a scheduler (the dycetix-archiver cron job '
+        'on Render); --interval keeps it running for local development.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, help='Override REQUIREMENT_ARCHIVE_AFTER_DAYS')
+        parser.add_argument('--batch-size', type=int, default=ARCHIVE_CHUNK_SIZE, help='Requirements moved per transaction')
+        parser.add_argument('--dry-run', action='store_true', help='Only count the requirements that would be moved')
+        parser.add_argument('--restore', type=int, nargs='+', metavar='ID', help='Move these requirements back instead')
+        parser.add_argument('--interval', type=float, help='Keep running, archiving every INTERVAL seconds (local development)')
+
+    def handle(self, *args, **options):
+        if options['restore']:
+            restored = restore_requirements(
+                ArchivedClientRequirement.objects.filter(pk__in=options['restore']),
+                chunk_size=options['batch_size'],
+            )
+            self.stdout.write(self.style.SUCCESS(f'Restored {restored} requirement(s)'))
+            return
+
+        if options['dry_run']:
+            count = archivable_requirements(options['days']).count()
+            self.stdout.write(f'{count} requirement(s) would be archived')
+            return
+
+        while True:
+            started = time.perf_counter()
+            moved = archive_requirements(options['days'], chunk_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(
+                f'Archived {moved} requirement(s) in {time.perf_counter() - started:.1f}s'
+            ))
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,197 @@
+# admin/apps/forms/management/commands/benchmark_requirement_queries.py
+import random
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Q
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from ...models.client_requirement import ClientRequirement
+from ...models.form_attachment import FormAttachment
+from ...pagination import encode_cursor, paginate_keyset
+from ...services.requirement_service import requirement_list_queryset
+from ...services.stats_service import compute_requirement_stats
+
+BENCHMARK_SOURCE = 'benchmark'
+BENCHMARK_EMAIL_DOMAIN = 'benchmark.dycetix.local'
+
+# Queries that must seek into an index on this column rather than filter
+# rows as they scan: how each database's plan shows an index range
+INDEX_RANGE_QUERIES = {'list: deep page': 'created_at'}
+INDEX_RANGE_MARKERS = {'postgresql': 'Index Cond', 'sqlite': 'SEARCH'}
+
+
+class Rollback(Exception):
+    pass
+
+
+@contextmanager
+def explicit_created_at():
+    """Let bulk_create keep the spread-out created_at values we generate"""
+    field = ClientRequirement._meta.get_field('created_at')
+    field.auto_now_add = False
+    try:
+        yield
+    finally:
+        field.auto_now_add = True
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed N client requirements and report EXPLAIN plans and timings for the '
+        'list/viewset/stats queries, with and without the client_requirements '
+        'indexes. --compare drops the indexes inside a rolled-back transaction, '
+        'which locks the table: do not run it against production.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000, help='Rows to seed (0 to use existing data)')
+        parser.add_argument('--runs', type=int, default=20, help='Timed runs per query')
+        parser.add_argument('--compare', action='store_true', help='Also time each query without the model indexes')
+        parser.add_argument('--analyze', action='store_true', help='Use EXPLAIN ANALYZE (PostgreSQL)')
+        parser.add_argument('--keep', action='store_true', help='Keep the seeded rows afterwards')
+
+    def handle(self, *args, **options):
+        if options['rows']:
+            self.seed(options['rows'])
+
+        try:
+            self.stdout.write(self.style.MIGRATE_HEADING('With indexes'))
+            self.run_all(options, indexed=True)
+
+            if options['compare']:
+                self.stdout.write(self.style.MIGRATE_HEADING('Without indexes'))
+                try:
+                    # PostgreSQL and SQLite both roll DROP INDEX back with the transaction
+                    with transaction.atomic(), connection.cursor() as cursor:
+                        for index in ClientRequirement._meta.indexes:
+                            cursor.execute(f'DROP INDEX {connection.ops.quote_name(index.name)}')
+                        self.run_all(options, indexed=False)
+                        raise Rollback
+                except Rollback:
+                    pass
+        finally:
+            if options['rows'] and not options['keep']:
+                self.cleanup()
+
+    # ==================== QUERIES ====================
+
+    def queries(self):
+        """The queries behind each endpoint, keyed by a short label"""
+        staff = get_user_model().objects.filter(email__endswith=BENCHMARK_EMAIL_DOMAIN).first()
+        middle = ClientRequirement.objects.order_by('-created_at', '-id')[
+            ClientRequirement.objects.count() // 2:
+        ].first()
+        deep_cursor = encode_cursor(middle) if middle else None
+
+        return {
+            'list: first page': lambda: paginate_keyset(requirement_list_queryset(), page_size=50),
+            'list: deep page': lambda: paginate_keyset(requirement_list_queryset(), cursor=deep_cursor, page_size=50),
+            'list: status=new': lambda: paginate_keyset(
+                requirement_list_queryset().filter(status='new'), page_size=50
+            ),
+            'viewset: assigned_to': lambda: list(
+                ClientRequirement.objects.filter(assigned_to=staff).order_by('-created_at')[:50]
+            ),
+            'viewset: staff filter': lambda: list(
+                ClientRequirement.objects.filter(
+                    Q(assigned_to=staff) | Q(assigned_to__isnull=True)
+                ).order_by('-created_at')[:50]
+            ),
+            'stats: aggregate': compute_requirement_stats,
+        }
+
+    def run_all(self, options, indexed):
+        for label, run in self.queries().items():
+            timings = []
+            for _ in range(options['runs']):
+                start = time.perf_counter()
+                with CaptureQueriesContext(connection) as captured:
+                    run()
+                timings.append((time.perf_counter() - start) * 1000)
+
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            self.stdout.write(self.style.SUCCESS(
+                f'\n{label}: median {statistics.median(timings):.2f}ms, '
+                f'p95 {p95:.2f}ms, {len(captured)} quer{"y" if len(captured) == 1 else "ies"}'
+            ))
+            plan = self.explain(captured[-1]['sql'], options['analyze'])
+            for plan_line in plan:
+                self.stdout.write(f'    {plan_line}')
+            if indexed:
+                self.check_index_range(label, plan)
+
+    def check_index_range(self, label, plan):
+        column = INDEX_RANGE_QUERIES.get(label)
+        marker = INDEX_RANGE_MARKERS.get(connection.vendor)
+        if not column or not marker:
+            return
+        if not any(marker in line and column in line for line in plan):
+            raise CommandError(f'{label}: the plan has no index range condition on {column}')
+
+    def explain(self, sql, analyze):
+        prefix = 'EXPLAIN QUERY PLAN' if connection.vendor == 'sqlite' else 'EXPLAIN'
+        if analyze and connection.vendor == 'postgresql':
+            prefix = 'EXPLAIN ANALYZE'
+        with connection.cursor() as cursor:
+            cursor.execute(f'{prefix} {sql}')
+            return [' '.join(str(col) for col in row) for row in cursor.fetchall()]
+
+    # ==================== DATA ====================
+
+    def seed(self, rows):
+        self.stdout.write(f'Seeding {rows} client requirements...')
+        User = get_user_model()
+        staff = [
+            User.objects.get_or_create(email=f'staff{i}@{BENCHMARK_EMAIL_DOMAIN}')[0]
+            for i in range(10)
+        ]
+        statuses = [status for status, _ in ClientRequirement.STATUS_CHOICES]
+        now = timezone.now()
+        rng = random.Random(42)
+
+        batch_size = 1000
+        with explicit_created_at():
+            for offset in range(0, rows, batch_size):
+                batch = []
+                for i in range(offset, min(offset + batch_size, rows)):
+                    batch.append(ClientRequirement(
+                        first_name=f'Bench{i}',
+                        last_name='Client',
+                        email=f'client{i}@example.com',
+                        services=['software'],
+                        project_description='Benchmark submission',
+                        source=BENCHMARK_SOURCE,
+                        status=rng.choice(statuses),
+                        assigned_to=rng.choice(staff) if rng.random() < 0.6 else None,
+                        created_at=now - timedelta(minutes=rng.randint(0, 60 * 24 * 365)),
+                    ))
+                created = ClientRequirement.objects.bulk_create(batch)
+
+                FormAttachment.objects.bulk_create([
+                    FormAttachment(
+                        client_requirement=requirement,
+                        original_filename='brief.pdf',
+                        file_size=1024,
+                        mime_type='application/pdf',
+                        status='stored',
+                    )
+                    for requirement in created if rng.random() < 0.2
+                ])
+
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(f'ANALYZE {ClientRequirement._meta.db_table}')
+                cursor.execute(f'ANALYZE {FormAttachment._meta.db_table}')
+
+    def cleanup(self):
+        self.stdout.write('\nRemoving seeded rows...')
+        ClientRequirement.objects.filter(source=BENCHMARK_SOURCE).delete()
+        get_user_model().objects.filter(email__endswith=BENCHMARK_EMAIL_DOMAIN).delete()
@@ -0,0 +1,56 @@
+# admin/apps/forms/management/commands/export_requirements.py
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dycetix_common.loadtest import peak_rss_mb
+
+from ...services.export_service import EXPORT_CHUNK_SIZE, EXPORT_FORMATS, export_chunks, export_queryset
+from ...services.requirement_service import filter_requirements
+
+
+class Command(BaseCommand):
+    help = (
+        'Export client requirements as CSV, XLSX or NDJSON, streamed from a database cursor '
+        'so memory stays flat for any number of rows. Writes to stdout unless --output is given.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=sorted(EXPORT_FORMATS), default='csv')
+        parser.add_argument('--output', help='File to write (required for xlsx)')
+        parser.add_argument('--status', help='Only requirements with this status')
+        parser.add_argument('--assigned-to', help='Only requirements assigned to this user id ("none" for unassigned)')
+        parser.add_argument('--service', help='Only requirements that asked for this service')
+        parser.add_argument('--search', help='Only requirements matching this search')
+        parser.add_argument('--chunk-size', type=int, default=EXPORT_CHUNK_SIZE, help='Rows fetched per round trip')
+
+    def handle(self, *args, **options):
+        if options['format'] == 'xlsx' and not options['output']:
+            raise CommandError('--output is required for xlsx exports')
+
+        params = {
+            'status': options['status'],
+            'assigned_to': options['assigned_to'],
+            'service': options['service'],
+            'search': options['search'],
+        }
+        requirements = filter_requirements(export_queryset(), params)
+
+        started = time.perf_counter()
+        written = 0
+        output = open(options['output'], 'wb') if options['output'] else sys.stdout.buffer
+        try:
+            for chunk in export_chunks(requirements, options['format'], options['chunk_size']):
+                output.write(chunk)
+                written += len(chunk)
+        finally:
+            if options['output']:
+                output.close()
+            else:
+                output.flush()
+
+        self.stderr.write(
+            f'{written / 1024 / 1024:,.1f} MB written in {time.perf_counter() - started:.1f}s '
+            f'(peak RSS {peak_rss_mb():,.0f} MB)'
+        )
@@ -0,0 +1,219 @@
+# admin/apps/forms/management/commands/loadtest_forms.py
+import json
+import random
+import shutil
+import tempfile
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.communications.models import QueuedEmail
+from apps.communications.services.notification_service import submission_reference
+from dycetix_common.loadtest import RESULT_HEADER, compare_results, environment, format_result, run_scenario
+
+from ...constants import AttachmentStatus
+from ...models.client_requirement import ClientRequirement
+from ...models.form_attachment import FormAttachment
+from .benchmark_requirement_queries import BENCHMARK_EMAIL_DOMAIN, BENCHMARK_SOURCE, explicit_created_at
+
+LOADTEST_USER_EMAIL = f'loadtest@{BENCHMARK_EMAIL_DOMAIN}'
+SUBMISSION_EMAIL_DOMAIN = 'loadtest.example.com'
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed client requirements and attachments, then drive the forms API (submissions, list, detail, '
+        'stats) from concurrent threads and report throughput, p50/p95/p99, queries per request and peak '
+        'RSS. Works on SQLite or PostgreSQL; seeded and submitted rows are removed afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requirements', type=int, default=5000, help='Requirements to seed (0 to use existing data)')
+        parser.add_argument('--attachments', type=int, default=1000, help='Attachments to seed across them')
+        parser.add_argument('--requests', type=int, default=200, help='Timed requests per scenario')
+        parser.add_argument('--concurrency', type=int, default=8, help='Concurrent client threads')
+        parser.add_argument('--attachment-size', type=int, default=256 * 1024, help='Bytes per uploaded attachment')
+        parser.add_argument('--scenario', action='append', help='Only run scenarios containing this text (repeatable)')
+        parser.add_argument('--output', help='Write the results to this JSON file')
+        parser.add_argument('--compare', help='Baseline JSON to compare against; fails on regressions')
+        parser.add_argument('--tolerance', type=float, default=0.10, help='Allowed p95/throughput change (default 0.10)')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--keep', action='store_true', help='Keep the seeded rows afterwards')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        if options['requirements']:
+            self.seed(options['requirements'], options['attachments'], rng)
+        seeded = {
+            'requirements': ClientRequirement.objects.count(),
+            'attachments': FormAttachment.objects.count(),
+        }
+
+        # Uploads land in a scratch directory and stay staged: the request path is what is measured
+        scratch = tempfile.mkdtemp(prefix='loadtest-forms-')
+        try:
+            with override_settings(
+                ALLOWED_HOSTS=['testserver'],
+                MEDIA_ROOT=scratch,
+                FORMS_ATTACHMENT_STAGING_DIR=f'{scratch}/staging',
+                FORMS_INGEST_IN_PROCESS=False,
+                RATE_LIMIT_ENABLED=False,  # Every submission comes from one address
+                EMAIL_QUEUE_IN_PROCESS=False,  # Notifications are queued, never sent
+            ):
+                results = self.run_all(options, rng)
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+            if options['requirements'] and not options['keep']:
+                self.cleanup()
+            else:
+                self.cleanup_submissions()
+
+        report = {
+            'suite': 'forms',
+            'environment': environment(),
+            'data': seeded,
+            'scenarios': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f'Results written to {options["output"]}')
+
+        if options['compare']:
+            with open(options['compare'], encoding='utf-8') as f:
+                regressions = compare_results(json.load(f), report, options['tolerance'])
+            if regressions:
+                raise CommandError('Regressions against the baseline:\n  ' + '\n  '.join(regressions))
+            self.stdout.write(self.style.SUCCESS('No regressions against the baseline'))
+
+    # ==================== SCENARIOS ====================
+
+    def scenarios(self, options, rng):
+        picker = random.Random(rng.random())  # Shared by the threads, so picks vary between runs anyway
+        pks = list(ClientRequirement.objects.order_by('-created_at').values_list('pk', flat=True)[:1000])
+        if not pks:
+            raise CommandError('No client requirements to read; seed some with --requirements')
+        attachment = b'x' * options['attachment_size']
+        submit_url = reverse('submit_client_requirement')
+        list_url = reverse('client_requirements_list')
+
+        def submission(**extra):
+            return {
+                'firstName': 'Load',
+                'lastName': 'Test',
+                'email': f'{picker.randrange(10 ** 9)}@{SUBMISSION_EMAIL_DOMAIN}',
+                'company': 'Loadtest Ltd',
+                'services': ['software'],
+                'projectDetails': 'Load test submission ' * 20,
+                'source': BENCHMARK_SOURCE,
+                **extra,
+            }
+
+        return {
+            'submit: json': lambda client: client.post(
+                submit_url, json.dumps(submission()), content_type='application/json',
+            ),
+            'submit: multipart + attachment': lambda client: client.post(submit_url, {
+                **submission(),
+                'files': SimpleUploadedFile('brief.pdf', attachment, content_type='application/pdf'),
+            }),
+            'list: first page': lambda client: client.get(list_url, {'limit': 50}),
+            'list: status=new': lambda client: client.get(list_url, {'limit': 50, 'status': 'new'}),
+            'list: search': lambda client: client.get(list_url, {'limit': 50, 'search': 'bench client'}),
+            'detail': lambda client: client.get(
+                reverse('client_requirement_detail', args=[picker.choice(pks)])
+            ),
+            'stats: dashboard': lambda client: client.get(reverse('admin_stats')),
+            'stats: sidebar': lambda client: client.get(reverse('sidebar_stats')),
+        }
+
+    def run_all(self, options, rng):
+        user, _ = get_user_model().objects.get_or_create(email=LOADTEST_USER_EMAIL)
+
+        def logged_in_client():
+            client = Client()
+            client.force_login(user)
+            return client
+
+        results = {}
+        self.stdout.write(
+            f'{options["requests"]} requests per scenario, {options["concurrency"]} threads, {connection.vendor}'
+        )
+        self.stdout.write(RESULT_HEADER)
+        for name, scenario in self.scenarios(options, rng).items():
+            if options['scenario'] and not any(part in name for part in options['scenario']):
+                continue
+            result = run_scenario(scenario, options['requests'], options['concurrency'], make_client=logged_in_client)
+            results[name] = result
+            line = format_result(name, result)
+            self.stdout.write(self.style.ERROR(line) if result['errors'] else line)
+        return results
+
+    # ==================== DATA ====================
+
+    def seed(self, rows, attachments, rng):
+        self.stdout.write(f'Seeding {rows} client requirements and {attachments} attachments...')
+        statuses = [status for status, _ in ClientRequirement.STATUS_CHOICES]
+        now = timezone.now()
+
+        batch_size = 1000
+        pks = []
+        with explicit_created_at():
+            for offset in range(0, rows, batch_size):
+                created = ClientRequirement.objects.bulk_create([
+                    ClientRequirement(
+                        first_name=f'Bench{i}',
+                        last_name='Client',
+                        email=f'client{i}@example.com',
+                        company=rng.choice(['Acme', 'Globex', 'Initech', None]),
+                        services=rng.sample(['software', 'design', 'it', 'photography'], 2),
+                        project_description=f'Benchmark submission {i} for a new client website and mobile app',
+                        source=BENCHMARK_SOURCE,
+                        status=rng.choice(statuses),
+                        created_at=now - timedelta(minutes=rng.randint(0, 60 * 24 * 365)),
+                    )
+                    for i in range(offset, min(offset + batch_size, rows))
+                ])
+                pks.extend(requirement.pk for requirement in created)
+
+        for offset in range(0, attachments, batch_size):
+            FormAttachment.objects.bulk_create([
+                FormAttachment(
+                    client_requirement_id=rng.choice(pks),
+                    original_filename=f'brief{i}.pdf',
+                    file_size=rng.randint(10 * 1024, 5 * 1024 * 1024),
+                    mime_type='application/pdf',
+                    status=AttachmentStatus.STORED,
+                )
+                for i in range(offset, min(offset + batch_size, attachments))
+            ])
+
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(f'ANALYZE {ClientRequirement._meta.db_table}')
+                cursor.execute(f'ANALYZE {FormAttachment._meta.db_table}')
+
+    def cleanup(self):
+        self.stdout.write('Removing seeded rows...')
+        self.delete_submission_emails()
+        ClientRequirement.objects.filter(source=BENCHMARK_SOURCE).delete()
+        get_user_model().objects.filter(email__endswith=BENCHMARK_EMAIL_DOMAIN).delete()
+
+    def cleanup_submissions(self):
+        """Remove only what the run itself created, keeping seeded or existing data"""
+        self.delete_submission_emails()
+        ClientRequirement.objects.filter(source=BENCHMARK_SOURCE, email__endswith=SUBMISSION_EMAIL_DOMAIN).delete()
+        get_user_model().objects.filter(email=LOADTEST_USER_EMAIL).delete()
+
+    def delete_submission_emails(self):
+        """Notifications queued for the run's submissions (seeded rows are bulk-created and queue none)"""
+        submitted = ClientRequirement.objects.filter(
+            source=BENCHMARK_SOURCE, email__endswith=SUBMISSION_EMAIL_DOMAIN,
+        ).values_list('pk', flat=True)
+        QueuedEmail.objects.filter(reference__in=[submission_reference(pk) for pk in submitted]).delete()
@@ -0,0 +1,60 @@
+# admin/apps/forms/management/commands/migrate_attachment_storage.py
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ...services.storage_migration_service import (
+    COPIED,
+    FAILED,
+    MISSING,
+    SKIPPED,
+    migrate_files,
+    stored_file_names,
+)
+from ...storage import create_attachment_storage
+
+
+class Command(BaseCommand):
+    help = (
+        'Copy every attachment file between FORMS_ATTACHMENT_STORAGES backends in parallel, verifying '
+        'SHA-256 checksums. Safe to re-run; switch FORMS_ATTACHMENT_STORAGE once it reports no failures.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--from', dest='source', required=True, help='Source storage alias')
+        parser.add_argument('--to', dest='target', required=True, help='Target storage alias')
+        parser.add_argument('--workers', type=int, default=8, help='Files copied at once')
+        parser.add_argument('--delete-source', action='store_true', help='Delete each file from the source once verified')
+        parser.add_argument('--dry-run', action='store_true', help='Only count the files to copy')
+
+    def handle(self, *args, **options):
+        if options['source'] == options['target']:
+            raise CommandError('--from and --to must be different storages')
+        source = create_attachment_storage(options['source'])
+        target = create_attachment_storage(options['target'])
+
+        if options['dry_run']:
+            count = sum(1 for _ in stored_file_names())
+            self.stdout.write(f'{count} file(s) would be copied from {options["source"]} to {options["target"]}')
+            return
+
+        counts = {COPIED: 0, SKIPPED: 0, MISSING: 0, FAILED: 0}
+        started = time.perf_counter()
+        results = migrate_files(
+            stored_file_names(), source, target,
+            workers=options['workers'], delete_source=options['delete_source'],
+        )
+        for done, (name, outcome, detail) in enumerate(results, start=1):
+            counts[outcome] += 1
+            if outcome in (MISSING, FAILED):
+                self.stderr.write(f'{outcome}: {name}' + (f' ({detail})' if detail else ''))
+            if done % 1000 == 0:
+                self.stdout.write(f'{done} file(s) processed...')
+
+        summary = ', '.join(f'{count} {outcome}' for outcome, count in counts.items())
+        self.stdout.write(f'{summary} in {time.perf_counter() - started:.1f}s')
+        if counts[FAILED]:
+            raise CommandError(f'{counts[FAILED]} file(s) failed; re-run to retry them')
+        if options['target'] != settings.FORMS_ATTACHMENT_STORAGE:
+            self.stdout.write(self.style.SUCCESS(f'Done. Set FORMS_ATTACHMENT_STORAGE={options["target"]} to switch over.'))
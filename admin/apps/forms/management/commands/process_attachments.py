@@ -0,0 +1,28 @@
+# admin/apps/forms/management/commands/process_attachments.py
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...services.attachment_service import process_pending_attachments
+
+
+class Command(BaseCommand):
+    help = 'Store, sniff and verify staged form attachments (pending -> stored/failed)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain the queue once and exit')
+        parser.add_argument('--batch-size', type=int, default=20)
+        parser.add_argument('--interval', type=float, default=2.0, help='Seconds to sleep when the queue is empty')
+
+    def handle(self, *args, **options):
+        total = 0
+        while True:
+            processed = process_pending_attachments(batch_size=options['batch_size'])
+            total += processed
+            if processed:
+                continue
+            if options['once']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(f'Processed {total} attachment(s)'))
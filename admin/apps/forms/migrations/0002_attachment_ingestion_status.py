@@ -0,0 +1,49 @@
+# Generated by Django 5.2 on 2026-10-18 14:56
+
+import apps.forms.models.form_attachment
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forms', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='formattachment',
+            name='error_message',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='formattachment',
+            name='processed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='formattachment',
+            name='staged_path',
+            field=models.CharField(blank=True, max_length=500, null=True),
+        ),
+        # Attachments created before ingestion existed were written synchronously
+        migrations.AddField(
+            model_name='formattachment',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('stored', 'Stored'), ('failed', 'Failed')], default='stored', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='formattachment',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('stored', 'Stored'), ('failed', 'Failed')], default='pending', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='formattachment',
+            name='file',
+            field=models.FileField(blank=True, upload_to=apps.forms.models.form_attachment.attachment_upload_path),
+        ),
+        migrations.AddIndex(
+            model_name='formattachment',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['id'], name='form_attach_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2 on 2026-10-18 15:01
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+# PostgreSQL only: the column is kept current by a trigger, and the GIN
+# indexes use operator classes other backends don't have. On SQLite the
+# column simply stays NULL and search falls back to icontains.
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('english', coalesce(NEW.first_name, '') || ' ' || coalesce(NEW.last_name, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(NEW.email, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(NEW.company, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(NEW.project_description, '')), 'C')
+"""
+
+FORWARD_SQL = [
+    f"""
+    CREATE OR REPLACE FUNCTION client_requirements_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {SEARCH_VECTOR_SQL};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE TRIGGER client_requirements_search_vector_trigger
+    BEFORE INSERT OR UPDATE ON client_requirements
+    FOR EACH ROW EXECUTE FUNCTION client_requirements_search_vector_update();
+    """,
+    # Backfill existing rows through the trigger
+    "UPDATE client_requirements SET search_vector = NULL;",
+    "CREATE INDEX client_req_search_vector_gin ON client_requirements USING gin (search_vector);",
+    "CREATE INDEX client_req_first_name_trgm ON client_requirements USING gin (first_name gin_trgm_ops);",
+    "CREATE INDEX client_req_last_name_trgm ON client_requirements USING gin (last_name gin_trgm_ops);",
+    "CREATE INDEX client_req_email_trgm ON client_requirements USING gin (email gin_trgm_ops);",
+    "CREATE INDEX client_req_company_trgm ON client_requirements USING gin (company gin_trgm_ops);",
+]
+
+REVERSE_SQL = [
+    "DROP INDEX IF EXISTS client_req_company_trgm;",
+    "DROP INDEX IF EXISTS client_req_email_trgm;",
+    "DROP INDEX IF EXISTS client_req_last_name_trgm;",
+    "DROP INDEX IF EXISTS client_req_first_name_trgm;",
+    "DROP INDEX IF EXISTS client_req_search_vector_gin;",
+    "DROP TRIGGER IF EXISTS client_requirements_search_vector_trigger ON client_requirements;",
+    "DROP FUNCTION IF EXISTS client_requirements_search_vector_update();",
+]
+
+
+def create_search_objects(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for statement in FORWARD_SQL:
+        schema_editor.execute(statement)
+
+
+def drop_search_objects(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for statement in REVERSE_SQL:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forms', '0002_attachment_ingestion_status'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='clientrequirement',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_objects, drop_search_objects),
+    ]
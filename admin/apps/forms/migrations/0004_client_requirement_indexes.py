@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-18 15:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forms', '0003_client_requirement_search'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='clientrequirement',
+            index=models.Index(fields=['-created_at', '-id'], name='client_req_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientrequirement',
+            index=models.Index(fields=['status', '-created_at'], name='client_req_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientrequirement',
+            index=models.Index(fields=['assigned_to', '-created_at'], name='client_req_assignee_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientrequirement',
+            index=models.Index(condition=models.Q(('assigned_to__isnull', True)), fields=['-created_at'], name='client_req_unassigned_idx'),
+        ),
+    ]
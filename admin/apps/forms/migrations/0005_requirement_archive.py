@@ -0,0 +1,98 @@
+# Generated by Django 5.2 on 2026-10-18 16:32
+
+import apps.forms.models.form_attachment
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+# PostgreSQL only, as in 0003: full-text search over the archive uses the
+# search_vector copied from the live row
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX client_req_archive_search_vector_gin ON client_requirements_archive USING gin (search_vector);'
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS client_req_archive_search_vector_gin;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forms', '0004_client_requirement_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedClientRequirement',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('first_name', models.CharField(max_length=100)),
+                ('last_name', models.CharField(max_length=100)),
+                ('email', models.EmailField(max_length=254)),
+                ('phone', models.CharField(blank=True, max_length=50, null=True)),
+                ('company', models.CharField(blank=True, max_length=100, null=True)),
+                ('services', models.JSONField(default=list)),
+                ('other_service', models.CharField(blank=True, max_length=100, null=True)),
+                ('project_description', models.TextField()),
+                ('budget_range', models.CharField(blank=True, max_length=50, null=True)),
+                ('timeline', models.CharField(blank=True, max_length=50, null=True)),
+                ('source', models.CharField(blank=True, max_length=100, null=True)),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('user_agent', models.TextField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('new', 'New'), ('contacted', 'Contacted'), ('quoted', 'Quoted'), ('converted', 'Converted'), ('archived', 'Archived')], default='archived', max_length=20)),
+                ('priority', models.CharField(choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High')], default='medium', max_length=10)),
+                ('internal_notes', models.TextField(blank=True, null=True)),
+                ('admin_response', models.TextField(blank=True, null=True)),
+                ('response_sent_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField()),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True)),
+                ('assigned_to', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_requirements', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Archived Client Requirement',
+                'verbose_name_plural': 'Archived Client Requirements',
+                'db_table': 'client_requirements_archive',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedFormAttachment',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('original_filename', models.CharField(max_length=255)),
+                ('file', models.FileField(blank=True, upload_to=apps.forms.models.form_attachment.attachment_upload_path)),
+                ('file_size', models.BigIntegerField()),
+                ('mime_type', models.CharField(max_length=100)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('stored', 'Stored'), ('failed', 'Failed')], default='stored', max_length=20)),
+                ('staged_path', models.CharField(blank=True, max_length=500, null=True)),
+                ('error_message', models.TextField(blank=True, null=True)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+                ('uploaded_by_ip', models.GenericIPAddressField(blank=True, null=True)),
+                ('uploaded_by_user_agent', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('client_requirement', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attachments', to='forms.archivedclientrequirement')),
+            ],
+            options={
+                'verbose_name': 'Archived Form Attachment',
+                'verbose_name_plural': 'Archived Form Attachments',
+                'db_table': 'form_attachments_archive',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='archivedclientrequirement',
+            index=models.Index(fields=['-created_at', '-id'], name='client_req_archive_created_idx'),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-18 16:36
+
+import apps.forms.models.form_attachment
+import apps.forms.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forms', '0005_requirement_archive'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='archivedformattachment',
+            name='file',
+            field=models.FileField(blank=True, storage=apps.forms.storage.attachment_storage, upload_to=apps.forms.models.form_attachment.attachment_upload_path),
+        ),
+        migrations.AlterField(
+            model_name='formattachment',
+            name='file',
+            field=models.FileField(blank=True, storage=apps.forms.storage.attachment_storage, upload_to=apps.forms.models.form_attachment.attachment_upload_path),
+        ),
+    ]
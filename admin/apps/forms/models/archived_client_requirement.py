@@ -0,0 +1,72 @@
+# admin/apps/forms/models/archived_client_requirement.py
+from django.db import models
+from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
+
+from .client_requirement import ClientRequirement
+
+
+class ArchivedClientRequirement(models.Model):
+    """
+    Client requirements moved out of ``client_requirements`` once they have
+    been archived for a while (see services/archive_service.py). Same
+    columns, same ids, plus when the row was moved.
+    """
+    id = models.BigIntegerField(primary_key=True)  # Kept from client_requirements
+    
+    # Personal Information
+    first_name = models.CharField(max_length=100)
+    last_name = models.CharField(max_length=100)
+    email = models.EmailField()
+    phone = models.CharField(max_length=50, blank=True, null=True)
+    company = models.CharField(max_length=100, blank=True, null=True)
+    
+    # Project Details
+    services = models.JSONField(default=list)
+    other_service = models.CharField(max_length=100, blank=True, null=True)
+    project_description = models.TextField()
+    budget_range = models.CharField(max_length=50, blank=True, null=True)
+    timeline = models.CharField(max_length=50, blank=True, null=True)
+    
+    # Source & Tracking
+    source = models.CharField(max_length=100, blank=True, null=True)
+    ip_address = models.GenericIPAddressField(blank=True, null=True)
+    user_agent = models.TextField(blank=True, null=True)
+    
+    # Status & Assignment
+    status = models.CharField(max_length=20, choices=ClientRequirement.STATUS_CHOICES, default='archived')
+    priority = models.CharField(max_length=10, choices=ClientRequirement.PRIORITY_CHOICES, default='medium')
+    assigned_to = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='archived_requirements'
+    )
+    
+    # Admin Fields
+    internal_notes = models.TextField(blank=True, null=True)
+    admin_response = models.TextField(blank=True, null=True)
+    response_sent_at = models.DateTimeField(blank=True, null=True)
+    
+    # Timestamps (copied, not reset, when the row is moved)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField()
+    
+    # Copied from the live row, so archive searches use full-text matching too
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
+    
+    class Meta:
+        db_table = 'client_requirements_archive'
+        ordering = ['-created_at']
+        verbose_name = 'Archived Client Requirement'
+        verbose_name_plural = 'Archived Client Requirements'
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='client_req_archive_created_idx'),
+        ]
+    
+    SERVICE_LABELS = ClientRequirement.SERVICE_LABELS
+    __str__ = ClientRequirement.__str__
+    full_name = ClientRequirement.full_name
+    selected_services = ClientRequirement.selected_services
@@ -0,0 +1,49 @@
+# admin/apps/forms/models/archived_form_attachment.py
+from django.db import models
+
+from ..constants import AttachmentStatus
+from ..storage import attachment_storage
+from .archived_client_requirement import ArchivedClientRequirement
+from .form_attachment import FormAttachment, attachment_upload_path
+
+
+class ArchivedFormAttachment(models.Model):
+    """
+    Attachments of archived client requirements, moved together with them.
+    Stored files are left where they are; only the rows move.
+    """
+    id = models.BigIntegerField(primary_key=True)  # Kept from form_attachments
+    client_requirement = models.ForeignKey(
+        ArchivedClientRequirement,
+        on_delete=models.CASCADE,
+        related_name='attachments'
+    )
+    
+    # File info
+    original_filename = models.CharField(max_length=255)
+    file = models.FileField(upload_to=attachment_upload_path, storage=attachment_storage, blank=True)
+    file_size = models.BigIntegerField()
+    mime_type = models.CharField(max_length=100)
+    
+    # Ingestion
+    status = models.CharField(max_length=20, choices=AttachmentStatus.choices, default=AttachmentStatus.STORED)
+    staged_path = models.CharField(max_length=500, blank=True, null=True)
+    error_message = models.TextField(blank=True, null=True)
+    processed_at = models.DateTimeField(blank=True, null=True)
+    
+    # Tracking
+    uploaded_by_ip = models.GenericIPAddressField(blank=True, null=True)
+    uploaded_by_user_agent = models.TextField(blank=True, null=True)
+    
+    # Timestamps
+    created_at = models.DateTimeField()
+    
+    class Meta:
+        db_table = 'form_attachments_archive'
+        ordering = ['-created_at']
+        verbose_name = 'Archived Form Attachment'
+        verbose_name_plural = 'Archived Form Attachments'
+    
+    __str__ = FormAttachment.__str__
+    file_size_mb = FormAttachment.file_size_mb
+    download_url = FormAttachment.download_url
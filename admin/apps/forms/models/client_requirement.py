@@ -1,6 +1,7 @@
 # admin/apps/forms/models/client_requirement.py
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 import json
 
 
@@ -16,6 +17,15 @@ class ClientRequirement(models.Model):
     company = models.CharField(max_length=100, blank=True, null=True)
     
     # Project Details
+    SERVICE_LABELS = {
+        'software': 'Software Development',
+        'design': 'Graphic Design',
+        'it': 'IT Support',
+        'photography': 'Photography',
+        'videography': 'Videography',
+        'other': 'Other'
+    }
+    
     services = models.JSONField(default=list)  # Store array of selected services
     other_service = models.CharField(max_length=100, blank=True, null=True)  # If "Other" is selected
     project_description = models.TextField()
@@ -73,11 +83,27 @@ class ClientRequirement(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # Full-text search document (name/email/company/description), maintained by a
+    # PostgreSQL trigger (see migration 0003); always NULL on other backends
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
+    
     class Meta:
         db_table = 'client_requirements'
         ordering = ['-created_at']
         verbose_name = 'Client Requirement'
         verbose_name_plural = 'Client Requirements'
+        # Match the list/viewset access paths: newest first, optionally filtered
+        # by status or assignee, plus the "unassigned" half of the staff filter
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='client_req_created_idx'),
+            models.Index(fields=['status', '-created_at'], name='client_req_status_created_idx'),
+            models.Index(fields=['assigned_to', '-created_at'], name='client_req_assignee_idx'),
+            models.Index(
+                fields=['-created_at'],
+                name='client_req_unassigned_idx',
+                condition=models.Q(assigned_to__isnull=True),
+            ),
+        ]
     
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
@@ -89,21 +115,12 @@ class ClientRequirement(models.Model):
     @property
     def selected_services(self):
         """Get human-readable service names"""
-        service_map = {
-            'software': 'Software Development',
-            'design': 'Graphic Design',
-            'it': 'IT Support',
-            'photography': 'Photography',
-            'videography': 'Videography',
-            'other': 'Other'
-        }
-        
         services = []
         for service in self.services:
             if service == 'other' and self.other_service:
                 services.append(self.other_service)
             else:
-                services.append(service_map.get(service, service))
+                services.append(self.SERVICE_LABELS.get(service, service))
         
         return ', '.join(services)
     
@@ -1,14 +1,24 @@
 # admin/apps/forms/models/form_attachment.py
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 import os
 import uuid
 
+from ..constants import AttachmentStatus
+from ..storage import attachment_storage
+
+
+def attachment_key(filename, created_at=None):
+    """Storage name for a new attachment: by date, with a unique ID"""
+    created_at = created_at or timezone.now()
+    return f"form_attachments/{created_at.strftime('%Y/%m/%d')}/{uuid.uuid4()}_{filename}"
+
 
 def attachment_upload_path(instance, filename):
     """Generate upload path for attachments"""
-    # Store by date and unique ID
-    return f"form_attachments/{instance.created_at.strftime('%Y/%m/%d')}/{uuid.uuid4()}_{filename}"
+    # created_at is not set yet on first save
+    return attachment_key(filename, instance.created_at)
 
 
 class FormAttachment(models.Model):
@@ -26,10 +36,20 @@ class FormAttachment(models.Model):
     
     # File info
     original_filename = models.CharField(max_length=255)
-    file = models.FileField(upload_to=attachment_upload_path)
+    file = models.FileField(upload_to=attachment_upload_path, storage=attachment_storage, blank=True)  # Empty until ingested
     file_size = models.BigIntegerField()  # In bytes
     mime_type = models.CharField(max_length=100)
     
+    # Ingestion (bytes are staged by the request, stored by the background worker)
+    status = models.CharField(
+        max_length=20,
+        choices=AttachmentStatus.choices,
+        default=AttachmentStatus.PENDING
+    )
+    staged_path = models.CharField(max_length=500, blank=True, null=True)
+    error_message = models.TextField(blank=True, null=True)
+    processed_at = models.DateTimeField(blank=True, null=True)
+    
     # Tracking
     uploaded_by_ip = models.GenericIPAddressField(blank=True, null=True)
     uploaded_by_user_agent = models.TextField(blank=True, null=True)
@@ -42,6 +62,13 @@ class FormAttachment(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Form Attachment'
         verbose_name_plural = 'Form Attachments'
+        indexes = [
+            models.Index(
+                fields=['id'],
+                name='form_attach_pending_idx',
+                condition=models.Q(status='pending'),
+            ),
+        ]
     
     def __str__(self):
         return f"{self.original_filename} ({self.file_size} bytes)"
@@ -53,8 +80,8 @@ class FormAttachment(models.Model):
     
     @property
     def download_url(self):
-        """Get download URL for the file"""
-        return self.file.url if self.file else None
+        """Signed, expiring download URL for the file (straight from storage on S3)"""
+        return self.file.storage.signed_url(self.file.name, self.original_filename) if self.file else None
     
     def save(self, *args, **kwargs):
         # Set file size before saving
@@ -0,0 +1,106 @@
+# admin/apps/forms/pagination.py
+"""
+Keyset (cursor) pagination, newest first on (created_at, id).
+
+Each page filters on the last row of the previous page instead of using
+OFFSET, so page 1000 costs the same as page 1. Cursors are opaque
+url-safe strings; clients should only pass back what they were given.
+
+Ranked search results (annotated with ``search_rank``) are paged on
+(search_rank, created_at, id) instead, so the ranking survives paging.
+
+Live and archived requirements are paged together by reading a page from
+each table and merging: ids are kept when rows move between them, so the
+keys stay unique across both.
+"""
+import base64
+import json
+from datetime import datetime
+
+from django.db.models import Q
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+DEFAULT_KEYS = ('created_at', 'id')
+RANKED_KEYS = ('search_rank', 'created_at', 'id')
+
+# How each key is read back out of a cursor
+KEY_PARSERS = {
+    'search_rank': float,
+    'created_at': datetime.fromisoformat,
+    'id': int,
+}
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(obj, keys=DEFAULT_KEYS):
+    values = []
+    for key in keys:
+        value = getattr(obj, key)
+        values.append(value.isoformat() if isinstance(value, datetime) else value)
+    payload = json.dumps(values, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, keys=DEFAULT_KEYS):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError
+        return [KEY_PARSERS[key](value) for key, value in zip(keys, values)]
+    except (ValueError, TypeError):
+        raise InvalidCursor('Invalid cursor')
+
+
+def parse_page_size(value, default=DEFAULT_PAGE_SIZE):
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(size, MAX_PAGE_SIZE))
+
+
+def _after(keys, values):
+    """
+    (k1, k2, ...) < (v1, v2, ...) for a descending sort, expanded for the ORM.
+    The redundant ``k1 <= v1`` in front is what the database can use as an
+    index range condition; the OR on its own is only a filter, so deep pages
+    would scan every row before the cursor.
+    """
+    condition = Q()
+    for i, key in enumerate(keys):
+        equal = dict(zip(keys[:i], values[:i]))
+        condition |= Q(**equal, **{f'{key}__lt': values[i]})
+    return Q(**{f'{keys[0]}__lte': values[0]}) & condition
+
+
+def paginate_keyset(queryset, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Return ``(rows, next_cursor)`` for the page after ``cursor``.
+    ``next_cursor`` is None on the last page. Raises InvalidCursor.
+    ``queryset`` may also be a list of querysets with the same keys, paged
+    as one.
+    """
+    querysets = queryset if isinstance(queryset, list) else [queryset]
+    keys = RANKED_KEYS if 'search_rank' in querysets[0].query.annotations else DEFAULT_KEYS
+    after = _after(keys, decode_cursor(cursor, keys)) if cursor else None
+    
+    rows = []
+    for queryset in querysets:
+        queryset = queryset.order_by(*[f'-{key}' for key in keys])
+        if after is not None:
+            queryset = queryset.filter(after)
+        # Fetch one extra row to know whether another page exists
+        rows.extend(queryset[:page_size + 1])
+    if len(querysets) > 1:
+        rows.sort(key=lambda row: [getattr(row, key) for key in keys], reverse=True)
+    
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        return rows, encode_cursor(rows[-1], keys)
+    return rows, None
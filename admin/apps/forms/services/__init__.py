@@ -0,0 +1 @@
+# admin/apps/forms/services/__init__.py
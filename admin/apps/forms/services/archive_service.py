@@ -0,0 +1,123 @@
+# admin/apps/forms/services/archive_service.py
+"""
+Moving settled client requirements out of the live tables.
+
+A requirement archived more than REQUIREMENT_ARCHIVE_AFTER_DAYS ago is
+moved with its attachments into ``client_requirements_archive`` and
+``form_attachments_archive``. The move is run by ``manage.py
+archive_requirements``. After that, the dashboard's lists, counts, stats
+and searches only touch live rows. ``?archive=1`` adds the archive to a
+list (paged together with the live rows) and ``?archive=only`` reads it
+alone.
+
+Each chunk of ARCHIVE_CHUNK_SIZE requirements is locked, then copied with
+INSERT ... SELECT and deleted, in its own transaction. Ids are kept, so
+``restore_requirements`` can move rows back unchanged.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from ..constants import AttachmentStatus, RequirementStatus
+from ..models.archived_client_requirement import ArchivedClientRequirement
+from ..models.archived_form_attachment import ArchivedFormAttachment
+from ..models.client_requirement import ClientRequirement
+from ..models.form_attachment import FormAttachment
+from .live_service import publish_requirement_change
+from .stats_service import invalidate_requirement_stats
+
+ARCHIVE_CHUNK_SIZE = 1000
+
+
+def archivable_requirements(days=None):
+    """Requirements archived (and untouched) for more than `days` days, attachments all ingested"""
+    if days is None:
+        days = settings.REQUIREMENT_ARCHIVE_AFTER_DAYS
+    cutoff = timezone.now() - timedelta(days=days)
+    return ClientRequirement.objects.filter(
+        status=RequirementStatus.ARCHIVED,
+        updated_at__lt=cutoff,
+    ).exclude(attachments__status=AttachmentStatus.PENDING)
+
+
+def copy_rows(cursor, source, target, column, ids, **values):
+    """
+    INSERT INTO target's table the rows of source's table whose `column` is
+    in `ids`, for the columns both tables share. `values` set (or override)
+    target columns.
+    """
+    quote = connection.ops.quote_name
+    target_columns = {field.column for field in target._meta.concrete_fields}
+    columns = [
+        field.column for field in source._meta.concrete_fields
+        if field.column in target_columns and field.column not in values
+    ]
+    cursor.execute(
+        f'INSERT INTO {quote(target._meta.db_table)} ({", ".join(quote(c) for c in [*columns, *values])}) '
+        f'SELECT {", ".join([quote(c) for c in columns] + ["%s"] * len(values))} '
+        f'FROM {quote(source._meta.db_table)} WHERE {quote(column)} IN ({", ".join(["%s"] * len(ids))})',
+        [*values.values(), *ids],
+    )
+
+
+def delete_rows(cursor, model, column, ids):
+    """Raw DELETE: the rows have been copied, so no delete signals or cascades are wanted"""
+    quote = connection.ops.quote_name
+    cursor.execute(
+        f'DELETE FROM {quote(model._meta.db_table)} WHERE {quote(column)} IN ({", ".join(["%s"] * len(ids))})',
+        ids,
+    )
+    return cursor.rowcount
+
+
+def move_requirements(queryset, chunk_size, requirement_tables, attachment_tables, **values):
+    """Move the requirements `queryset` matches, and their attachments, between tables. Returns the count moved."""
+    source, target = requirement_tables
+    matching = source.objects.filter(pk__in=queryset.order_by().values('pk'))
+    moved = 0
+    while True:
+        with transaction.atomic():
+            # Locked until the chunk is deleted; rows being edited right now wait for the next run
+            ids = list(
+                matching.select_for_update(skip_locked=True).order_by('pk').values_list('pk', flat=True)[:chunk_size]
+            )
+            if not ids:
+                break
+            with connection.cursor() as cursor:
+                copy_rows(cursor, source, target, 'id', ids, **values)
+                copy_rows(cursor, *attachment_tables, 'client_requirement_id', ids)
+                delete_rows(cursor, attachment_tables[0], 'client_requirement_id', ids)
+                moved += delete_rows(cursor, source, 'id', ids)
+
+    if moved:
+        invalidate_requirement_stats()
+        publish_requirement_change()
+    return moved
+
+
+def archive_requirements(days=None, chunk_size=ARCHIVE_CHUNK_SIZE):
+    """Move long-archived requirements to the archive tables. Returns the number moved."""
+    return move_requirements(
+        archivable_requirements(days),
+        chunk_size,
+        (ClientRequirement, ArchivedClientRequirement),
+        (FormAttachment, ArchivedFormAttachment),
+        archived_at=connection.ops.adapt_datetimefield_value(timezone.now()),
+    )
+
+
+def restore_requirements(queryset, chunk_size=ARCHIVE_CHUNK_SIZE):
+    """
+    Move archived requirements (an ArchivedClientRequirement queryset) back
+    to the live tables. updated_at is reset so the next archive run leaves
+    them alone for another REQUIREMENT_ARCHIVE_AFTER_DAYS.
+    """
+    return move_requirements(
+        queryset,
+        chunk_size,
+        (ArchivedClientRequirement, ClientRequirement),
+        (ArchivedFormAttachment, FormAttachment),
+        updated_at=connection.ops.adapt_datetimefield_value(timezone.now()),
+    )
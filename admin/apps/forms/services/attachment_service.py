@@ -0,0 +1,307 @@
+# admin/apps/forms/services/attachment_service.py
+"""
+Attachment ingestion pipeline.
+
+Submissions only stage attachment bytes on local disk and create
+``pending`` FormAttachment rows. Moving the bytes into storage, MIME
+sniffing and size verification happen afterwards, either in the
+in-process background thread (kicked after the submission commits) or in
+the ``process_attachments`` management command.
+
+Browsers can instead upload straight to storage. They ask for upload
+slots (``create_upload_slot``), POST each file to its presigned URL, and
+submit the slots' signed tokens with the form. Those attachments are
+verified where they are: size and type are read from storage.
+"""
+import logging
+import mimetypes
+import os
+import threading
+import uuid
+
+from django.conf import settings
+from django.core import signing
+from django.core.files import File
+from django.core.files.move import file_move_safe
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from ..constants import AttachmentStatus
+from ..exceptions import AttachmentIngestError, AttachmentUploadError
+from ..models.form_attachment import FormAttachment, attachment_key
+from ..storage import attachment_storage
+
+logger = logging.getLogger(__name__)
+
+# Leading bytes of the file types the customer forms accept
+FILE_SIGNATURES = [
+    (b'%PDF-', 'application/pdf'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+    (b'PK\x03\x04', 'application/zip'),  # Also docx/xlsx/pptx containers
+]
+SNIFF_BYTES = 16
+
+UPLOAD_TOKEN_SALT = 'forms.attachment-upload-slot'
+UPLOAD_TOKEN_MAX_AGE = 24 * 60 * 60  # Time to fill in and submit the form after uploading
+
+
+# ==================== STAGING (request path) ====================
+
+def _staging_path():
+    os.makedirs(settings.FORMS_ATTACHMENT_STAGING_DIR, exist_ok=True)
+    return os.path.join(settings.FORMS_ATTACHMENT_STAGING_DIR, uuid.uuid4().hex)
+
+
+def stage_uploaded_file(uploaded_file):
+    """Move an uploaded file into the staging area and return its path"""
+    path = _staging_path()
+    if hasattr(uploaded_file, 'temporary_file_path'):
+        # Already on disk: a rename, no copy
+        file_move_safe(uploaded_file.temporary_file_path(), path)
+    else:
+        with open(path, 'wb') as destination:
+            for chunk in uploaded_file.chunks():
+                destination.write(chunk)
+    return path
+
+
+def stage_bytes(content):
+    """Write decoded attachment bytes (legacy JSON submissions) to staging"""
+    path = _staging_path()
+    with open(path, 'wb') as destination:
+        destination.write(content)
+    return path
+
+
+def create_pending_attachment(client_requirement, staged_path, file_name, file_size,
+                              mime_type, ip_address=None, user_agent=None):
+    return FormAttachment.objects.create(
+        client_requirement=client_requirement,
+        original_filename=file_name,
+        file_size=file_size,
+        mime_type=mime_type or 'application/octet-stream',
+        status=AttachmentStatus.PENDING,
+        staged_path=staged_path,
+        uploaded_by_ip=ip_address,
+        uploaded_by_user_agent=user_agent
+    )
+
+
+# ==================== DIRECT UPLOADS (browser -> storage) ====================
+
+def create_upload_slot(file_name, file_size, content_type):
+    """
+    Reserve a storage name for one file and presign its upload. Returns the
+    upload's method, url and form fields, plus the token the submission
+    passes back to claim the file.
+    """
+    file_name = os.path.basename(str(file_name or '')).strip()
+    if not file_name:
+        raise AttachmentUploadError('File name is required')
+    try:
+        file_size = int(file_size)
+    except (TypeError, ValueError):
+        raise AttachmentUploadError(f'Invalid size for "{file_name}"') from None
+    if file_size <= 0:
+        raise AttachmentUploadError(f'File "{file_name}" is empty')
+    if file_size > settings.FORMS_MAX_ATTACHMENT_SIZE:
+        raise AttachmentUploadError(
+            f'File "{file_name}" exceeds the {settings.FORMS_MAX_ATTACHMENT_SIZE // (1024 * 1024)}MB limit'
+        )
+    content_type = content_type or mimetypes.guess_type(file_name)[0] or 'application/octet-stream'
+    
+    storage = attachment_storage()
+    field = FormAttachment._meta.get_field('file')
+    name = storage.get_available_name(storage.generate_filename(attachment_key(file_name)), max_length=field.max_length)
+    token = signing.dumps(
+        {'name': name, 'filename': file_name, 'size': file_size, 'type': content_type},
+        salt=UPLOAD_TOKEN_SALT,
+        compress=True,
+    )
+    return {'token': token, **storage.presigned_upload(name, content_type, file_size)}
+
+
+def create_uploaded_attachment(client_requirement, token, ip_address=None, user_agent=None):
+    """A pending attachment for a file uploaded to an upload slot; verified by the ingestion worker"""
+    try:
+        claims = signing.loads(token, salt=UPLOAD_TOKEN_SALT, max_age=UPLOAD_TOKEN_MAX_AGE)
+    except signing.BadSignature:
+        raise AttachmentUploadError('Invalid or expired upload token') from None
+    if FormAttachment.objects.filter(file=claims['name']).exists():
+        raise AttachmentUploadError(f'Upload "{claims["filename"]}" is already attached')
+    
+    return FormAttachment.objects.create(
+        client_requirement=client_requirement,
+        original_filename=claims['filename'],
+        file=claims['name'],
+        file_size=claims['size'],
+        mime_type=claims['type'],
+        status=AttachmentStatus.PENDING,
+        uploaded_by_ip=ip_address,
+        uploaded_by_user_agent=user_agent
+    )
+
+
+# ==================== INGESTION (off the request path) ====================
+
+def check_size(actual_size, declared_size):
+    if actual_size > settings.FORMS_MAX_ATTACHMENT_SIZE:
+        raise AttachmentIngestError(
+            f'File exceeds the {settings.FORMS_MAX_ATTACHMENT_SIZE // (1024 * 1024)}MB limit'
+        )
+    if declared_size and actual_size != declared_size:
+        raise AttachmentIngestError(
+            f'Size mismatch: declared {declared_size} bytes, received {actual_size}'
+        )
+
+
+def sniff_mime_type(head, file_name, declared=None):
+    """Detect the MIME type from the file's leading bytes, falling back to its name"""
+    guessed, _ = mimetypes.guess_type(file_name)
+    for signature, mime_type in FILE_SIGNATURES:
+        if head.startswith(signature):
+            # Office documents are zip containers; trust the extension for those
+            if mime_type == 'application/zip' and guessed and guessed.startswith('application/vnd.openxmlformats'):
+                return guessed
+            return mime_type
+    
+    return guessed or declared or 'application/octet-stream'
+
+
+def verify_uploaded_file(attachment):
+    """Check a file uploaded straight to storage, in place"""
+    storage, name = attachment.file.storage, attachment.file.name
+    if not storage.exists(name):
+        raise AttachmentIngestError('Uploaded file is missing')
+    
+    actual_size = storage.size(name)
+    try:
+        check_size(actual_size, attachment.file_size)
+    except AttachmentIngestError:
+        # Don't keep what the upload slot wasn't issued for
+        transaction.on_commit(lambda: storage.delete(name))
+        attachment.file = ''
+        raise
+    
+    head = storage.read_head(name, SNIFF_BYTES)
+    attachment.mime_type = sniff_mime_type(head, attachment.original_filename, attachment.mime_type)
+    return actual_size
+
+
+def ingest_attachment(attachment):
+    """Verify a staged attachment and move it into storage (or verify a direct upload)"""
+    staged_path = attachment.staged_path
+    try:
+        if not staged_path and attachment.file:
+            actual_size = verify_uploaded_file(attachment)
+        else:
+            if not staged_path or not os.path.exists(staged_path):
+                raise AttachmentIngestError('Staged file is missing')
+            
+            actual_size = os.path.getsize(staged_path)
+            check_size(actual_size, attachment.file_size)
+            
+            with open(staged_path, 'rb') as fh:
+                head = fh.read(SNIFF_BYTES)
+                attachment.mime_type = sniff_mime_type(head, attachment.original_filename, attachment.mime_type)
+                fh.seek(0)
+                attachment.file.save(attachment.original_filename, File(fh), save=False)
+        
+        attachment.file_size = actual_size
+        attachment.status = AttachmentStatus.STORED
+        attachment.error_message = None
+        
+    except Exception as e:
+        # Storage backends raise their own errors (e.g. botocore's ClientError).
+        # Fail the row whatever the cause: a rollback would leave it PENDING,
+        # to be claimed first again on every pass and block the queue.
+        if isinstance(e, (OSError, AttachmentIngestError)):
+            logger.warning('Attachment %s failed ingestion: %s', attachment.pk, e)
+        else:
+            logger.exception('Attachment %s failed ingestion', attachment.pk)
+        attachment.status = AttachmentStatus.FAILED
+        attachment.error_message = str(e)
+    
+    attachment.staged_path = None
+    attachment.processed_at = timezone.now()
+    attachment.save()
+    
+    # Keep the staged bytes until the row is committed so a rollback can retry
+    if staged_path:
+        transaction.on_commit(lambda: _discard_staged_file(staged_path))
+    return attachment.status
+
+
+def _discard_staged_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def process_pending_attachments(batch_size=20):
+    """
+    Ingest up to ``batch_size`` pending attachments. Rows are claimed with
+    SELECT ... FOR UPDATE SKIP LOCKED so several workers can run at once.
+    Returns the number of attachments processed.
+    """
+    processed = 0
+    for _ in range(batch_size):
+        with transaction.atomic():
+            attachment = (
+                FormAttachment.objects
+                .select_for_update(skip_locked=True)
+                .filter(status=AttachmentStatus.PENDING)
+                .order_by('id')
+                .first()
+            )
+            if attachment is None:
+                break
+            ingest_attachment(attachment)
+        processed += 1
+    return processed
+
+
+# ==================== IN-PROCESS WORKER ====================
+
+_wakeup = threading.Event()
+_worker_lock = threading.Lock()
+_worker_thread = None
+
+
+def _worker_loop():
+    while True:
+        _wakeup.wait()
+        _wakeup.clear()
+        try:
+            while process_pending_attachments():
+                pass
+        except Exception:
+            logger.exception('Attachment ingestion worker failed')
+        finally:
+            close_old_connections()
+
+
+def schedule_ingestion():
+    """
+    Wake the in-process ingestion thread once the current transaction
+    commits. A no-op when FORMS_INGEST_IN_PROCESS is off, in which case
+    the ``process_attachments`` command drains the queue.
+    """
+    if not settings.FORMS_INGEST_IN_PROCESS:
+        return
+    
+    def wake():
+        global _worker_thread
+        with _worker_lock:
+            if _worker_thread is None or not _worker_thread.is_alive():
+                _worker_thread = threading.Thread(
+                    target=_worker_loop, name='attachment-ingest', daemon=True
+                )
+                _worker_thread.start()
+        _wakeup.set()
+    
+    transaction.on_commit(wake)
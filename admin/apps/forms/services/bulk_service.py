@@ -0,0 +1,58 @@
+# admin/apps/forms/services/bulk_service.py
+"""
+Bulk status / priority / assignee changes for client requirements.
+
+Changes are applied to any queryset (checked rows, a whole filtered
+changelist, API filters) without loading the rows. The work is split into
+primary-key ranges of BULK_CHUNK_SIZE rows. Each range is one UPDATE in
+its own short transaction, so no lock is held on the whole set. Rows
+that already have the requested values are skipped. The returned count
+is therefore the number of rows that actually changed, summed from each
+UPDATE's own row count.
+
+``queryset.update()`` bypasses post_save, so the dashboard counters are
+refreshed here once everything has committed.
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from ..models.client_requirement import ClientRequirement
+from .live_service import publish_requirement_change
+from .stats_service import invalidate_requirement_stats
+
+BULK_CHUNK_SIZE = 1000
+BULK_FIELDS = ('status', 'priority', 'assigned_to')
+
+
+def bulk_update_requirements(queryset, changes, chunk_size=BULK_CHUNK_SIZE):
+    """
+    Apply `changes` (a dict of status, priority and/or assigned_to, where
+    assigned_to is a user or None) to every row `queryset` matches.
+    Returns the number of rows changed.
+    """
+    unknown = set(changes) - set(BULK_FIELDS)
+    if unknown or not changes:
+        raise ValueError(f'Bulk changes must be among {", ".join(BULK_FIELDS)}; got {", ".join(changes) or "none"}')
+
+    # Filters only: annotations and ordering have no place in an UPDATE
+    matching = ClientRequirement.objects.filter(pk__in=queryset.order_by().values('pk'))
+    # A row needs no update only if it already has every requested value
+    to_change = matching.exclude(**changes)
+
+    changed = 0
+    last_pk = None
+    while True:
+        remaining = to_change if last_pk is None else to_change.filter(pk__gt=last_pk)
+        # The chunk's upper bound: the chunk_size-th remaining primary key
+        upper_pk = next(iter(remaining.order_by('pk').values_list('pk', flat=True)[chunk_size - 1:chunk_size]), None)
+        chunk = remaining if upper_pk is None else remaining.filter(pk__lte=upper_pk)
+        with transaction.atomic():
+            changed += chunk.update(**changes, updated_at=timezone.now())
+        if upper_pk is None:
+            break
+        last_pk = upper_pk
+
+    if changed:
+        transaction.on_commit(invalidate_requirement_stats)
+        transaction.on_commit(publish_requirement_change)
+    return changed
@@ -0,0 +1,284 @@
+# admin/apps/forms/services/export_service.py
+"""
+Streaming export of client requirements as CSV, NDJSON or XLSX.
+
+Rows are read with ``.iterator(chunk_size=EXPORT_CHUNK_SIZE)``, a
+server-side cursor on PostgreSQL, as plain tuples (no model instances).
+They are encoded batch by batch, so memory stays flat whether 1k or 5M
+rows are exported. XLSX is written as a zip stream: sheets go out as
+they are produced and the workbook index is written last. A new sheet
+starts every 1,048,575 rows, Excel's per-sheet limit.
+
+Under ASGI, ``async_chunks`` feeds the response. Django would otherwise
+collect a synchronous iterator into a list before sending it.
+"""
+import csv
+import io
+import itertools
+import json
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .requirement_service import requirement_list_queryset
+
+EXPORT_CHUNK_SIZE = 2000  # Rows fetched per round trip
+ROWS_PER_WRITE = 500  # Rows encoded into each streamed chunk
+
+# (header, queryset field)
+EXPORT_COLUMNS = [
+    ('ID', 'id'),
+    ('Submitted', 'created_at'),
+    ('Status', 'status'),
+    ('Priority', 'priority'),
+    ('First name', 'first_name'),
+    ('Last name', 'last_name'),
+    ('Email', 'email'),
+    ('Phone', 'phone'),
+    ('Company', 'company'),
+    ('Services', 'services'),
+    ('Other service', 'other_service'),
+    ('Project description', 'project_description'),
+    ('Source', 'source'),
+    ('Assigned to', 'assigned_to'),
+    ('Attachments', 'attachments_total'),
+]
+EXPORT_KEYS = [key for _, key in EXPORT_COLUMNS]
+
+EXPORT_FORMATS = {
+    # format: (content type, file extension)
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'xlsx'),
+}
+
+
+def export_queryset(archive=False):
+    """Every live (or archived) requirement with its assignee and attachment count, newest first"""
+    return requirement_list_queryset(archive).order_by('-created_at', '-id')
+
+
+def export_rows(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield one tuple per requirement, in EXPORT_COLUMNS order"""
+    rows = queryset.values_list(
+        'id', 'created_at', 'status', 'priority', 'first_name', 'last_name', 'email', 'phone',
+        'company', 'services', 'other_service', 'project_description', 'source',
+        'assigned_to__first_name', 'assigned_to__last_name', 'assigned_to__email', 'attachments_total',
+    )
+    for row in rows.iterator(chunk_size=chunk_size):
+        *fields, assignee_first, assignee_last, assignee_email, attachments = row
+        fields[1] = fields[1].isoformat()
+        assignee = f'{assignee_first or ""} {assignee_last or ""}'.strip() or assignee_email
+        yield (*fields, assignee, attachments)
+
+
+def batched(rows, size=ROWS_PER_WRITE):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# ==================== CSV ====================
+
+def text_cell(value):
+    """Spreadsheet text for the list-valued (services) column"""
+    return '; '.join(value) if isinstance(value, list) else value
+
+
+def csv_cell(value):
+    if value is None:
+        return ''
+    value = text_cell(value)
+    # Submissions are public input: keep spreadsheets from evaluating them as formulas
+    if isinstance(value, str) and value[:1] in ('=', '+', '-', '@', '\t', '\r'):
+        return "'" + value
+    return value
+
+
+def csv_chunks(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write('\ufeff')  # BOM: Excel then reads the file as UTF-8
+    writer.writerow([header for header, _ in EXPORT_COLUMNS])
+    for batch in batched(rows):
+        writer.writerows([csv_cell(value) for value in row] for row in batch)
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+# ==================== NDJSON ====================
+
+def ndjson_chunks(rows):
+    for batch in batched(rows):
+        yield ''.join(
+            json.dumps(dict(zip(EXPORT_KEYS, row)), cls=DjangoJSONEncoder) + '\n' for row in batch
+        ).encode('utf-8')
+
+
+# ==================== XLSX ====================
+
+XLSX_MAX_ROWS = 1048576  # Per sheet, header included
+XLSX_MAX_CELL = 32767  # Characters per cell
+XML_INVALID_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+SPREADSHEET_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+RELATIONSHIP_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PACKAGE_RELATIONSHIP_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+
+class _ChunkSink:
+    """Write-only file for zipfile: collects the compressed bytes until they are streamed"""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, data):
+        self.parts.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self):
+        data = b''.join(self.parts)
+        self.parts = []
+        return data
+
+
+def column_letter(index):
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+COLUMN_LETTERS = [column_letter(index) for index in range(len(EXPORT_COLUMNS))]
+
+
+def xlsx_row(number, values):
+    cells = []
+    for letter, value in zip(COLUMN_LETTERS, values):
+        value = text_cell(value)
+        if value is None or value == '':
+            continue
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            cells.append(f'<c r="{letter}{number}"><v>{value}</v></c>')
+        else:
+            text = escape(XML_INVALID_CHARS.sub('', str(value))[:XLSX_MAX_CELL])
+            cells.append(f'<c r="{letter}{number}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+    return f'<row r="{number}">{"".join(cells)}</row>'
+
+
+def xlsx_chunks(rows):
+    sink = _ChunkSink()
+    headers = [header for header, _ in EXPORT_COLUMNS]
+    sheet_count = 0
+
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as package:
+        sheet = None
+        row_number = 0
+        for batch in batched(rows):
+            for row in batch:
+                if sheet is None or row_number == XLSX_MAX_ROWS:
+                    if sheet is not None:
+                        sheet.write(b'</sheetData></worksheet>')
+                        sheet.close()
+                    sheet_count += 1
+                    # Sizes aren't known up front on a stream, so allow zip64
+                    sheet = package.open(f'xl/worksheets/sheet{sheet_count}.xml', 'w', force_zip64=True)
+                    sheet.write(f'{XML_HEADER}<worksheet xmlns="{SPREADSHEET_NS}"><sheetData>'.encode('utf-8'))
+                    sheet.write(xlsx_row(1, headers).encode('utf-8'))
+                    row_number = 1
+                row_number += 1
+                sheet.write(xlsx_row(row_number, row).encode('utf-8'))
+            yield sink.take()
+
+        if sheet is None:
+            # No rows: a sheet with just the headers
+            sheet_count = 1
+            sheet = package.open('xl/worksheets/sheet1.xml', 'w')
+            sheet.write(f'{XML_HEADER}<worksheet xmlns="{SPREADSHEET_NS}"><sheetData>'.encode('utf-8'))
+            sheet.write(xlsx_row(1, headers).encode('utf-8'))
+        sheet.write(b'</sheetData></worksheet>')
+        sheet.close()
+
+        sheet_numbers = range(1, sheet_count + 1)
+        package.writestr('[Content_Types].xml', XML_HEADER + (
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            + ''.join(
+                f'<Override PartName="/xl/worksheets/sheet{n}.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                for n in sheet_numbers
+            ) +
+            '</Types>'
+        ))
+        package.writestr('_rels/.rels', XML_HEADER + (
+            f'<Relationships xmlns="{PACKAGE_RELATIONSHIP_NS}">'
+            f'<Relationship Id="rId1" Type="{RELATIONSHIP_NS}/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'
+        ))
+        package.writestr('xl/workbook.xml', XML_HEADER + (
+            f'<workbook xmlns="{SPREADSHEET_NS}" xmlns:r="{RELATIONSHIP_NS}"><sheets>'
+            + ''.join(
+                f'<sheet name="Requirements{"" if n == 1 else f" {n}"}" sheetId="{n}" r:id="rId{n}"/>'
+                for n in sheet_numbers
+            ) +
+            '</sheets></workbook>'
+        ))
+        package.writestr('xl/_rels/workbook.xml.rels', XML_HEADER + (
+            f'<Relationships xmlns="{PACKAGE_RELATIONSHIP_NS}">'
+            + ''.join(
+                f'<Relationship Id="rId{n}" Type="{RELATIONSHIP_NS}/worksheet" Target="worksheets/sheet{n}.xml"/>'
+                for n in sheet_numbers
+            ) +
+            '</Relationships>'
+        ))
+    yield sink.take()  # Central directory
+
+
+# ==================== STREAMING ====================
+
+ENCODERS = {
+    'csv': csv_chunks,
+    'ndjson': ndjson_chunks,
+    'xlsx': xlsx_chunks,
+}
+
+
+def export_chunks(queryset, export_format, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Encoded chunks (bytes) of the export of `queryset`, or of a list of
+    querysets one after the other (live requirements, then archived ones)
+    """
+    querysets = queryset if isinstance(queryset, list) else [queryset]
+    rows = itertools.chain.from_iterable(export_rows(queryset, chunk_size) for queryset in querysets)
+    return ENCODERS[export_format](rows)
+
+
+async def async_chunks(chunks):
+    """
+    Stream a synchronous chunk generator from an ASGI response. Each chunk
+    is produced on the request's sync thread, which owns the database
+    connection and its server-side cursor.
+    """
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    done = object()
+    while (chunk := await next_chunk(chunks, done)) is not done:
+        yield chunk
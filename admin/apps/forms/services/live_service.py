@@ -0,0 +1,282 @@
+# admin/apps/forms/services/live_service.py
+"""
+Live dashboard counters pushed to admin tabs over Server-Sent Events.
+
+Saves and deletes of ClientRequirement (see ``apps.forms.signals``) hand a
+change to the publisher thread once their transaction commits. The
+publisher coalesces bursts of changes, reads the counters once and sends
+the result out. The thread only runs in server processes (config.wsgi and
+config.asgi call ``enable_background_publishing``): a management command
+such as the archive cron publishes straight away instead, as it would
+exit before a daemon thread got to send anything.
+
+* on PostgreSQL with ``NOTIFY``; every process keeps a single ``LISTEN``
+  connection that feeds its broadcaster, so submissions handled by any
+  worker reach every open tab;
+* on other databases straight to the local broadcaster.
+
+The broadcaster fans each event out to the per-connection queues of the
+open streams, so any number of tabs costs one listener per process rather
+than one poller per tab. New tabs start from its latest event only while
+that is recent; an older one may have missed a change, so they read the
+counters instead.
+"""
+import asyncio
+import json
+import logging
+import queue
+import threading
+import time
+
+import psycopg
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections, connection, connections
+
+from .stats_service import get_requirement_stats
+
+logger = logging.getLogger(__name__)
+
+LIVE_CHANNEL = 'forms_live'
+COALESCE_WINDOW = 0.25  # seconds to gather a burst of changes into one event
+KEEPALIVE_INTERVAL = 15  # seconds between comment frames on an idle stream
+RECONNECT_DELAY = 5  # seconds before the listener retries a lost connection
+MAX_SUBMISSIONS_PER_EVENT = 10  # keeps NOTIFY payloads well under 8000 bytes
+SUBSCRIBER_QUEUE_SIZE = 20
+LATEST_EVENT_MAX_AGE = 30  # seconds a new tab may start from the last event instead of reading the counters
+
+
+# ==================== BROADCASTER ====================
+
+class Broadcaster:
+    """Fans events out to the asyncio queues of the open streams"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}
+        self._latest = None
+        self._latest_at = 0.0
+
+    def subscribe(self):
+        """Register a queue on the running event loop"""
+        subscriber = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers[subscriber] = asyncio.get_running_loop()
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.pop(subscriber, None)
+
+    @property
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+    def publish(self, event):
+        """Deliver an event to every subscriber; safe to call from any thread"""
+        with self._lock:
+            self._latest, self._latest_at = event, time.monotonic()
+            subscribers = list(self._subscribers.items())
+        for subscriber, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer, subscriber, event)
+            except RuntimeError:
+                # Loop already closed; the stream's finally block will unsubscribe
+                pass
+
+    def latest(self, max_age=LATEST_EVENT_MAX_AGE):
+        """The last event published, or None if there is none from the last `max_age` seconds"""
+        with self._lock:
+            if self._latest is not None and time.monotonic() - self._latest_at < max_age:
+                return self._latest
+        return None
+
+
+def _offer(subscriber, event):
+    # A stalled client only needs the newest counters, so drop the oldest event
+    if subscriber.full():
+        subscriber.get_nowait()
+    subscriber.put_nowait(event)
+
+
+broadcaster = Broadcaster()
+
+
+# ==================== PUBLISHER ====================
+
+_changes = queue.Queue()
+_publisher_lock = threading.Lock()
+_publisher_thread = None
+_background_publishing = False
+
+
+def enable_background_publishing():
+    """Coalesce changes on the publisher thread: for long-running server processes only"""
+    global _background_publishing
+    _background_publishing = True
+
+
+def live_submission(requirement):
+    """The fields pushed to the dashboard for a new submission"""
+    return {
+        'id': requirement.pk,
+        'full_name': requirement.full_name,
+        'email': requirement.email,
+        'created_at': requirement.created_at.isoformat() if requirement.created_at else None,
+    }
+
+
+def build_counts(stats):
+    return {
+        'new_forms': stats['new'],
+        'alerts': 0,
+        'notifications': 0,  # Same placeholder as notifications_unread_count
+        'total': stats['total'],
+        'today': stats['today'],
+        'unassigned': stats['unassigned'],
+        'status_counts': stats['status_counts'],
+    }
+
+
+def publish_requirement_change(submission=None):
+    """
+    Queue a counters refresh (and optionally a new-submission event), or
+    send it now outside server processes. Call after the change has
+    committed.
+    """
+    global _publisher_thread
+    if not _background_publishing:
+        try:
+            _publish([submission])
+        except Exception:
+            logger.exception('Live counters publish failed')
+        return
+    
+    with _publisher_lock:
+        if _publisher_thread is None or not _publisher_thread.is_alive():
+            _publisher_thread = threading.Thread(
+                target=_publisher_loop, name='forms-live-publisher', daemon=True
+            )
+            _publisher_thread.start()
+    _changes.put(submission)
+
+
+def _drain_changes():
+    """Block for one change, then collect whatever else arrives shortly after"""
+    changes = [_changes.get()]
+    time.sleep(COALESCE_WINDOW)
+    while True:
+        try:
+            changes.append(_changes.get_nowait())
+        except queue.Empty:
+            return changes
+
+
+def _publish(changes):
+    """Read the counters once and send them out with the new submissions among `changes`"""
+    # Nobody can hear a local-only publish without an open stream here
+    if connection.vendor != 'postgresql' and not broadcaster.subscriber_count:
+        return
+    submissions = [change for change in changes if change]
+    event = {
+        'counts': build_counts(get_requirement_stats()),
+        'submissions': submissions[-MAX_SUBMISSIONS_PER_EVENT:],
+    }
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_notify(%s, %s)', [LIVE_CHANNEL, json.dumps(event)])
+    else:
+        broadcaster.publish(event)
+
+
+def _publisher_loop():
+    while True:
+        changes = _drain_changes()
+        try:
+            _publish(changes)
+        except Exception:
+            logger.exception('Live counters publisher failed')
+        finally:
+            close_old_connections()
+
+
+# ==================== LISTENER (PostgreSQL) ====================
+
+_listener_lock = threading.Lock()
+_listener_thread = None
+
+
+def _ensure_listener():
+    global _listener_thread
+    if connections['default'].vendor != 'postgresql':
+        return
+    with _listener_lock:
+        if _listener_thread is None or not _listener_thread.is_alive():
+            _listener_thread = threading.Thread(
+                target=_listener_loop, name='forms-live-listener', daemon=True
+            )
+            _listener_thread.start()
+
+
+def _listener_loop():
+    while True:
+        try:
+            _listen()
+        except Exception:
+            logger.exception('Live counters listener lost its connection')
+        time.sleep(RECONNECT_DELAY)
+
+
+def _listen():
+    """
+    Hold one dedicated autocommit connection and relay NOTIFY payloads. It
+    is opened outside the connection pool: a pooled connection would keep
+    a pool slot for the life of the process (and leak it on every
+    reconnect, as closing it never returns it to the pool).
+    """
+    params = connections['default'].get_connection_params()
+    with psycopg.Connection.connect(**params, autocommit=True) as listen_connection:
+        listen_connection.execute(f'LISTEN {LIVE_CHANNEL}')
+        while True:
+            # Wakes up at least every KEEPALIVE_INTERVAL, even when no notification arrives
+            for notify in listen_connection.notifies(timeout=KEEPALIVE_INTERVAL):
+                try:
+                    broadcaster.publish(json.loads(notify.payload))
+                except ValueError:
+                    logger.warning('Ignoring malformed live counters payload')
+
+
+# ==================== STREAM ====================
+
+def format_sse(event, data):
+    return f'event: {event}\ndata: {json.dumps(data)}\n\n'
+
+
+async def event_stream():
+    """
+    Server-Sent Events for one admin tab: the current counters straight
+    away, then a ``submission`` event per new submission and a ``counts``
+    event whenever the counters change.
+    """
+    _ensure_listener()
+    subscriber = broadcaster.subscribe()
+    try:
+        yield f'retry: {RECONNECT_DELAY * 1000}\n\n'
+        latest = broadcaster.latest()
+        if latest is not None:
+            counts = latest['counts']
+        else:
+            counts = build_counts(await sync_to_async(get_requirement_stats)())
+        yield format_sse('counts', counts)
+
+        while True:
+            try:
+                event = await asyncio.wait_for(subscriber.get(), KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                yield ': keepalive\n\n'
+                continue
+            for submission in event['submissions']:
+                yield format_sse('submission', submission)
+            yield format_sse('counts', event['counts'])
+    finally:
+        broadcaster.unsubscribe(subscriber)
@@ -0,0 +1,103 @@
+# admin/apps/forms/services/requirement_service.py
+import json
+
+from django.db import connection
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from ..models.archived_client_requirement import ArchivedClientRequirement
+from ..models.archived_form_attachment import ArchivedFormAttachment
+from ..models.client_requirement import ClientRequirement
+from ..models.form_attachment import FormAttachment
+from .search_service import search_requirements
+
+
+def attachments_total(attachment_model=FormAttachment):
+    """
+    A requirement's attachment count as a correlated subquery rather than a
+    JOIN + GROUP BY: only evaluated for the rows actually fetched, and it
+    leaves filters (e.g. bulk updates by pk__in) free of grouping.
+    """
+    total = attachment_model.objects.filter(
+        client_requirement=OuterRef('pk')
+    ).order_by().values('client_requirement').annotate(total=Count('id')).values('total')
+    return Coalesce(Subquery(total), 0)
+
+
+# ?archive= modes: live and archived requirements together, or the archive alone
+ARCHIVE_INCLUDE = 'include'
+ARCHIVE_ONLY = 'only'
+
+
+def archive_mode(params):
+    """
+    ARCHIVE_INCLUDE for ?archive=1 (or =include), ARCHIVE_ONLY for
+    ?archive=only, otherwise None: live requirements only.
+    """
+    value = params.get('archive', '').lower()
+    if value == ARCHIVE_ONLY:
+        return ARCHIVE_ONLY
+    if value in ('1', 'true', 'yes', ARCHIVE_INCLUDE):
+        return ARCHIVE_INCLUDE
+    return None
+
+
+def archive_tables(mode):
+    """The tables `mode` reads, as `archive` flags: [False] live, [True] archive, or both"""
+    if mode == ARCHIVE_INCLUDE:
+        return [False, True]
+    return [mode == ARCHIVE_ONLY]
+
+
+def requirement_models(mode):
+    return [ArchivedClientRequirement if archive else ClientRequirement for archive in archive_tables(mode)]
+
+
+def requirement_list_queryset(archive=False):
+    """
+    Base queryset for requirement list pages: the assignee is joined and
+    attachments are counted. Live requirements only, unless `archive`.
+    Pass each of archive_tables() to cover an ?archive= mode.
+    """
+    if archive:
+        model, attachment_model = ArchivedClientRequirement, ArchivedFormAttachment
+    else:
+        model, attachment_model = ClientRequirement, FormAttachment
+    return model.objects.select_related('assigned_to').annotate(
+        attachments_total=attachments_total(attachment_model)
+    )
+
+
+# Query parameters filter_requirements() applies
+LIST_FILTER_PARAMS = ('status', 'assigned_to', 'service', 'search')
+
+
+def filter_requirements(queryset, params):
+    """
+    Apply the list pages' query-string filters (?status=, ?assigned_to=,
+    ?service=, ?search=) to `queryset`. Used by the list and export
+    endpoints and the API viewset alike.
+    """
+    status_filter = params.get('status')
+    if status_filter:
+        queryset = queryset.filter(status=status_filter)
+
+    assigned_to = params.get('assigned_to')
+    if assigned_to == 'none':
+        queryset = queryset.filter(assigned_to__isnull=True)
+    elif assigned_to and assigned_to.isdigit():
+        queryset = queryset.filter(assigned_to_id=assigned_to)
+
+    service = params.get('service')
+    if service:
+        if connection.vendor == 'postgresql':
+            queryset = queryset.filter(services__contains=[service])  # jsonb @>
+        else:
+            # No JSON containment lookup elsewhere (SQLite): match the quoted list item
+            queryset = queryset.filter(services__icontains=json.dumps(service))
+
+    search_query = params.get('search', '')
+    if search_query:
+        # Ranked full-text/trigram search
+        queryset = search_requirements(queryset, search_query)
+    return queryset
@@ -0,0 +1,47 @@
+# admin/apps/forms/services/search_service.py
+"""
+Ranked search over client requirements.
+
+On PostgreSQL this uses the trigger-maintained ``search_vector`` column
+(GIN indexed) for full-text matches and pg_trgm indexes for fuzzy
+name/email matches. Other backends (SQLite in tests) fall back to the
+original ``icontains`` filters with a constant rank.
+"""
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db import connection
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.functions import Cast, Greatest
+
+SEARCH_CONFIG = 'english'
+TRIGRAM_FIELDS = ['first_name', 'last_name', 'email']
+
+
+def search_requirements(queryset, query):
+    """Filter ``queryset`` to matches for ``query``, annotated with ``search_rank``"""
+    query = query.strip()
+    if not query:
+        return queryset
+    
+    if connection.vendor != 'postgresql':
+        return queryset.filter(
+            Q(first_name__icontains=query) |
+            Q(last_name__icontains=query) |
+            Q(email__icontains=query) |
+            Q(company__icontains=query) |
+            Q(project_description__icontains=query)
+        ).annotate(search_rank=Value(0.0, output_field=FloatField()))
+    
+    search_query = SearchQuery(query, search_type='websearch', config=SEARCH_CONFIG)
+    similarity = Greatest(*[TrigramSimilarity(field, query) for field in TRIGRAM_FIELDS])
+    
+    matches = Q(search_vector=search_query)
+    for field in TRIGRAM_FIELDS:
+        # `%` operator, served by the gin_trgm_ops indexes
+        matches |= Q(**{f'{field}__trigram_similar': query})
+    # Partial email/company fragments ("acme") hit the trigram indexes too
+    matches |= Q(email__icontains=query) | Q(company__icontains=query)
+    
+    # Cast to double precision so the rank round-trips exactly through cursors
+    return queryset.annotate(
+        search_rank=Cast(SearchRank(F('search_vector'), search_query) + similarity, FloatField())
+    ).filter(matches)
@@ -0,0 +1,64 @@
+# admin/apps/forms/services/stats_service.py
+"""
+Dashboard counters for client requirements.
+
+Every counter the dashboard polls for is computed in a single
+conditional-aggregation query and cached for a few seconds in the shared
+``default`` cache. The cache is dropped whenever a ClientRequirement is
+saved or deleted (see ``apps.forms.signals``), and by the bulk update and
+archive services, whose writes bypass signals. Since every process reads
+the same entry, a change made by any of them shows on every worker.
+"""
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from ..models.client_requirement import ClientRequirement
+
+STATS_CACHE_KEY = 'forms:client_requirement_stats'
+STATS_CACHE_TIMEOUT = 30  # seconds
+
+
+def compute_requirement_stats():
+    """Run the aggregate query (uncached)"""
+    # A half-open range on created_at (rather than created_at__date) stays sargable
+    today_start = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+    today_end = today_start + timedelta(days=1)
+    
+    aggregates = {
+        'total': Count('id'),
+        'today': Count('id', filter=Q(created_at__gte=today_start, created_at__lt=today_end)),
+        'unassigned': Count('id', filter=Q(assigned_to__isnull=True, status='new')),
+    }
+    for status, _ in ClientRequirement.STATUS_CHOICES:
+        aggregates[f'status_{status}'] = Count('id', filter=Q(status=status))
+    
+    row = ClientRequirement.objects.aggregate(**aggregates)
+    
+    status_counts = {
+        status: row[f'status_{status}']
+        for status, _ in ClientRequirement.STATUS_CHOICES
+    }
+    return {
+        'total': row['total'],
+        'new': status_counts['new'],
+        'contacted': status_counts['contacted'],
+        'today': row['today'],
+        'unassigned': row['unassigned'],
+        'status_counts': status_counts,
+    }
+
+
+def get_requirement_stats():
+    """Cached dashboard counters"""
+    stats = cache.get(STATS_CACHE_KEY)
+    if stats is None:
+        stats = compute_requirement_stats()
+        cache.set(STATS_CACHE_KEY, stats, STATS_CACHE_TIMEOUT)
+    return stats
+
+
+def invalidate_requirement_stats():
+    cache.delete(STATS_CACHE_KEY)
@@ -0,0 +1,80 @@
+# admin/apps/forms/services/storage_migration_service.py
+"""
+Copying attachment files from one storage backend to another.
+
+Every stored file of live and archived attachments is streamed from the
+source to the target under the same name, by a pool of threads. A copy
+only counts once the target's SHA-256 matches the source's. Only then is
+the source deleted, if that was asked for. Files the target already has
+with the same checksum are skipped, so an interrupted run can simply be
+repeated. Names don't change, so the database is not touched: switch
+FORMS_ATTACHMENT_STORAGE once the run is clean.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from ..models.archived_form_attachment import ArchivedFormAttachment
+from ..models.form_attachment import FormAttachment
+from ..storage import file_checksum
+
+# Outcomes of copy_file
+COPIED = 'copied'
+SKIPPED = 'skipped'  # Already in the target, same checksum
+MISSING = 'missing'  # Not in the source
+FAILED = 'failed'
+
+
+def stored_file_names():
+    """Names of every stored attachment file, live and archived"""
+    for model in (FormAttachment, ArchivedFormAttachment):
+        names = model.objects.exclude(file='').order_by('pk').values_list('file', flat=True)
+        yield from names.iterator(chunk_size=2000)
+
+
+def copy_file(name, source, target, delete_source=False):
+    """Copy one file and verify it. Returns (outcome, detail)."""
+    try:
+        if not source.exists(name):
+            return MISSING, None
+        checksum = file_checksum(source, name)
+
+        if target.exists(name):
+            if file_checksum(target, name) == checksum:
+                if delete_source:
+                    source.delete(name)
+                return SKIPPED, None
+            target.delete(name)  # A partial or stale copy
+
+        with source.open(name, 'rb') as fh:
+            saved_name = target.save(name, fh)
+        if saved_name != name:
+            target.delete(saved_name)
+            return FAILED, f'stored as {saved_name}'
+        if file_checksum(target, name) != checksum:
+            target.delete(name)
+            return FAILED, 'checksum mismatch after copy'
+
+        if delete_source:
+            source.delete(name)
+        return COPIED, None
+    except Exception as e:
+        return FAILED, str(e) or e.__class__.__name__
+
+
+def migrate_files(names, source, target, workers=8, delete_source=False):
+    """
+    Copy `names` from `source` to `target` with `workers` threads. Yields
+    (name, outcome, detail) as files finish. Names are submitted in
+    batches, so a million-file run doesn't queue a million futures.
+    """
+    def copy(name):
+        return (name, *copy_file(name, source, target, delete_source))
+
+    batch_size = workers * 4
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        batch = []
+        for name in names:
+            batch.append(name)
+            if len(batch) == batch_size:
+                yield from pool.map(copy, batch)
+                batch = []
+        yield from pool.map(copy, batch)
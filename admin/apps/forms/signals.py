@@ -0,0 +1,17 @@
+# admin/apps/forms/signals.py
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models.client_requirement import ClientRequirement
+from .services.live_service import live_submission, publish_requirement_change
+from .services.stats_service import invalidate_requirement_stats
+
+
+@receiver(post_save, sender=ClientRequirement)
+@receiver(post_delete, sender=ClientRequirement)
+def client_requirement_changed(sender, instance, created=False, **kwargs):
+    """Drop cached dashboard counters and push fresh ones once the change is committed"""
+    transaction.on_commit(invalidate_requirement_stats)
+    submission = live_submission(instance) if created else None
+    transaction.on_commit(lambda: publish_requirement_change(submission))
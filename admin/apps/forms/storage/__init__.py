@@ -0,0 +1,54 @@
+# admin/apps/forms/storage/__init__.py
+"""
+Attachment storage backends.
+
+FORMS_ATTACHMENT_STORAGES names the configured backends, as BACKEND and
+OPTIONS dicts like Django's STORAGES setting. FORMS_ATTACHMENT_STORAGE
+picks the one ``FormAttachment.file`` uses. Besides the Storage API, each
+backend provides:
+
+- ``signed_url(name, filename=None)``: a download link that expires after
+  FORMS_ATTACHMENT_URL_EXPIRY seconds
+- ``presigned_upload(name, content_type, max_size)``: a URL and form fields
+  a browser can POST the file to. On S3 the bytes go straight to the
+  bucket and never pass through the app servers.
+- ``read_head(name, size)``: the first bytes of a file, for type sniffing
+
+An object has the same name in every backend, so moving files between
+backends (``manage.py migrate_attachment_storage``) leaves the database
+alone.
+"""
+import hashlib
+from functools import cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import storages
+
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+
+def create_attachment_storage(alias):
+    """A new instance of the FORMS_ATTACHMENT_STORAGES backend named `alias`"""
+    try:
+        params = settings.FORMS_ATTACHMENT_STORAGES[alias]
+    except KeyError:
+        raise ImproperlyConfigured(
+            f'Unknown attachment storage "{alias}"; configured: {", ".join(settings.FORMS_ATTACHMENT_STORAGES)}'
+        ) from None
+    return storages.create_storage(params)
+
+
+@cache
+def attachment_storage():
+    """The active backend (FORMS_ATTACHMENT_STORAGE), used by the attachment FileFields"""
+    return create_attachment_storage(settings.FORMS_ATTACHMENT_STORAGE)
+
+
+def file_checksum(storage, name):
+    """SHA-256 of a stored file, read in chunks"""
+    digest = hashlib.sha256()
+    with storage.open(name, 'rb') as fh:
+        while chunk := fh.read(CHECKSUM_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,37 @@
+# admin/apps/forms/storage/s3.py
+from django.conf import settings
+from django.utils.http import content_disposition_header
+from storages.backends.s3 import S3Storage
+from storages.utils import clean_name
+
+
+class S3AttachmentStorage(S3Storage):
+    """
+    Attachments in S3 or an S3-compatible service (MinIO, R2...: set
+    endpoint_url, which browsers must be able to reach). Downloads are
+    presigned GETs and uploads presigned POST policies, so browsers read
+    and write the bucket directly. The bucket needs a CORS rule allowing
+    POST from the customer site.
+    """
+
+    def signed_url(self, name, filename=None):
+        parameters = None
+        if filename:
+            parameters = {'ResponseContentDisposition': content_disposition_header(True, filename)}
+        return self.url(name, parameters=parameters, expire=settings.FORMS_ATTACHMENT_URL_EXPIRY)
+
+    def presigned_upload(self, name, content_type, max_size):
+        # The policy pins the key and content type; S3 itself rejects bodies over max_size
+        post = self.bucket.meta.client.generate_presigned_post(
+            self.bucket_name,
+            self._normalize_name(clean_name(name)),
+            Fields={'Content-Type': content_type},
+            Conditions=[{'Content-Type': content_type}, ['content-length-range', 1, max_size]],
+            ExpiresIn=settings.FORMS_ATTACHMENT_URL_EXPIRY,
+        )
+        return {'method': 'POST', 'url': post['url'], 'fields': post['fields']}
+
+    def read_head(self, name, size):
+        # A ranged GET: opening the file would download all of it
+        response = self.bucket.Object(self._normalize_name(clean_name(name))).get(Range=f'bytes=0-{size - 1}')
+        return response['Body'].read()
@@ -0,0 +1,700 @@
+# admin/apps/forms/tests.py
+import base64
+import csv
+import io
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connections
+from django.db.models.fields.files import FieldFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.accounts.models import AdminUser
+
+from .models.archived_client_requirement import ArchivedClientRequirement
+from .models.client_requirement import ClientRequirement
+from .api.views import ClientRequirementViewSet
+from .models.form_attachment import FormAttachment
+from .pagination import RANKED_KEYS, InvalidCursor, decode_cursor, encode_cursor
+from .services.archive_service import archive_requirements, restore_requirements
+from .services.attachment_service import create_pending_attachment, process_pending_attachments, stage_bytes
+from .services.bulk_service import bulk_update_requirements
+from .services import attachment_service, live_service
+from .services.stats_service import get_requirement_stats
+
+
+class ListQueryBudgetTests(TestCase):
+    """
+    The list endpoints must cost a fixed number of queries regardless of
+    how many rows, assignees and attachments are on the page.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = AdminUser.objects.create_superuser(email='admin@dycetix.test', password='pw')
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def create_requirements(self, count, attachments_each=2):
+        for _ in range(count):
+            n = ClientRequirement.objects.count()
+            assignee = AdminUser.objects.create_user(
+                email=f'staff{n}@dycetix.test', first_name='Staff', last_name=str(n)
+            )
+            requirement = ClientRequirement.objects.create(
+                first_name='Test',
+                last_name=f'Client {n}',
+                email=f'client{n}@example.com',
+                services=['software'],
+                project_description='Build an app',
+                assigned_to=assignee,
+            )
+            for i in range(attachments_each):
+                FormAttachment.objects.create(
+                    client_requirement=requirement,
+                    original_filename=f'brief-{i}.pdf',
+                    file_size=1024,
+                    mime_type='application/pdf',
+                    status='stored',
+                )
+
+    def assert_constant_queries(self, url, expected):
+        for rows in (3, 20):
+            self.create_requirements(rows)
+            get_requirement_stats()  # Counters come from the shared cache
+            with self.assertNumQueries(expected):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_client_requirements_list(self):
+        # session, user, cached stats, page
+        response = self.assert_constant_queries('/api/forms/client-requirements/', 4)
+        row = response.json()['data'][0]
+        self.assertEqual(row['attachments_count'], 2)
+        self.assertTrue(row['assigned_to'].startswith('Staff '))
+
+    def test_admin_changelist(self):
+        # session, user, filtered count, total count, page
+        self.assert_constant_queries('/admin/forms/clientrequirement/', 5)
+
+
+class KeysetPaginationTests(TestCase):
+    url = '/api/forms/client-requirements/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = AdminUser.objects.create_superuser(email='admin@dycetix.test', password='pw')
+        ClientRequirement.objects.bulk_create([
+            ClientRequirement(
+                first_name='Page',
+                last_name=str(i),
+                email=f'page{i}@example.com',
+                company='Acme' if i % 2 else 'Globex',
+                services=['software'],
+                project_description='Build an app',
+            )
+            for i in range(11)
+        ])
+        # Three runs of identical timestamps, so most page boundaries fall inside a tie
+        now = timezone.now()
+        for i, requirement in enumerate(ClientRequirement.objects.order_by('pk')):
+            ClientRequirement.objects.filter(pk=requirement.pk).update(created_at=now - timedelta(minutes=i // 4))
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def walk(self, params, limit=3):
+        """Follow next_cursor to the end and return the ids in page order"""
+        ids = []
+        cursor = None
+        for _ in range(20):
+            query = {**params, 'limit': limit, **({'cursor': cursor} if cursor else {})}
+            body = self.client.get(self.url, query).json()
+            self.assertLessEqual(len(body['data']), limit)
+            ids.extend(row['id'] for row in body['data'])
+            cursor = body['next_cursor']
+            self.assertEqual(body['has_more'], cursor is not None)
+            if cursor is None:
+                return ids
+        self.fail('Pagination did not end')
+
+    def test_pages_follow_each_other_through_ties(self):
+        expected = list(ClientRequirement.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        for limit in (1, 3, 4, 50):
+            self.assertEqual(self.walk({}, limit), expected)
+
+    def test_ranked_search_pages(self):
+        ids = self.walk({'search': 'acme'}, limit=2)
+        self.assertEqual(len(ids), 5)
+        self.assertEqual(len(set(ids)), 5)
+        self.assertEqual(set(ids), set(ClientRequirement.objects.filter(company='Acme').values_list('id', flat=True)))
+
+    def test_cursor_round_trip(self):
+        requirement = ClientRequirement.objects.order_by('pk').first()
+        requirement.search_rank = 0.25
+        self.assertEqual(
+            decode_cursor(encode_cursor(requirement, RANKED_KEYS), RANKED_KEYS),
+            [0.25, requirement.created_at, requirement.pk],
+        )
+
+    def test_malformed_and_tampered_cursors_are_rejected(self):
+        def encode(values):
+            return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip('=')
+
+        page = self.client.get(self.url, {'limit': 2}).json()
+        ranked_page = self.client.get(self.url, {'limit': 2, 'search': 'acme'}).json()
+        bad_cursors = [
+            'not a cursor!',
+            encode({'created_at': '2024-01-01T00:00:00+00:00', 'id': 1}),
+            encode(['2024-01-01T00:00:00+00:00', 'one']),
+            encode(['yesterday', 1]),
+            encode(['2024-01-01T00:00:00+00:00', 1, 2]),
+            ranked_page['next_cursor'],  # A search cursor on the plain list
+        ]
+        for cursor in bad_cursors:
+            with self.subTest(cursor=cursor):
+                response = self.client.get(self.url, {'cursor': cursor})
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {'success': False, 'error': 'Invalid cursor'})
+
+        with self.assertRaises(InvalidCursor):
+            decode_cursor(page['next_cursor'], RANKED_KEYS)  # And a plain cursor on a search
+
+    def test_api_viewset_pages(self):
+        ids = []
+        url = '/api/client-requirements/?limit=4'
+        while url:
+            body = self.client.get(url).json()
+            self.assertLessEqual(len(body['results']), 4)
+            ids.extend(row['id'] for row in body['results'])
+            url = body['next']
+        expected = list(ClientRequirement.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+
+        row = self.client.get('/api/client-requirements/', {'limit': 1}).json()['results'][0]
+        self.assertEqual((row['services'], row['service_display']), (['software'], 'Software Development'))
+
+        response = self.client.get('/api/client-requirements/', {'cursor': 'bogus'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('cursor', response.json())
+
+
+@override_settings(EMAIL_QUEUE_IN_PROCESS=False)  # Creating a requirement queues its emails
+class StatsCacheTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = AdminUser.objects.create_superuser(email='admin@dycetix.test', password='pw')
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.admin)
+
+    def stats(self):
+        return self.client.get('/api/forms/admin/stats/').json()['data']
+
+    def test_saves_refresh_the_cached_counters(self):
+        self.assertEqual((self.stats()['total_forms'], self.stats()['new_forms']), (0, 0))
+        with self.captureOnCommitCallbacks(execute=True):
+            requirement = ClientRequirement.objects.create(
+                first_name='Stats', last_name='Cache', email='stats@example.com',
+                services=['software'], project_description='Build an app',
+            )
+        self.assertEqual((self.stats()['total_forms'], self.stats()['new_forms']), (1, 1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            requirement.status = 'contacted'
+            requirement.save()
+        self.assertEqual((self.stats()['total_forms'], self.stats()['new_forms']), (1, 0))
+
+
+@override_settings(
+    RATE_LIMIT_ENABLED=True,
+    RATE_LIMITS={'client_requirement_submit': {'ip': '3/m', 'email': '2/h'}},
+)
+class SubmissionRateLimitTests(TestCase):
+    url = '/api/forms/submit/client-requirement/'
+
+    def submit(self, email, ip='203.0.113.7'):
+        return self.client.post(self.url, json.dumps({
+            'firstName': 'Rate',
+            'lastName': 'Limit',
+            'email': email,
+            'services': ['software'],
+            'projectDetails': 'Build an app',
+        }), content_type='application/json', REMOTE_ADDR=ip)
+
+    def test_per_email_limit(self):
+        for _ in range(2):
+            self.assertEqual(self.submit('Flood@example.com').status_code, 200)
+        response = self.submit('flood@example.com')
+        self.assertEqual(response.status_code, 429)
+        self.assertGreater(int(response['Retry-After']), 0)
+        self.assertEqual(ClientRequirement.objects.count(), 2)
+
+    def test_per_ip_limit(self):
+        for i in range(3):
+            self.assertEqual(self.submit(f'client{i}@example.com').status_code, 200)
+        self.assertEqual(self.submit('client3@example.com').status_code, 429)
+        self.assertEqual(self.submit('client3@example.com', ip='198.51.100.1').status_code, 200)
+
+
+class BulkUpdateTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = AdminUser.objects.create_superuser(email='admin@dycetix.test', password='pw')
+        ClientRequirement.objects.bulk_create([
+            ClientRequirement(
+                first_name='Bulk',
+                last_name=str(i),
+                email=f'bulk{i}@example.com',
+                services=['software'],
+                project_description='Build an app',
+                status='contacted' if i < 3 else 'new',
+            )
+            for i in range(10)
+        ])
+
+    def test_counts_only_changed_rows_across_chunks(self):
+        changed = bulk_update_requirements(ClientRequirement.objects.all(), {'status': 'contacted'}, chunk_size=3)
+        self.assertEqual(changed, 7)
+        self.assertEqual(ClientRequirement.objects.filter(status='contacted').count(), 10)
+
+    def test_filtered_changes(self):
+        queryset = ClientRequirement.objects.filter(status='new')
+        self.assertEqual(bulk_update_requirements(queryset, {'priority': 'high', 'assigned_to': self.admin}), 7)
+        self.assertEqual(ClientRequirement.objects.filter(priority='high', assigned_to=self.admin).count(), 7)
+
+    def test_admin_action_message(self):
+        self.client.force_login(self.admin)
+        response = self.client.post('/admin/forms/clientrequirement/', {
+            'action': 'mark_as_contacted',
+            '_selected_action': list(ClientRequirement.objects.values_list('pk', flat=True)),
+        }, follow=True)
+        self.assertContains(response, '7 requirement(s) marked as contacted.')
+
+    def test_api_bulk_update(self):
+        view = ClientRequirementViewSet.as_view({'post': 'bulk_update'})
+        factory = APIRequestFactory()
+
+        request = factory.post('/bulk_update/', {'status': 'archived'}, format='json')
+        force_authenticate(request, self.admin)
+        self.assertEqual(view(request).status_code, 400)  # No ids or filters
+
+        request = factory.post('/bulk_update/?status=new', {'status': 'archived'}, format='json')
+        force_authenticate(request, self.admin)
+        response = view(request)
+        self.assertEqual(response.data, {'updated': 7})
+        self.assertEqual(ClientRequirement.objects.filter(status='archived').count(), 7)
+
+    def test_api_bulk_update_by_service(self):
+        ClientRequirement.objects.filter(last_name__in=['0', '5']).update(services=['web', 'software'])
+        ClientRequirement.objects.filter(last_name='6').update(services=['webdesign'])
+        view = ClientRequirementViewSet.as_view({'post': 'bulk_update'})
+        request = APIRequestFactory().post('/bulk_update/?service=web', {'priority': 'high'}, format='json')
+        force_authenticate(request, self.admin)
+        self.assertEqual(view(request).data, {'updated': 2})
+        self.assertEqual(
+            set(ClientRequirement.objects.filter(priority='high').values_list('last_name', flat=True)), {'0', '5'}
+        )
+
+
+class ExportTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = AdminUser.objects.create_superuser(email='admin@dycetix.test', password='pw')
+        ClientRequirement.objects.bulk_create([
+            ClientRequirement(
+                first_name='Export',
+                last_name=str(i),
+                email=f'export{i}@example.com',
+                company='=HYPERLINK("x")' if i == 0 else 'Acme',
+                services=['software', 'design'],
+                project_description='Build an app',
+                status='new' if i < 4 else 'contacted',
+                assigned_to=cls.admin if i == 0 else None,
+            )
+            for i in range(6)
+        ])
+
+    def export(self, path):
+        response = self.client.get(path)
+        return response, b''.join(response.streaming_content)
+
+    def test_requires_authentication(self):
+        self.assertEqual(self.client.get('/api/forms/client-requirements/export.csv').status_code, 401)
+
+    def test_csv_uses_list_filters(self):
+        self.client.force_login(self.admin)
+        response, content = self.export('/api/forms/client-requirements/export.csv?status=new')
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        rows = list(csv.reader(io.StringIO(content.decode('utf-8-sig'))))
+        self.assertEqual(len(rows), 5)  # Header + 4 new
+        self.assertEqual(rows[0][0], 'ID')
+        first = next(row for row in rows[1:] if row[5] == '0')
+        self.assertEqual(first[8], '\'=HYPERLINK("x")')  # Not evaluated as a formula
+        self.assertEqual(first[9], 'software; design')
+        self.assertEqual(first[13], 'admin@dycetix.test')
+
+    def test_ndjson_and_xlsx(self):
+        self.client.force_login(self.admin)
+        _, content = self.export('/api/forms/client-requirements/export.ndjson')
+        records = [json.loads(line) for line in content.decode().splitlines()]
+        self.assertEqual(len(records), 6)
+        self.assertEqual(records[0]['services'], ['software', 'design'])
+
+        _, content = self.export('/api/forms/client-requirements/export.xlsx')
+        with zipfile.ZipFile(io.BytesIO(content)) as workbook:
+            self.assertIsNone(workbook.testzip())
+            sheet = workbook.read('xl/worksheets/sheet1.xml').decode()
+        self.assertEqual(sheet.count('<row '), 7)
+        self.assertEqual(self.client.get('/api/forms/client-requirements/export.pdf').status_code, 404)
+
+
+class ArchiveTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = AdminUser.objects.create_superuser(email='admin@dycetix.test', password='pw')
+        ClientRequirement.objects.bulk_create([
+            ClientRequirement(
+                first_name='Archive',
+                last_name=str(i),
+                email=f'archive{i}@example.com',
+                services=['software'],
+                project_description='Build an app',
+                status='archived' if i < 4 else 'new',
+            )
+            for i in range(6)
+        ])
+        cls.old = list(ClientRequirement.objects.filter(last_name__in=['0', '1', '2']).order_by('pk'))
+        ClientRequirement.objects.filter(pk__in=[r.pk for r in cls.old]).update(
+            updated_at=timezone.now() - timedelta(days=90)
+        )
+        ClientRequirement.objects.filter(last_name='4').update(updated_at=timezone.now() - timedelta(days=90))
+        FormAttachment.objects.create(
+            client_requirement=cls.old[0], original_filename='brief.pdf', file_size=10,
+            mime_type='application/pdf', status='stored',
+        )
+
+    def test_moves_only_long_archived_requirements(self):
+        self.assertEqual(archive_requirements(days=30, chunk_size=2), 3)
+        self.assertEqual(ClientRequirement.objects.count(), 3)  # Recently archived and open ones stay
+        archived = ArchivedClientRequirement.objects.get(pk=self.old[0].pk)
+        self.assertEqual(archived.email, 'archive0@example.com')
+        self.assertEqual(archived.attachments.get().original_filename, 'brief.pdf')
+        self.assertFalse(FormAttachment.objects.exists())
+
+        self.client.force_login(self.admin)
+        live = self.client.get('/api/forms/client-requirements/').json()
+        self.assertEqual(len(live['data']), 3)
+        archive = self.client.get('/api/forms/client-requirements/?archive=only').json()
+        self.assertEqual([row['attachments_count'] for row in archive['data']].count(1), 1)
+        self.assertEqual({row['id'] for row in archive['data']}, {r.pk for r in self.old})
+
+    def test_archive_toggle_includes_archived_requirements(self):
+        archive_requirements(days=30)
+        # Interleave the two tables' timestamps, so every page mixes them
+        now = timezone.now()
+        for table in (ClientRequirement, ArchivedClientRequirement):
+            for requirement in table.objects.all():
+                table.objects.filter(pk=requirement.pk).update(created_at=now - timedelta(minutes=requirement.pk))
+        expected = sorted([  # Newest first: lowest pk
+            *ClientRequirement.objects.values_list('pk', flat=True),
+            *ArchivedClientRequirement.objects.values_list('pk', flat=True),
+        ])
+        self.client.force_login(self.admin)
+
+        ids, cursor = [], None
+        while True:
+            body = self.client.get('/api/forms/client-requirements/', {
+                'archive': '1', 'limit': 2, **({'cursor': cursor} if cursor else {}),
+            }).json()
+            ids.extend(row['id'] for row in body['data'])
+            cursor = body['next_cursor']
+            if cursor is None:
+                break
+        self.assertEqual(ids, expected)
+
+        url, api_ids = '/api/client-requirements/?archive=1&limit=4', []
+        while url:
+            body = self.client.get(url).json()
+            api_ids.extend(row['id'] for row in body['results'])
+            url = body['next']
+        self.assertEqual(api_ids, expected)
+
+        archived_pk = self.old[0].pk
+        for path in (f'/api/forms/client-requirements/{archived_pk}/', f'/api/client-requirements/{archived_pk}/'):
+            with self.subTest(path=path):
+                self.assertEqual(self.client.get(path).status_code, 404)
+                self.assertEqual(self.client.get(path, {'archive': '1'}).status_code, 200)
+        live_pk = ClientRequirement.objects.first().pk
+        self.assertEqual(self.client.get(f'/api/client-requirements/{live_pk}/', {'archive': 'only'}).status_code, 404)
+
+        export = self.client.get('/api/forms/client-requirements/export.ndjson', {'archive': '1'})
+        exported = [json.loads(line)['id'] for line in b''.join(export.streaming_content).splitlines()]
+        self.assertEqual(sorted(exported), expected)  # Live rows, then archived ones
+
+    def test_restore(self):
+        archive_requirements(days=30)
+        restored = restore_requirements(ArchivedClientRequirement.objects.filter(pk=self.old[0].pk))
+        self.assertEqual(restored, 1)
+        requirement = ClientRequirement.objects.get(pk=self.old[0].pk)
+        self.assertEqual(requirement.attachments.count(), 1)
+        self.assertEqual(archive_requirements(days=30), 0)  # updated_at was reset
+
+
+@override_settings(RATE_LIMIT_ENABLED=False, FORMS_INGEST_IN_PROCESS=False, EMAIL_QUEUE_IN_PROCESS=False)
+class MultipartSubmissionTests(TestCase):
+    url = '/api/forms/submit/client-requirement/'
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media_override = override_settings(
+            MEDIA_ROOT=media_root,
+            FORMS_ATTACHMENT_STAGING_DIR=os.path.join(media_root, 'staging'),
+        )
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+
+    def submit(self, *files):
+        return self.client.post(self.url, {
+            'firstName': 'Multi',
+            'lastName': 'Part',
+            'email': 'multipart@example.com',
+            'services': ['software', 'design'],
+            'projectDetails': 'Build an app',
+            'files': list(files),
+        })
+
+    def test_attachments_are_staged_then_stored(self):
+        response = self.submit(
+            SimpleUploadedFile('brief.pdf', b'%PDF-1.4 brief', content_type='application/pdf'),
+            SimpleUploadedFile('logo.png', b'\x89PNG\r\n\x1a\n logo', content_type='application/octet-stream'),
+        )
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body['attachments_count'], 2)
+        self.assertEqual({attachment['status'] for attachment in body['attachments']}, {'pending'})
+        requirement = ClientRequirement.objects.get()
+        self.assertEqual(requirement.services, ['software', 'design'])
+
+        process_pending_attachments()
+        stored = dict(FormAttachment.objects.values_list('original_filename', 'mime_type'))
+        self.assertEqual(stored, {'brief.pdf': 'application/pdf', 'logo.png': 'image/png'})
+        self.assertEqual(set(FormAttachment.objects.values_list('status', flat=True)), {'stored'})
+
+    @override_settings(FORMS_MAX_SUBMISSION_SIZE=1024 * 1024)
+    def test_oversized_request_is_refused_before_reading(self):
+        response = self.submit(SimpleUploadedFile('big.pdf', b'%PDF-' + b'x' * 1536 * 1024))
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(response.json()['error'], 'Submission exceeds the 1MB limit')
+        self.assertFalse(ClientRequirement.objects.exists())
+
+    @override_settings(FORMS_MAX_ATTACHMENT_SIZE=1024 * 1024)
+    def test_oversized_file_is_stopped_by_the_upload_handler(self):
+        # Within the request limit, so it is streamed (in 64KB chunks) until the file limit is crossed
+        response = self.submit(SimpleUploadedFile('big.pdf', b'%PDF-' + b'x' * 1536 * 1024))
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(response.json()['error'], 'File "big.pdf" exceeds the 1MB limit')
+        self.assertFalse(ClientRequirement.objects.exists())
+
+    @override_settings(FORMS_MAX_ATTACHMENTS=1)
+    def test_too_many_files(self):
+        response = self.submit(SimpleUploadedFile('a.pdf', b'%PDF-a'), SimpleUploadedFile('b.pdf', b'%PDF-b'))
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(response.json()['error'], 'Too many files (maximum 1)')
+        self.assertFalse(ClientRequirement.objects.exists())
+
+
+@override_settings(RATE_LIMIT_ENABLED=False, FORMS_INGEST_IN_PROCESS=False, EMAIL_QUEUE_IN_PROCESS=False)
+class DirectUploadTests(TestCase):
+    content = b'%PDF-1.4 direct upload'
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media_override = override_settings(MEDIA_ROOT=media_root)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+
+    def upload(self, declared_size=None):
+        response = self.client.post('/api/forms/uploads/', json.dumps({
+            'files': [{'name': 'brief.pdf', 'size': declared_size or len(self.content), 'type': 'application/pdf'}],
+        }), content_type='application/json')
+        slot = response.json()['uploads'][0]
+        upload = self.client.post(slot['url'], {**slot['fields'], 'file': SimpleUploadedFile('brief.pdf', self.content)})
+        self.assertEqual(upload.status_code, 204)
+        return slot
+
+    def submit(self, tokens):
+        return self.client.post('/api/forms/submit/client-requirement/', json.dumps({
+            'firstName': 'Direct',
+            'lastName': 'Upload',
+            'email': 'direct@example.com',
+            'services': ['software'],
+            'projectDetails': 'Build an app',
+            'uploads': tokens,
+        }), content_type='application/json').json()
+
+    def test_upload_submit_and_download(self):
+        slot = self.upload()
+        # Each upload URL takes one file
+        again = self.client.post(slot['url'], {'file': SimpleUploadedFile('other.pdf', b'%PDF-')})
+        self.assertEqual(again.status_code, 409)
+
+        self.assertEqual(self.submit([slot['token'], 'forged-token'])['attachments_count'], 1)
+        process_pending_attachments()
+        attachment = FormAttachment.objects.get()
+        self.assertEqual((attachment.status, attachment.mime_type), ('stored', 'application/pdf'))
+
+        download = self.client.get(attachment.download_url)
+        self.assertEqual(b''.join(download.streaming_content), self.content)
+        self.assertIn('brief.pdf', download['Content-Disposition'])
+        self.assertEqual(self.client.get('/api/forms/attachments/forged-token/').status_code, 403)
+
+    def test_size_mismatch_fails_and_removes_the_upload(self):
+        slot = self.upload(declared_size=len(self.content) + 10)
+        self.submit([slot['token']])
+        with self.captureOnCommitCallbacks(execute=True):
+            process_pending_attachments()
+        attachment = FormAttachment.objects.get()
+        self.assertEqual(attachment.status, 'failed')
+        self.assertIn('Size mismatch', attachment.error_message)
+        self.assertFalse(attachment.file)
+
+
+class StorageError(Exception):
+    """Stands in for a storage backend's own exception type (e.g. botocore's ClientError)"""
+
+
+@override_settings(FORMS_INGEST_IN_PROCESS=False, EMAIL_QUEUE_IN_PROCESS=False)
+class AttachmentIngestionTests(TestCase):
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media_override = override_settings(
+            MEDIA_ROOT=media_root,
+            FORMS_ATTACHMENT_STAGING_DIR=os.path.join(media_root, 'staging'),
+        )
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+        self.requirement = ClientRequirement.objects.create(
+            first_name='Ingest',
+            last_name='Queue',
+            email='ingest@example.com',
+            services=['software'],
+            project_description='Build an app',
+        )
+
+    def stage(self, file_name, content, declared_size=None):
+        return create_pending_attachment(
+            self.requirement, stage_bytes(content), file_name, declared_size or len(content), 'application/octet-stream'
+        )
+
+    def test_stores_and_sniffs_the_type(self):
+        attachment = self.stage('scan.jpg', b'\xff\xd8\xff\xe0 photo')
+        staged_path = attachment.staged_path
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(process_pending_attachments(), 1)
+        attachment.refresh_from_db()
+        self.assertEqual((attachment.status, attachment.mime_type), ('stored', 'image/jpeg'))
+        self.assertIsNone(attachment.staged_path)
+        self.assertEqual(attachment.file.read(), b'\xff\xd8\xff\xe0 photo')
+        self.assertFalse(os.path.exists(staged_path))  # Discarded once committed
+
+    def test_verification_failures(self):
+        missing = self.stage('missing.pdf', b'%PDF-')
+        os.remove(missing.staged_path)
+        mismatch = self.stage('short.pdf', b'%PDF-', declared_size=99)
+        self.assertEqual(process_pending_attachments(), 2)
+        self.assertEqual(
+            dict(FormAttachment.objects.values_list('pk', 'error_message')),
+            {missing.pk: 'Staged file is missing', mismatch.pk: 'Size mismatch: declared 99 bytes, received 5'},
+        )
+        self.assertEqual(set(FormAttachment.objects.values_list('status', flat=True)), {'failed'})
+
+    def test_storage_error_fails_the_row_and_the_queue_moves_on(self):
+        broken = self.stage('broken.pdf', b'%PDF-broken')
+        healthy = self.stage('healthy.pdf', b'%PDF-healthy')
+        original_save = FieldFile.save
+
+        def flaky_save(field_file, name, content, save=True):
+            if name == 'broken.pdf':
+                raise StorageError('AccessDenied')
+            return original_save(field_file, name, content, save)
+
+        with mock.patch.object(FieldFile, 'save', flaky_save), self.assertLogs(attachment_service.logger, 'ERROR'):
+            self.assertEqual(process_pending_attachments(), 2)
+
+        broken.refresh_from_db()
+        healthy.refresh_from_db()
+        self.assertEqual((broken.status, broken.error_message), ('failed', 'AccessDenied'))
+        self.assertEqual(healthy.status, 'stored')
+        self.assertEqual(process_pending_attachments(), 0)  # Nothing left to reclaim
+
+
+class LiveListenerTests(SimpleTestCase):
+
+    def test_listens_outside_the_pool(self):
+        listen_connection = mock.MagicMock()
+        listen_connection.notifies.side_effect = [
+            iter([SimpleNamespace(payload='{"counts": {"total": 3}}'), SimpleNamespace(payload='not json')]),
+            iter([]),  # Idle KEEPALIVE_INTERVAL
+            ConnectionError('server closed the connection'),
+        ]
+        with mock.patch.object(live_service.psycopg.Connection, 'connect') as connect, \
+                mock.patch.object(connections['default'], 'get_new_connection') as get_new_connection, \
+                mock.patch.object(live_service.broadcaster, 'publish') as publish:
+            connect.return_value.__enter__.return_value = listen_connection
+            with self.assertRaises(ConnectionError):
+                live_service._listen()
+
+        get_new_connection.assert_not_called()
+        self.assertIs(connect.call_args.kwargs['autocommit'], True)
+        listen_connection.execute.assert_called_once_with(f'LISTEN {live_service.LIVE_CHANNEL}')
+        listen_connection.notifies.assert_called_with(timeout=live_service.KEEPALIVE_INTERVAL)
+        publish.assert_called_once_with({'counts': {'total': 3}})
+        connect.return_value.__exit__.assert_called_once()  # Closed before reconnecting
+
+
+class LivePublishTests(SimpleTestCase):
+
+    def test_commands_notify_synchronously(self):
+        # No config.wsgi/config.asgi here, as in the archive cron
+        postgres = mock.MagicMock(vendor='postgresql')
+        stats = {'new': 1, 'total': 2, 'today': 1, 'unassigned': 1, 'status_counts': {'new': 1}}
+        with mock.patch.object(live_service, 'connection', postgres), \
+                mock.patch.object(live_service, 'get_requirement_stats', return_value=stats), \
+                mock.patch.object(live_service.threading, 'Thread') as thread:
+            live_service.publish_requirement_change({'id': 7})
+
+        thread.assert_not_called()
+        sql, (channel, payload) = postgres.cursor.return_value.__enter__.return_value.execute.call_args.args
+        self.assertEqual((sql, channel), ('SELECT pg_notify(%s, %s)', live_service.LIVE_CHANNEL))
+        self.assertEqual(json.loads(payload)['submissions'], [{'id': 7}])
+
+    def test_latest_event_expires(self):
+        broadcaster = live_service.Broadcaster()
+        self.assertIsNone(broadcaster.latest())
+        with mock.patch.object(live_service.time, 'monotonic', return_value=1000.0):
+            broadcaster.publish({'counts': {'total': 1}, 'submissions': []})
+            self.assertEqual(broadcaster.latest()['counts'], {'total': 1})
+        with mock.patch.object(live_service.time, 'monotonic', return_value=1000.0 + live_service.LATEST_EVENT_MAX_AGE):
+            self.assertIsNone(broadcaster.latest())  # Might have missed a change: read the counters
@@ -0,0 +1,53 @@
+# admin/apps/forms/upload_handlers.py
+from django.conf import settings
+from django.core.files.uploadhandler import StopUpload, TemporaryFileUploadHandler
+
+
+class AttachmentUploadHandler(TemporaryFileUploadHandler):
+    """
+    Streams multipart attachments straight to temporary files on disk
+    while enforcing per-file, per-request and file-count limits.
+
+    Nothing is buffered in memory beyond a single chunk, so worker memory
+    stays flat no matter how big the attachments are. When a limit is hit
+    the upload is stopped and the reason is stored on
+    ``request.upload_rejected`` for the view to report.
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.max_files = settings.FORMS_MAX_ATTACHMENTS
+        self.max_file_size = settings.FORMS_MAX_ATTACHMENT_SIZE
+        self.max_request_size = settings.FORMS_MAX_SUBMISSION_SIZE
+        self.file_count = 0
+        self.file_bytes = 0
+        self.total_bytes = 0
+
+    def new_file(self, field_name, file_name, *args, **kwargs):
+        self.file_count += 1
+        if self.file_count > self.max_files:
+            self.reject(f'Too many files (maximum {self.max_files})')
+        self.file_bytes = 0
+        super().new_file(field_name, file_name, *args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        self.file_bytes += len(raw_data)
+        self.total_bytes += len(raw_data)
+
+        if self.file_bytes > self.max_file_size:
+            self.reject(
+                f'File "{self.file_name}" exceeds the '
+                f'{self.max_file_size // (1024 * 1024)}MB limit'
+            )
+        if self.total_bytes > self.max_request_size:
+            self.reject(
+                f'Total upload size exceeds the '
+                f'{self.max_request_size // (1024 * 1024)}MB limit'
+            )
+
+        return super().receive_data_chunk(raw_data, start)
+
+    def reject(self, reason):
+        """Abort the upload; the parser closes (and deletes) the partial temp file"""
+        self.request.upload_rejected = reason
+        raise StopUpload(connection_reset=False)
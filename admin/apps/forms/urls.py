@@ -5,14 +5,21 @@ from . import views
 urlpatterns = [
     # Public form submission
     path('submit/client-requirement/', views.submit_client_requirement, name='submit_client_requirement'),
+    path('uploads/', views.request_attachment_uploads, name='request_attachment_uploads'),
+    
+    # Signed local-storage transfers (S3 storage hands out bucket URLs instead)
+    path('uploads/<str:token>/', views.upload_attachment, name='attachment_upload'),
+    path('attachments/<str:token>/', views.download_attachment, name='attachment_download'),
     
     # Admin dashboard API endpoints (protected)
     path('admin/stats/', views.admin_stats, name='admin_stats'),
     path('admin/health/', views.admin_health, name='admin_health'),
     path('admin/sidebar-stats/', views.sidebar_stats, name='sidebar_stats'),
     path('admin/notifications/unread-count/', views.notifications_unread_count, name='notifications_unread_count'),
+    path('admin/live/', views.live_events, name='live_events'),
     
     # Client requirements list (for admin dashboard)
     path('client-requirements/', views.client_requirements_list, name='client_requirements_list'),
+    path('client-requirements/export.<str:export_format>', views.client_requirements_export, name='client_requirements_export'),
     path('client-requirements/<int:pk>/', views.client_requirement_detail, name='client_requirement_detail'),
 ]
\ No newline at end of file
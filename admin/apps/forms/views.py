@@ -3,17 +3,43 @@ import json
 import base64
 import mimetypes
 from django.shortcuts import render, get_object_or_404
-from django.http import JsonResponse
+from django.core.handlers.asgi import ASGIRequest
+from django.http import FileResponse, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from django.core.files.base import ContentFile
+from django.conf import settings
 from django.utils import timezone
 from django.contrib.auth.decorators import login_required
 from django.db.models import Q
-from django.db import connection
+
+from apps.core.ratelimit import check_rate_limit, client_ip, rate_limit, rate_limited_response
+from dycetix_common.database import check_database, get_pool_stats
 
 from .models.client_requirement import ClientRequirement
-from .models.form_attachment import FormAttachment
+from .constants import ATTACHMENT_UPLOAD_RATE_LIMIT, SUBMISSION_RATE_LIMIT, AttachmentStatus
+from .exceptions import AttachmentUploadError
+from .upload_handlers import AttachmentUploadHandler
+from .services.attachment_service import (
+    create_pending_attachment,
+    create_upload_slot,
+    create_uploaded_attachment,
+    schedule_ingestion,
+    stage_bytes,
+    stage_uploaded_file,
+)
+from .storage import attachment_storage
+from .storage.local import DOWNLOAD_SALT, UPLOAD_SALT, load_signed
+from .services.live_service import event_stream
+from .services.export_service import EXPORT_FORMATS, async_chunks, export_chunks, export_queryset
+from .services.requirement_service import (
+    archive_mode,
+    archive_tables,
+    filter_requirements,
+    requirement_list_queryset,
+    requirement_models,
+)
+from .services.stats_service import get_requirement_stats
+from .pagination import InvalidCursor, paginate_keyset, parse_page_size
 
 # admin/apps/forms/views.py - ADD THIS FUNCTION
 @login_required
@@ -25,9 +51,14 @@ def client_requirement_detail(request, pk):
     GET: Return all details
     PATCH: Update status/notes
     """
-    try:
-        requirement = ClientRequirement.objects.get(pk=pk)
-    except ClientRequirement.DoesNotExist:
+    # ?archive=1 also finds a requirement moved to the archive (read-only), ?archive=only just those
+    mode = archive_mode(request.GET) if request.method == 'GET' else None
+    requirement = None
+    for model in requirement_models(mode):
+        requirement = model.objects.filter(pk=pk).first()
+        if requirement is not None:
+            break
+    if requirement is None:
         return JsonResponse({
             'success': False,
             'error': 'Client requirement not found'
@@ -36,13 +67,18 @@ def client_requirement_detail(request, pk):
     if request.method == 'GET':
         # Get all attachments
         attachments = []
+        attachments_status = {status: 0 for status in AttachmentStatus.values}
         for attachment in requirement.attachments.all():
+            attachments_status[attachment.status] += 1
             attachments.append({
                 'id': attachment.id,
                 'filename': attachment.original_filename,
-                'url': attachment.file.url,
+                'url': attachment.download_url,
                 'size_mb': attachment.file_size_mb,
                 'mime_type': attachment.mime_type,
+                'status': attachment.status,
+                'status_display': attachment.get_status_display(),
+                'error': attachment.error_message,
                 'uploaded_at': attachment.created_at.isoformat()
             })
         
@@ -71,7 +107,8 @@ def client_requirement_detail(request, pk):
             'ip_address': requirement.ip_address,
             'user_agent': requirement.user_agent,
             'attachments': attachments,
-            'attachments_count': len(attachments)
+            'attachments_count': len(attachments),
+            'attachments_status': attachments_status
         }
         
         return JsonResponse({
@@ -135,18 +172,14 @@ def client_requirement_detail(request, pk):
 @require_http_methods(["GET"])
 def admin_stats(request):
     """Stats for custom admin dashboard sidebar"""
-    total_requirements = ClientRequirement.objects.count()
-    new_requirements = ClientRequirement.objects.filter(status='new').count()
-    today_requirements = ClientRequirement.objects.filter(
-        created_at__date=timezone.now().date()
-    ).count()
+    stats = get_requirement_stats()
     
     return JsonResponse({
         'success': True,
         'data': {
-            'total_forms': total_requirements,
-            'new_forms': new_requirements,
-            'today_forms': today_requirements,
+            'total_forms': stats['total'],
+            'new_forms': stats['new'],
+            'today_forms': stats['today'],
             'alerts': 0,
             'system_status': 'online'
         }
@@ -158,18 +191,12 @@ def admin_stats(request):
 @require_http_methods(["GET"])
 def admin_health(request):
     """Health check for custom admin dashboard"""
-    try:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1")
-        db_status = 'connected'
-    except Exception as e:
-        db_status = f'disconnected: {str(e)}'
-    
     return JsonResponse({
         'success': True,
         'data': {
             'status': 'ok',
-            'database': db_status,
+            'database': check_database(),
+            'pool': get_pool_stats(),
             'timestamp': timezone.now().isoformat()
         }
     })
@@ -180,11 +207,11 @@ def admin_health(request):
 @require_http_methods(["GET"])
 def sidebar_stats(request):
     """Get stats for sidebar (new forms count)"""
-    new_requirements = ClientRequirement.objects.filter(status='new').count()
+    stats = get_requirement_stats()
     
     return JsonResponse({
         'success': True,
-        'new_forms': new_requirements,
+        'new_forms': stats['new'],
         'alerts': 0
     })
 
@@ -198,102 +225,248 @@ def notifications_unread_count(request):
         'success': True,
         'count': 0
     })
+
+
+@login_required
+@require_http_methods(["GET"])
+async def live_events(request):
+    """Server-Sent Events stream of the sidebar/header counters"""
+    if not isinstance(request, ASGIRequest):
+        # A never-ending response would pin a WSGI worker; the dashboard falls back to polling
+        return JsonResponse({
+            'success': False,
+            'error': 'Live updates require the ASGI server'
+        }, status=501)
+    
+    response = StreamingHttpResponse(event_stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # Stop nginx buffering the stream
+    return response
+
+
+def _extract_form_data(request, data, services):
+    """Normalise submitted fields from either a JSON body or multipart POST"""
+    return {
+        'first_name': (data.get('firstName') or '').strip(),
+        'last_name': (data.get('lastName') or '').strip(),
+        'email': (data.get('email') or '').strip().lower(),
+        'phone': (data.get('phone') or '').strip(),
+        'company': (data.get('company') or '').strip(),
+        'services': services,  # Array of service codes
+        'other_service': (data.get('otherService') or '').strip(),
+        'project_description': (data.get('projectDetails') or '').strip(),
+        'source': data.get('source') or 'website',  # 'website' or 'website-modal'
+        'ip_address': client_ip(request) or None,
+        'user_agent': request.META.get('HTTP_USER_AGENT', ''),
+    }
+
+
+def _validate_form_data(form_data):
+    """Return an error message for invalid submissions, or None"""
+    # Validate required fields
+    required_fields = ['first_name', 'last_name', 'email', 'project_description']
+    for field in required_fields:
+        if not form_data[field]:
+            return f'Missing required field: {field}'
+    
+    # Validate at least one service is selected
+    if not form_data['services']:
+        return 'Please select at least one service'
+    
+    # If "other" is selected, require other_service
+    if 'other' in form_data['services'] and not form_data['other_service']:
+        return 'Please specify the "Other" service'
+    
+    return None
+
+
+def _submission_response(client_req, attachments_created):
+    # Attachments are still pending here; storage happens off the request path
+    return JsonResponse({
+        'success': True,
+        'message': 'Form submitted successfully',
+        'submission_id': client_req.id,
+        'attachments_count': len(attachments_created),
+        'attachments': [
+            {
+                'id': attachment.id,
+                'filename': attachment.original_filename,
+                'size': attachment.file_size,
+                'status': attachment.status
+            }
+            for attachment in attachments_created
+        ],
+        'submission_date': client_req.created_at.isoformat()
+    })
+
+
+def _submit_multipart(request):
+    """
+    multipart/form-data submissions: attachments are streamed to disk by
+    AttachmentUploadHandler and staged for background ingestion without
+    being read into memory.
+    """
+    try:
+        content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        content_length = 0
+    
+    if content_length > settings.FORMS_MAX_SUBMISSION_SIZE:
+        return JsonResponse({
+            'success': False,
+            'error': f'Submission exceeds the {settings.FORMS_MAX_SUBMISSION_SIZE // (1024 * 1024)}MB limit'
+        }, status=413)
+    
+    # Must be set before request.POST / request.FILES are touched
+    request.upload_handlers = [AttachmentUploadHandler(request)]
+    uploaded_files = request.FILES.getlist('files')
+    
+    rejected = getattr(request, 'upload_rejected', None)
+    if rejected:
+        return JsonResponse({
+            'success': False,
+            'error': rejected
+        }, status=413)
+    
+    form_data = _extract_form_data(request, request.POST, request.POST.getlist('services'))
+    error = _validate_form_data(form_data)
+    if error:
+        return JsonResponse({
+            'success': False,
+            'error': error
+        }, status=400)
+    
+    upload_tokens = request.POST.getlist('uploads')
+    too_many = _too_many_attachments(len(uploaded_files) + len(upload_tokens))
+    if too_many:
+        return too_many
+    
+    # Unstaged uploads are temp files, deleted when the request is closed
+    wait = check_rate_limit(SUBMISSION_RATE_LIMIT, email=form_data['email'])
+    if wait:
+        return rate_limited_response(wait)
+    
+    client_req = ClientRequirement.objects.create(**form_data)
+    
+    attachments_created = []
+    for uploaded_file in uploaded_files:
+        try:
+            attachment = create_pending_attachment(
+                client_req,
+                staged_path=stage_uploaded_file(uploaded_file),
+                file_name=uploaded_file.name,
+                file_size=uploaded_file.size,
+                mime_type=uploaded_file.content_type,
+                ip_address=form_data['ip_address'],
+                user_agent=form_data['user_agent']
+            )
+            attachments_created.append(attachment)
+            
+        except Exception as e:
+            # Log the error but don't fail the entire submission
+            print(f"Error staging file {uploaded_file.name}: {str(e)}")
+            continue
+    
+    attachments_created += _attach_uploads(client_req, upload_tokens, form_data)
+    schedule_ingestion()
+    return _submission_response(client_req, attachments_created)
+
+
+def _too_many_attachments(count):
+    if count > settings.FORMS_MAX_ATTACHMENTS:
+        return JsonResponse({
+            'success': False,
+            'error': f'Too many files (maximum {settings.FORMS_MAX_ATTACHMENTS})'
+        }, status=413)
+    return None
+
+
+def _attach_uploads(client_req, tokens, form_data):
+    """Pending attachments for files the browser uploaded straight to storage"""
+    attachments = []
+    for token in tokens:
+        try:
+            attachments.append(create_uploaded_attachment(
+                client_req,
+                token,
+                ip_address=form_data['ip_address'],
+                user_agent=form_data['user_agent']
+            ))
+        except AttachmentUploadError as e:
+            # Log the error but don't fail the entire submission
+            print(f"Error attaching upload: {str(e)}")
+            continue
+    return attachments
+
+
 @csrf_exempt  # For now, we'll exempt CSRF for form submissions
 @require_http_methods(["POST"])
+@rate_limit(SUBMISSION_RATE_LIMIT)  # Per IP, before the body is read; per email once it is parsed
 def submit_client_requirement(request):
     """
     Handle form submissions from customer app
+    
+    Accepts multipart/form-data (preferred, attachments streamed to disk)
+    or JSON with base64-encoded files (legacy form-service.js clients).
     """
     try:
+        if request.content_type == 'multipart/form-data':
+            return _submit_multipart(request)
+        
         # Parse JSON data
         data = json.loads(request.body.decode('utf-8'))
         
         # Extract form data
-        form_data = {
-            'first_name': data.get('firstName', '').strip(),
-            'last_name': data.get('lastName', '').strip(),
-            'email': data.get('email', '').strip().lower(),
-            'phone': data.get('phone', '').strip(),
-            'company': data.get('company', '').strip(),
-            'services': data.get('services', []),  # Array of service codes
-            'other_service': data.get('otherService', '').strip(),
-            'project_description': data.get('projectDetails', '').strip(),
-            'source': data.get('source', 'website'),  # 'website' or 'website-modal'
-            'ip_address': request.META.get('REMOTE_ADDR'),
-            'user_agent': request.META.get('HTTP_USER_AGENT', ''),
-        }
+        form_data = _extract_form_data(request, data, data.get('services', []))
         
-        # Validate required fields
-        required_fields = ['first_name', 'last_name', 'email', 'project_description']
-        for field in required_fields:
-            if not form_data[field]:
-                return JsonResponse({
-                    'success': False,
-                    'error': f'Missing required field: {field}'
-                }, status=400)
-        
-        # Validate at least one service is selected
-        if not form_data['services']:
+        error = _validate_form_data(form_data)
+        if error:
             return JsonResponse({
                 'success': False,
-                'error': 'Please select at least one service'
+                'error': error
             }, status=400)
         
-        # If "other" is selected, require other_service
-        if 'other' in form_data['services'] and not form_data['other_service']:
-            return JsonResponse({
-                'success': False,
-                'error': 'Please specify the "Other" service'
-            }, status=400)
+        # Base64 files and/or tokens of files uploaded straight to storage
+        files = data.get('files', [])
+        upload_tokens = data.get('uploads', [])
+        too_many = _too_many_attachments(len(files) + len(upload_tokens))
+        if too_many:
+            return too_many
+        
+        wait = check_rate_limit(SUBMISSION_RATE_LIMIT, email=form_data['email'])
+        if wait:
+            return rate_limited_response(wait)
         
         # Create the client requirement
         client_req = ClientRequirement.objects.create(**form_data)
         
         # Handle file uploads if present
-        files = data.get('files', [])
         attachments_created = []
         
         for file_data in files:
             try:
-                # Decode base64 file
-                file_content = base64.b64decode(file_data['data'])
-                
-                # Create file name
-                file_name = file_data['name']
-                
-                # Create ContentFile
-                content_file = ContentFile(file_content, name=file_name)
-                
-                # Create attachment
-                attachment = FormAttachment.objects.create(
-                    client_requirement=client_req,
-                    original_filename=file_name,
-                    file=content_file,
+                # Decode base64 file and stage it for background ingestion
+                attachment = create_pending_attachment(
+                    client_req,
+                    staged_path=stage_bytes(base64.b64decode(file_data['data'])),
+                    file_name=file_data['name'],
                     file_size=file_data['size'],
                     mime_type=file_data['type'],
-                    uploaded_by_ip=form_data['ip_address'],
-                    uploaded_by_user_agent=form_data['user_agent']
+                    ip_address=form_data['ip_address'],
+                    user_agent=form_data['user_agent']
                 )
-                
-                attachments_created.append({
-                    'filename': file_name,
-                    'size': file_data['size'],
-                    'id': attachment.id
-                })
+                attachments_created.append(attachment)
                 
             except Exception as e:
                 # Log the error but don't fail the entire submission
                 print(f"Error processing file {file_data.get('name', 'unknown')}: {str(e)}")
                 continue
         
+        attachments_created += _attach_uploads(client_req, upload_tokens, form_data)
+        schedule_ingestion()
+        
         # Return success response
-        return JsonResponse({
-            'success': True,
-            'message': 'Form submitted successfully',
-            'submission_id': client_req.id,
-            'attachments_count': len(attachments_created),
-            'submission_date': client_req.created_at.isoformat()
-        })
+        return _submission_response(client_req, attachments_created)
         
     except json.JSONDecodeError:
         return JsonResponse({
@@ -319,28 +492,27 @@ def client_requirements_list(request):
             'error': 'Authentication required'
         }, status=401)
     
-    # Get filter parameters
-    status_filter = request.GET.get('status')
-    search_query = request.GET.get('search', '')
-    
-    # Start with base queryset
-    requirements = ClientRequirement.objects.all()
-    
-    # Apply filters
-    if status_filter:
-        requirements = requirements.filter(status=status_filter)
+    # Base queryset (assignee and attachment count fetched in the same query),
+    # filtered by ?status=, ?assigned_to= and ?search= (ranked, best matches
+    # first). Live rows only, with the archive too for ?archive=1 (paged
+    # together) or instead for ?archive=only.
+    requirements = [
+        filter_requirements(requirement_list_queryset(archive), request.GET)
+        for archive in archive_tables(archive_mode(request.GET))
+    ]
     
-    if search_query:
-        requirements = requirements.filter(
-            models.Q(first_name__icontains=search_query) |
-            models.Q(last_name__icontains=search_query) |
-            models.Q(email__icontains=search_query) |
-            models.Q(company__icontains=search_query) |
-            models.Q(project_description__icontains=search_query)
+    # Newest (or best-ranked) first, one keyset page at a time (?cursor=...&limit=...)
+    try:
+        requirements, next_cursor = paginate_keyset(
+            requirements,
+            cursor=request.GET.get('cursor'),
+            page_size=parse_page_size(request.GET.get('limit'))
         )
-    
-    # Order by newest first
-    requirements = requirements.order_by('-created_at')[:50]  # Limit to 50
+    except InvalidCursor as e:
+        return JsonResponse({
+            'success': False,
+            'error': str(e)
+        }, status=400)
     
     # Prepare response data
     data = []
@@ -359,22 +531,171 @@ def client_requirements_list(request):
             'created_at': req.created_at.isoformat(),
             'created_at_formatted': req.created_at.strftime('%Y-%m-%d %H:%M'),
             'assigned_to': req.assigned_to.get_full_name() if req.assigned_to else None,
-            'attachments_count': req.attachments.count()
+            'attachments_count': req.attachments_total
         })
     
     # Get counts for dashboard
+    stats = get_requirement_stats()
     counts = {
-        'total': ClientRequirement.objects.count(),
-        'new': ClientRequirement.objects.filter(status='new').count(),
-        'contacted': ClientRequirement.objects.filter(status='contacted').count(),
-        'today': ClientRequirement.objects.filter(
-            created_at__date=timezone.now().date()
-        ).count(),
+        'total': stats['total'],
+        'new': stats['new'],
+        'contacted': stats['contacted'],
+        'today': stats['today'],
     }
     
     return JsonResponse({
         'success': True,
         'data': data,
         'counts': counts,
-        'total_count': len(data)
-    })
\ No newline at end of file
+        'total_count': len(data),
+        'next_cursor': next_cursor,
+        'has_more': next_cursor is not None
+    })
+
+
+@require_http_methods(["GET"])
+def client_requirements_export(request, export_format):
+    """
+    Download client requirements as CSV, XLSX or NDJSON (requires
+    authentication). Takes the list endpoint's filters and ?archive=
+    (archived requirements follow the live ones);
+    rows are streamed straight from a database cursor however many there are.
+    """
+    if not request.user.is_authenticated:
+        return JsonResponse({
+            'success': False,
+            'error': 'Authentication required'
+        }, status=401)
+    
+    if export_format not in EXPORT_FORMATS:
+        return JsonResponse({
+            'success': False,
+            'error': f'Unsupported export format: {export_format}'
+        }, status=404)
+    
+    requirements = [
+        filter_requirements(export_queryset(archive), request.GET)
+        for archive in archive_tables(archive_mode(request.GET))
+    ]
+    chunks = export_chunks(requirements, export_format)
+    if isinstance(request, ASGIRequest):
+        # Django would read a sync iterator into memory before sending it under ASGI
+        chunks = async_chunks(chunks)
+    
+    content_type, extension = EXPORT_FORMATS[export_format]
+    filename = f'client-requirements-{timezone.localdate():%Y-%m-%d}.{extension}'
+    response = StreamingHttpResponse(chunks, content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response['Cache-Control'] = 'no-store'
+    response['X-Accel-Buffering'] = 'no'  # Stop nginx buffering the download
+    return response
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+@rate_limit(ATTACHMENT_UPLOAD_RATE_LIMIT)
+def request_attachment_uploads(request):
+    """
+    Upload slots for a submission's attachments. Body: {"files": [{"name",
+    "size", "type"}]}. Each slot says where to POST the file (its `url` and
+    form `fields`, then the file as `file`); the slot's `token` goes in the
+    submission's `uploads`. On S3 the file goes straight to the bucket.
+    """
+    try:
+        files = json.loads(request.body.decode('utf-8')).get('files') or []
+    except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+        return JsonResponse({
+            'success': False,
+            'error': 'Invalid JSON data'
+        }, status=400)
+    
+    if not isinstance(files, list) or not files:
+        return JsonResponse({
+            'success': False,
+            'error': 'No files to upload'
+        }, status=400)
+    
+    too_many = _too_many_attachments(len(files))
+    if too_many:
+        return too_many
+    
+    try:
+        uploads = [
+            create_upload_slot(file.get('name'), file.get('size'), file.get('type'))
+            for file in files
+        ]
+    except (AttachmentUploadError, AttributeError) as e:
+        return JsonResponse({
+            'success': False,
+            'error': str(e) if isinstance(e, AttachmentUploadError) else 'Invalid file description'
+        }, status=400)
+    
+    for upload in uploads:
+        upload['url'] = request.build_absolute_uri(upload['url'])  # Local storage returns a path
+    return JsonResponse({
+        'success': True,
+        'uploads': uploads
+    })
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def upload_attachment(request, token):
+    """
+    Local storage's presigned upload target: stores the POSTed `file` under
+    the name the signed token was issued for (once)
+    """
+    claims = load_signed(token, UPLOAD_SALT, settings.FORMS_ATTACHMENT_URL_EXPIRY)
+    if claims is None:
+        return JsonResponse({
+            'success': False,
+            'error': 'Invalid or expired upload URL'
+        }, status=403)
+    
+    request.upload_handlers = [AttachmentUploadHandler(request)]
+    uploaded_file = request.FILES.get('file')
+    rejected = getattr(request, 'upload_rejected', None)
+    if rejected or (uploaded_file and uploaded_file.size > claims['max_size']):
+        return JsonResponse({
+            'success': False,
+            'error': rejected or 'File is larger than declared'
+        }, status=413)
+    if uploaded_file is None:
+        return JsonResponse({
+            'success': False,
+            'error': 'No file uploaded'
+        }, status=400)
+    
+    storage = attachment_storage()
+    name = storage.save(claims['name'], uploaded_file)
+    if name != claims['name']:
+        # Already uploaded: each URL takes one file
+        storage.delete(name)
+        return JsonResponse({
+            'success': False,
+            'error': 'This upload URL has already been used'
+        }, status=409)
+    return HttpResponse(status=204)
+
+
+@require_http_methods(["GET"])
+def download_attachment(request, token):
+    """Local storage's signed download URL"""
+    claims = load_signed(token, DOWNLOAD_SALT, settings.FORMS_ATTACHMENT_URL_EXPIRY)
+    if claims is None:
+        return JsonResponse({
+            'success': False,
+            'error': 'Invalid or expired download link'
+        }, status=403)
+    
+    storage = attachment_storage()
+    if not storage.exists(claims['name']):
+        return JsonResponse({
+            'success': False,
+            'error': 'File not found'
+        }, status=404)
+    return FileResponse(
+        storage.open(claims['name'], 'rb'),
+        as_attachment=True,
+        filename=claims['filename'] or claims['name'].rsplit('/', 1)[-1]
+    )
@@ -3,6 +3,11 @@ ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Serve the admin through this module (e.g. ``gunicorn config.asgi:application
+-k uvicorn.workers.UvicornWorker``) so the live dashboard stream at
+``/api/forms/admin/live/`` can hold connections open without tying up a
+worker each; under WSGI the dashboard falls back to polling.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
@@ -14,3 +19,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_asgi_application()
+
+# A server process: live dashboard changes go through the coalescing publisher thread
+from apps.forms.services.live_service import enable_background_publishing  # noqa: E402
+
+enable_background_publishing()
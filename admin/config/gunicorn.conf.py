@@ -1,2 +1,30 @@
-# gunicorn.conf.py
-# Empty file - content will be added later
+# admin/config/gunicorn.conf.py
+"""
+Gunicorn settings for the admin app: ``gunicorn -c config/gunicorn.conf.py``
+from the admin directory. Shared settings and hooks are in
+dycetix_common/gunicorn_config.py.
+
+The default GUNICORN_WORKER_MODE is uvicorn (config.asgi): the live
+dashboard stream and slow uploads do not block a worker.
+"""
+import os
+import sys
+
+# Gunicorn reads this before settings.py puts the repository root (dycetix_common) on the path
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
+from dycetix_common.gunicorn_config import *  # noqa: E402,F401,F403
+from dycetix_common.gunicorn_config import app_module, read_worker_mode, worker_counts  # noqa: E402
+
+worker_mode = read_worker_mode(default='uvicorn')
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+wsgi_app = app_module('config', worker_mode)
+worker_class, workers, threads = worker_counts(worker_mode)
+
+# Sync workers are killed when a request outlives `timeout`, and a 130MB
+# attachment upload (FORMS_MAX_SUBMISSION_SIZE) over a slow link needs minutes.
+# gthread/uvicorn workers keep heartbeating while an upload streams in.
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '300' if worker_mode == 'sync' else '120'))
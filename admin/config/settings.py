@@ -1,11 +1,16 @@
 # admin/config/settings.py - CORRECTED SINGLE VERSION
 import os
+import sys
 from pathlib import Path
 import dj_database_url
 
 # Build paths
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# The repository root holds dycetix_common, shared with the customer site
+if str(BASE_DIR.parent) not in sys.path:
+    sys.path.append(str(BASE_DIR.parent))
+
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = os.environ.get('ADMIN_SECRET_KEY', 'dev-secret-key-change-me')
 
@@ -23,20 +28,25 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     # Third party
     'corsheaders', 
     'whitenoise.runserver_nostatic',  # For static files
 
     # Local apps
+    'apps.core',
     'apps.accounts',
     'apps.forms',
+    'apps.communications',
 ]
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    # After WhiteNoise, so static files are not counted
+    'dycetix_common.metrics.RequestMetricsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -72,7 +82,6 @@ if os.environ.get('DATABASE_URL'):
     DATABASES = {
         'default': dj_database_url.config(
             default=os.environ.get('DATABASE_URL'),
-            conn_max_age=600,
             ssl_require=True
         )
     }
@@ -88,6 +97,32 @@ else:
         }
     }
 
+# Connection pooling on PostgreSQL, persistent connections otherwise
+# (WEB_CONCURRENCY, DB_MAX_CONNECTIONS, DB_POOL*: see dycetix_common/database.py)
+from dycetix_common.database import configure_connections  # noqa: E402
+
+DB_POOL_ENABLED = configure_connections(DATABASES['default'])
+
+# Cache shared by every worker and by the management command processes
+# (archiver, attachment worker), so what one process invalidates (the
+# dashboard counters) is gone for all of them. Redis when REDIS_URL is set
+# (needs the redis package), otherwise the django_cache table created by
+# `manage.py createcachetable`.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+        }
+    }
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -124,6 +159,103 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Form submission uploads (multipart attachments are streamed to disk)
+FORMS_MAX_ATTACHMENTS = int(os.environ.get('FORMS_MAX_ATTACHMENTS', '5'))
+FORMS_MAX_ATTACHMENT_SIZE = int(os.environ.get('FORMS_MAX_ATTACHMENT_SIZE', 25 * 1024 * 1024))  # 25MB per file
+FORMS_MAX_SUBMISSION_SIZE = int(os.environ.get('FORMS_MAX_SUBMISSION_SIZE', 130 * 1024 * 1024))  # Whole request
+
+# Attachment ingestion: bytes are staged here and stored off the request path,
+# by an in-process thread and/or `manage.py process_attachments`
+FORMS_ATTACHMENT_STAGING_DIR = os.environ.get('FORMS_ATTACHMENT_STAGING_DIR', os.path.join(MEDIA_ROOT, 'temp', 'attachments'))
+FORMS_INGEST_IN_PROCESS = os.environ.get('FORMS_INGEST_IN_PROCESS', 'True').lower() in ('true', '1', 't')
+
+# Attachment storage (apps/forms/storage): named backends, FORMS_ATTACHMENT_STORAGE
+# picks the active one. Browsers upload to and download from it directly
+# through presigned/signed URLs. Move files between backends with
+# `manage.py migrate_attachment_storage --from local --to s3`.
+FORMS_ATTACHMENT_STORAGE = os.environ.get('FORMS_ATTACHMENT_STORAGE', 'local')
+FORMS_ATTACHMENT_STORAGES = {
+    'local': {
+        'BACKEND': 'apps.forms.storage.local.LocalAttachmentStorage',  # MEDIA_ROOT
+    },
+    # S3 or any S3-compatible service (MinIO, R2): needs django-storages[s3]
+    's3': {
+        'BACKEND': 'apps.forms.storage.s3.S3AttachmentStorage',
+        'OPTIONS': {
+            'bucket_name': os.environ.get('ATTACHMENT_S3_BUCKET', ''),
+            'endpoint_url': os.environ.get('ATTACHMENT_S3_ENDPOINT_URL') or None,
+            'region_name': os.environ.get('ATTACHMENT_S3_REGION') or None,
+            'access_key': os.environ.get('ATTACHMENT_S3_ACCESS_KEY') or None,
+            'secret_key': os.environ.get('ATTACHMENT_S3_SECRET_KEY') or None,
+            'addressing_style': os.environ.get('ATTACHMENT_S3_ADDRESSING_STYLE') or None,  # 'path' for MinIO
+            'signature_version': 's3v4',
+            'file_overwrite': False,
+            'querystring_auth': True,
+        },
+    },
+}
+FORMS_ATTACHMENT_URL_EXPIRY = int(os.environ.get('FORMS_ATTACHMENT_URL_EXPIRY', '300'))  # Seconds signed URLs stay valid
+
+# Requirements archived for this many days are moved, with their attachments,
+# to the archive tables by `manage.py archive_requirements` (run daily)
+REQUIREMENT_ARCHIVE_AFTER_DAYS = int(os.environ.get('REQUIREMENT_ARCHIVE_AFTER_DAYS', '30'))
+
+# Email: SMTP when EMAIL_HOST is set, otherwise mail is printed to the console
+EMAIL_HOST = os.environ.get('EMAIL_HOST', '')
+EMAIL_BACKEND = os.environ.get(
+    'EMAIL_BACKEND',
+    'django.core.mail.backends.smtp.EmailBackend' if EMAIL_HOST else 'django.core.mail.backends.console.EmailBackend'
+)
+EMAIL_PORT = int(os.environ.get('EMAIL_PORT', '587'))
+EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
+EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', 'True').lower() in ('true', '1', 't')
+EMAIL_TIMEOUT = int(os.environ.get('EMAIL_TIMEOUT', '10'))
+DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'DyceTix <no-reply@dycetix.com>')
+
+# Email queue (apps/communications): requests only insert rows; mail is sent
+# in batches, one SMTP connection per batch, by an in-process thread and/or
+# `manage.py send_queued_emails`
+EMAIL_QUEUE_IN_PROCESS = os.environ.get('EMAIL_QUEUE_IN_PROCESS', 'True').lower() in ('true', '1', 't')
+EMAIL_QUEUE_BATCH_SIZE = int(os.environ.get('EMAIL_QUEUE_BATCH_SIZE', '100'))
+EMAIL_QUEUE_MAX_RETRIES = int(os.environ.get('EMAIL_QUEUE_MAX_RETRIES', '6'))
+EMAIL_QUEUE_RETRY_DELAY = 60  # Seconds before the first retry, doubled for each one after
+EMAIL_QUEUE_MAX_RETRY_DELAY = 3600
+EMAIL_QUEUE_LEASE = 300  # Seconds a worker may hold claimed emails before others retry them
+EMAIL_QUEUE_POLL_INTERVAL = 30  # In-process worker: seconds between checks for due retries
+SUBMISSION_NOTIFY_EMAILS = [
+    address.strip()
+    for address in os.environ.get('SUBMISSION_NOTIFY_EMAILS', os.environ.get('ADMIN_EMAIL', '')).split(',')
+    if address.strip()
+]
+# Client acknowledgements: at most one per address per cooldown, and a
+# site-wide hourly cap, so the public form can't be used to mail strangers
+SUBMISSION_ACK_COOLDOWN = int(os.environ.get('SUBMISSION_ACK_COOLDOWN', 24 * 60 * 60))  # Seconds
+SUBMISSION_ACK_HOURLY_LIMIT = int(os.environ.get('SUBMISSION_ACK_HOURLY_LIMIT', '200'))
+ADMIN_SITE_URL = os.environ.get('ADMIN_SITE_URL', 'https://dycetix-admin.onrender.com')  # Links in staff emails
+
+# Rate limiting (apps/core/ratelimit.py): sliding-window rates per endpoint
+# and scope, as '<count>/<s|m|h|d>'. Counters live in the UNLOGGED
+# rate_limit_counters table ('database') or a cache alias ('cache', e.g. Redis).
+RATE_LIMIT_ENABLED = os.environ.get('RATE_LIMIT_ENABLED', 'True').lower() in ('true', '1', 't')
+RATE_LIMIT_STORE = os.environ.get('RATE_LIMIT_STORE', 'database')
+RATE_LIMIT_CACHE = os.environ.get('RATE_LIMIT_CACHE', 'default')
+# Proxies in front of the app that append to X-Forwarded-For (Render's router)
+RATE_LIMIT_PROXY_COUNT = int(os.environ.get('RATE_LIMIT_PROXY_COUNT', '1' if os.environ.get('RENDER') else '0'))
+RATE_LIMITS = {
+    'client_requirement_submit': {
+        'ip': os.environ.get('RATE_LIMIT_SUBMIT_PER_IP', '10/m'),
+        'email': os.environ.get('RATE_LIMIT_SUBMIT_PER_EMAIL', '5/h'),
+    },
+    'attachment_upload': {
+        'ip': os.environ.get('RATE_LIMIT_UPLOAD_PER_IP', '20/m'),
+    },
+}
+
+# Request metrics (dycetix_common/metrics.py), scraped from /metrics
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')  # Bearer token required by /metrics when set
+METRICS_SLOW_REQUEST_MS = int(os.environ.get('METRICS_SLOW_REQUEST_MS', '1000'))  # Logged with their SQL
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -5,9 +5,9 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib.auth import views as auth_views
 from django.views.generic import RedirectView
-from admin.apps.forms.views import submit_client_requirement
 from apps.accounts.admin_site import admin_site
 from apps.accounts.views import custom_logout
+from apps.core.views import metrics
 
 # Your local working version doesn't have custom_admin_dashboard
 # So don't use it in production either
@@ -35,6 +35,12 @@ urlpatterns = [
     # Form submission and admin API endpoints
     path('api/forms/', include('apps.forms.urls')),
     # path('api/forms/submit/client-requirement/', submit_client_requirement, name='submit_client_requirement'),
+
+    # REST API (ClientRequirementViewSet)
+    path('api/', include('apps.forms.api.urls')),
+
+    # Prometheus scrape target (dycetix_common/metrics.py)
+    path('metrics', metrics, name='metrics'),
 ]
 
 # Add media URL in development
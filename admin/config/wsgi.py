@@ -5,4 +5,9 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_wsgi_application()
 
+# A server process: live dashboard changes go through the coalescing publisher thread
+from apps.forms.services.live_service import enable_background_publishing  # noqa: E402
+
+enable_background_publishing()
+
 # WhiteNoise will be added by middleware
\ No newline at end of file
@@ -83,7 +83,35 @@ function updateSystemStatus(healthy) {
 }
 
 // Real-time Updates
+const LIVE_EVENTS_URL = '/api/forms/admin/live/';
+
 function initRealTimeUpdates() {
+    // Counters are pushed over Server-Sent Events; poll only when the stream is unavailable
+    if (!window.EventSource) {
+        startPolling();
+        return;
+    }
+    
+    const source = new EventSource(LIVE_EVENTS_URL, { withCredentials: true });
+    
+    source.addEventListener('counts', (event) => {
+        applyCounts(JSON.parse(event.data));
+    });
+    
+    source.addEventListener('submission', (event) => {
+        const submission = JSON.parse(event.data);
+        showNotification('info', `New submission from ${submission.full_name}`);
+    });
+    
+    source.onerror = () => {
+        // EventSource reconnects dropped streams itself; CLOSED means the server refused it
+        if (source.readyState === EventSource.CLOSED) {
+            startPolling();
+        }
+    };
+}
+
+function startPolling() {
     // Update stats every 30 seconds
     setInterval(updateStats, 30000);
     
@@ -95,30 +123,32 @@ function initRealTimeUpdates() {
     checkNotifications();
 }
 
+function applyCounts(data) {
+    // Update new forms count
+    const newFormsEl = document.getElementById('new-forms-count');
+    if (newFormsEl && data.new_forms !== undefined) {
+        newFormsEl.textContent = data.new_forms;
+    }
+    
+    // Update alerts count
+    const alertsEl = document.getElementById('alerts-count');
+    if (alertsEl && data.alerts !== undefined) {
+        alertsEl.textContent = data.alerts;
+    }
+    
+    // Update notification badge
+    const notifBadge = document.getElementById('notification-count');
+    if (notifBadge && data.notifications !== undefined) {
+        notifBadge.textContent = data.notifications;
+        notifBadge.style.display = data.notifications > 0 ? 'flex' : 'none';
+    }
+}
+
 async function updateStats() {
     try {
-        const response = await fetch('/admin/api/stats/');
+        const response = await fetch('/api/forms/admin/sidebar-stats/', { credentials: 'include' });
         if (response.ok) {
-            const data = await response.json();
-            
-            // Update new forms count
-            const newFormsEl = document.getElementById('new-forms-count');
-            if (newFormsEl && data.new_forms !== undefined) {
-                newFormsEl.textContent = data.new_forms;
-            }
-            
-            // Update alerts count
-            const alertsEl = document.getElementById('alerts-count');
-            if (alertsEl && data.alerts !== undefined) {
-                alertsEl.textContent = data.alerts;
-            }
-            
-            // Update notification badge
-            const notifBadge = document.getElementById('notification-count');
-            if (notifBadge && data.notifications !== undefined) {
-                notifBadge.textContent = data.notifications;
-                notifBadge.style.display = data.notifications > 0 ? 'flex' : 'none';
-            }
+            applyCounts(await response.json());
         }
     } catch (error) {
         console.error('Failed to update stats:', error);
@@ -127,14 +157,10 @@ async function updateStats() {
 
 async function checkNotifications() {
     try {
-        const response = await fetch('/admin/api/notifications/unread-count/');
+        const response = await fetch('/api/forms/admin/notifications/unread-count/', { credentials: 'include' });
         if (response.ok) {
             const data = await response.json();
-            const notifBadge = document.getElementById('notification-count');
-            if (notifBadge) {
-                notifBadge.textContent = data.count;
-                notifBadge.style.display = data.count > 0 ? 'flex' : 'none';
-            }
+            applyCounts({ notifications: data.count });
         }
     } catch (error) {
         console.error('Failed to check notifications:', error);
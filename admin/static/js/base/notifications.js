@@ -1,11 +1,8 @@
 // admin/static/admin/js/components/notifications.js
 function initNotifications() {
-    // Load initial notification count
+    // Load initial notification count (later changes arrive over the live stream, see core.js)
     updateNotificationCount();
     
-    // Set up periodic refresh (every 30 seconds)
-    setInterval(updateNotificationCount, 30000);
-    
     // Setup notification close buttons
     document.addEventListener('click', function(e) {
         if (e.target.closest('.notification-close')) {
@@ -16,7 +13,7 @@ function initNotifications() {
 
 async function updateNotificationCount() {
     try {
-        const response = await fetch('/admin/api/notifications/unread-count/');
+        const response = await fetch('/api/forms/admin/notifications/unread-count/', { credentials: 'include' });
         if (response.ok) {
             const data = await response.json();
             const badge = document.getElementById('notification-count');
@@ -0,0 +1,275 @@
+# customer/client_portal/asset_bundles.py
+"""
+Minified per-page CSS/JS bundles.
+
+The ``{% bundle 'css' %}`` / ``{% bundle 'js' %}`` blocks in base.html wrap
+the stylesheet links and scripts of every page. Inside a block, each run of
+local ``<link rel="stylesheet">`` or plain ``<script src>`` tags, separated
+only by whitespace and comments, is one bundle. Other tags (CDN assets,
+async scripts, inline code) stay where they are, so the load order of
+everything on the page is unchanged.
+
+``manage.py build_asset_bundles`` (run by collectstatic) renders every page,
+concatenates and minifies each run into ``ASSET_BUNDLES_ROOT/files/bundles/``,
+a STATICFILES_DIRS entry, so the manifest storage hashes the bundles and
+precompresses them to .br/.gz. ``ASSET_BUNDLES_ROOT/bundles.json`` maps each
+run to its bundle. A run with no built bundle renders as written.
+"""
+import contextvars
+import hashlib
+import json
+import os
+import posixpath
+import re
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import ManifestFilesMixin, staticfiles_storage
+from django.templatetags.static import static
+
+OUTPUT_PREFIX = 'bundles/'
+
+TAG_PATTERNS = {
+    'css': re.compile(r'<link\b[^>]*>', re.I),
+    'js': re.compile(r'<script\b[^>]*>\s*</script>', re.I),
+}
+ATTR_PATTERN = re.compile(r'''([\w-]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?''')
+# Whitespace and HTML comments may separate the tags of one run
+SEPARATOR_PATTERN = re.compile(r'(?:\s|<!--(?:(?!-->).)*-->)*', re.S)
+
+CSS_URL_PATTERN = re.compile(r'''url\(\s*(['"]?)([^'")]+)\1\s*\)''')
+CSS_IMPORT_PATTERN = re.compile(r'''@import\s+(?:url\(\s*)?(['"])([^'"]+)\1\s*\)?\s*;''')
+
+# Rendering for build_asset_bundles records runs here instead of replacing them
+collecting = contextvars.ContextVar('asset_bundles_collecting', default=None)
+
+
+def bundles_root():
+    return Path(settings.ASSET_BUNDLES_ROOT)
+
+
+def files_root():
+    return bundles_root() / 'files'
+
+
+def manifest_path():
+    return bundles_root() / 'bundles.json'
+
+
+def run_key(kind, names):
+    return f'{kind}:' + '|'.join(names)
+
+
+# ==================== MANIFEST ====================
+
+_manifest = None
+_manifest_mtime = None
+
+
+def read_manifest():
+    try:
+        with open(manifest_path(), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def bundle_for(kind, names):
+    """Static name of the bundle built for a run, or None"""
+    global _manifest, _manifest_mtime
+    try:
+        mtime = manifest_path().stat().st_mtime
+    except OSError:
+        return None
+    if mtime != _manifest_mtime:
+        _manifest = read_manifest().get('bundles', {})
+        _manifest_mtime = mtime
+    return _manifest.get(run_key(kind, names))
+
+
+def write_manifest(bundles, routes):
+    path = manifest_path()
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'bundles': bundles, 'routes': routes}, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+# ==================== RUNS ====================
+
+_original_names = {}
+
+
+def static_name(url):
+    """Source static name for a rendered URL, or None for anything that is not a local static file"""
+    parts = urlsplit(url)
+    if parts.netloc or not parts.path.startswith(settings.STATIC_URL):
+        return None
+    name = parts.path[len(settings.STATIC_URL):]
+    # Map hashed names back to their sources once collectstatic has run
+    if isinstance(staticfiles_storage, ManifestFilesMixin):
+        hashed_files = staticfiles_storage.hashed_files
+        if _original_names.get('source') is not hashed_files:
+            _original_names['source'] = hashed_files
+            _original_names['names'] = {hashed: original for original, hashed in hashed_files.items()}
+        name = _original_names['names'].get(name, name)
+    return name
+
+
+def tag_attrs(tag):
+    head = re.match(r'<\w+\s*(.*?)/?>', tag, re.S).group(1)
+    return {
+        match.group(1).lower(): next((value for value in match.groups()[1:] if value is not None), '')
+        for match in ATTR_PATTERN.finditer(head)
+    }
+
+
+def bundled_name(kind, tag):
+    """Static name if the tag can join a bundle, else None"""
+    attrs = tag_attrs(tag)
+    if kind == 'css':
+        if attrs.get('rel', '').lower() != 'stylesheet' or attrs.get('media', 'all') != 'all':
+            return None
+        url = attrs.get('href', '')
+    else:
+        if {'async', 'defer', 'integrity', 'nomodule'} & attrs.keys():
+            return None
+        if attrs.get('type', 'text/javascript').lower() not in ('text/javascript', 'application/javascript'):
+            return None
+        url = attrs.get('src', '')
+    return static_name(url) if url else None
+
+
+def split_runs(html, kind):
+    """
+    Split rendered HTML into text and runs: yields (text, None) and
+    (source_html, [static names]) in document order
+    """
+    position = 0
+    run_start = run_end = None
+    names = []
+    for match in TAG_PATTERNS[kind].finditer(html):
+        name = bundled_name(kind, match.group())
+        if name is None:
+            continue
+        if names and SEPARATOR_PATTERN.fullmatch(html, run_end, match.start()):
+            run_end = match.end()
+        else:
+            if names:
+                yield html[position:run_start], None
+                yield html[run_start:run_end], names
+                position = run_end
+            run_start, run_end, names = match.start(), match.end(), []
+        if name not in names:
+            names.append(name)
+    if names:
+        yield html[position:run_start], None
+        yield html[run_start:run_end], names
+        position = run_end
+    yield html[position:], None
+
+
+def bundle_tag(kind, bundle):
+    if kind == 'css':
+        return f'<link rel="stylesheet" href="{static(bundle)}">'
+    return f'<script src="{static(bundle)}"></script>'
+
+
+def render_bundles(html, kind):
+    """Replace every run that has a built bundle with a single tag (never under DEBUG, so edits show up)"""
+    runs = collecting.get()
+    if runs is None and (settings.DEBUG or not settings.ASSET_BUNDLES_ENABLED):
+        return html
+    parts = []
+    for source, names in split_runs(html, kind):
+        if names is None:
+            parts.append(source)
+        elif runs is not None:
+            runs.append((kind, names))
+            parts.append(source)
+        else:
+            bundle = bundle_for(kind, names)
+            parts.append(bundle_tag(kind, bundle) if bundle else source)
+    return ''.join(parts)
+
+
+# ==================== BUILD ====================
+
+def read_source(name):
+    path = finders.find(name)
+    if not path:
+        raise FileNotFoundError(f'static file not found: {name}')
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def rebase_css(name, css, included):
+    """
+    Inline local @imports not already in the bundle and make url()
+    references relative to bundles/ instead of the source file
+    """
+    directory = posixpath.dirname(name)
+
+    def resolve(url):
+        return posixpath.normpath(posixpath.join(directory, url))
+
+    def inline_import(match):
+        imported = resolve(match.group(2))
+        if urlsplit(match.group(2)).scheme or match.group(2).startswith('/'):
+            return match.group()
+        if imported in included:
+            return ''
+        included.add(imported)
+        return rebase_css(imported, read_source(imported), included)
+
+    def rebase_url(match):
+        quote, url = match.groups()
+        if url.startswith(('/', '#', 'data:')) or urlsplit(url).scheme:
+            return match.group()
+        return f'url({quote}{posixpath.relpath(resolve(url), OUTPUT_PREFIX.rstrip("/"))}{quote})'
+
+    css = CSS_IMPORT_PATTERN.sub(inline_import, css)
+    return CSS_URL_PATTERN.sub(rebase_url, css)
+
+
+def build_bundle(kind, names):
+    """
+    Concatenated, minified source of one run. Files that do not exist are
+    left out, as the browser gets a 404 for them anyway; returns
+    (content, missing names).
+    """
+    import rcssmin
+    import rjsmin
+
+    missing = [name for name in names if not finders.find(name)]
+    names = [name for name in names if name not in missing]
+    if kind == 'css':
+        included = set(names)
+        source = '\n'.join(rebase_css(name, read_source(name), included) for name in names)
+        return rcssmin.cssmin(source), missing
+    # The separator stops a file without a trailing semicolon running into the next
+    return rjsmin.jsmin(';\n'.join(read_source(name) for name in names)), missing
+
+
+def write_bundle(kind, content):
+    """Write a bundle under a content-addressed name; returns the static name"""
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+    name = f'{OUTPUT_PREFIX}{digest}.{kind}'
+    path = files_root() / name
+    if not path.exists():
+        os.makedirs(path.parent, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(content, encoding='utf-8')
+        os.replace(tmp_path, path)
+    return name
+
+
+def remove_stale_bundles(keep):
+    removed = 0
+    for path in (files_root() / OUTPUT_PREFIX).glob('*'):
+        if f'{OUTPUT_PREFIX}{path.name}' not in keep:
+            path.unlink()
+            removed += 1
+    return removed
@@ -0,0 +1,225 @@
+# customer/client_portal/image_derivatives.py
+"""
+Responsive image derivatives for the static images.
+
+``collectstatic`` (see management/commands/collectstatic.py) first resizes
+every JPG/PNG under ``images/`` to the configured widths in each configured
+format (AVIF and WebP by default). The derivatives are written to
+``IMAGE_DERIVATIVES_ROOT/files``, a STATICFILES_DIRS entry, so they are
+collected and content-hashed by the manifest storage like any other asset.
+
+``IMAGE_DERIVATIVES_ROOT/derivatives.json`` records, per source image, its
+content hash, dimensions and derivatives. Sources whose hash has not
+changed since the last build are skipped, and the ``responsive_image``
+template tag reads the same file to build ``srcset`` markup.
+"""
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles.finders import get_finders
+
+SOURCE_PREFIX = 'images/'
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+MIME_TYPES = {
+    'avif': 'image/avif',
+    'webp': 'image/webp',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+}
+IGNORE_PATTERNS = ['CVS', '.*', '*~']
+
+
+def derivatives_root():
+    return Path(settings.IMAGE_DERIVATIVES_ROOT)
+
+
+def files_root():
+    return derivatives_root() / 'files'
+
+
+def manifest_path():
+    return derivatives_root() / 'derivatives.json'
+
+
+def recipe():
+    """Build parameters; changing any of them rebuilds every derivative"""
+    return {
+        'widths': list(settings.IMAGE_DERIVATIVE_WIDTHS),
+        'formats': settings.IMAGE_DERIVATIVE_FORMATS,
+    }
+
+
+# ==================== MANIFEST ====================
+
+_manifest = None
+_manifest_mtime = None
+
+
+def read_manifest():
+    try:
+        with open(manifest_path(), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def derivatives_for(name):
+    """Manifest entry for a static image name, or None if nothing was built"""
+    global _manifest, _manifest_mtime
+    try:
+        mtime = manifest_path().stat().st_mtime
+    except OSError:
+        return None
+    if mtime != _manifest_mtime:
+        _manifest = read_manifest().get('images', {})
+        _manifest_mtime = mtime
+    return _manifest.get(name)
+
+
+def write_manifest(images):
+    path = manifest_path()
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'recipe': recipe(), 'images': images}, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+# ==================== BUILD ====================
+
+def find_source_images():
+    """{static name: absolute path} for every JPG/PNG under images/"""
+    own_output = files_root().resolve()
+    sources = {}
+    for finder in get_finders():
+        for name, storage in finder.list(IGNORE_PATTERNS):
+            name = name.replace(os.sep, '/')
+            if not name.startswith(SOURCE_PREFIX) or not name.lower().endswith(SOURCE_EXTENSIONS):
+                continue
+            if Path(storage.location).resolve() == own_output:
+                continue
+            # First finder wins, as with collectstatic
+            sources.setdefault(name, storage.path(name))
+    return sources
+
+
+def file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def target_widths(width, widths):
+    """Standard widths below the original; the original too if it is not larger than the biggest"""
+    targets = [w for w in sorted(widths) if w < width]
+    if width <= max(widths):
+        targets.append(width)
+    return targets
+
+
+def render_derivatives(name, source_path, digest, output_root, build_recipe):
+    """
+    Resize one source image to every target width and format. Runs in a
+    worker process, so it only uses Pillow and its arguments.
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(source_path) as image:
+        original_size = image.size
+        # JPEG can decode at 1/2, 1/4 or 1/8 scale; never below the largest width we need
+        largest = max(build_recipe['widths'])
+        if image.width > largest:
+            image.draft('RGB', (largest, round(image.height * largest / image.width)))
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ('RGB', 'RGBA'):
+            has_alpha = image.mode in ('LA', 'PA') or 'transparency' in image.info
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+
+        width, height = image.size
+        variants = {}
+        for target_width in target_widths(width, build_recipe['widths']):
+            target_height = max(1, round(height * target_width / width))
+            resized = image if target_width == width else image.resize(
+                (target_width, target_height), Image.Resampling.LANCZOS
+            )
+            for fmt, options in build_recipe['formats'].items():
+                # Keep the source extension so photo.jpg and photo.png cannot collide
+                derivative = f'{name}-{target_width}w.{fmt}'
+                output = os.path.join(output_root, derivative)
+                os.makedirs(os.path.dirname(output), exist_ok=True)
+                resized.save(output, fmt.upper(), **options)
+                variants.setdefault(fmt, []).append([target_width, derivative])
+
+    return {
+        'hash': digest,
+        'width': original_size[0],
+        'height': original_size[1],
+        'variants': variants,
+    }
+
+
+def variant_names(entry):
+    return {derivative for variants in entry['variants'].values() for _, derivative in variants}
+
+
+def build_derivatives(jobs=None, force=False):
+    """
+    Bring the derivatives up to date with the source images. Returns the
+    built/skipped/removed counts and a {name: error} dict of failed sources.
+    """
+    output_root = files_root()
+    build_recipe = recipe()
+    previous = read_manifest()
+    if force or previous.get('recipe') != build_recipe:
+        previous_images = {}
+    else:
+        previous_images = previous.get('images', {})
+
+    images = {}
+    pending = []
+    for name, source_path in sorted(find_source_images().items()):
+        digest = file_digest(source_path)
+        entry = previous_images.get(name)
+        if entry and entry['hash'] == digest and all(
+            (output_root / derivative).exists() for derivative in variant_names(entry)
+        ):
+            images[name] = entry
+        else:
+            pending.append((name, source_path, digest))
+
+    failed = {}
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                name: pool.submit(render_derivatives, name, source_path, digest, str(output_root), build_recipe)
+                for name, source_path, digest in pending
+            }
+            for name, future in futures.items():
+                try:
+                    images[name] = future.result()
+                except Exception as exc:
+                    # Unreadable sources keep being served as the plain original
+                    failed[name] = f'{type(exc).__name__}: {exc}'
+
+    # Drop files that no current source produces (removed or renamed images, old widths)
+    current = set().union(*(variant_names(entry) for entry in images.values()))
+    removed = 0
+    for entry in previous.get('images', {}).values():
+        for derivative in variant_names(entry) - current:
+            try:
+                (output_root / derivative).unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+
+    os.makedirs(derivatives_root(), exist_ok=True)
+    write_manifest(images)
+    return {
+        'built': len(pending) - len(failed),
+        'skipped': len(images) - len(pending) + len(failed),
+        'removed': removed,
+        'failed': failed,
+    }
@@ -0,0 +1,69 @@
+# customer/client_portal/management/commands/benchmark_search.py
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...site_search import RESULT_FIELDS, normalize, ranked_queryset
+from ...typeahead import typeahead, words
+
+
+def typed_prefixes(phrase):
+    """Every query a user produces while typing `phrase`: 'we', 'web', 'web d', ..."""
+    return [phrase[:end] for end in range(2, len(phrase) + 1) if not phrase[end - 1].isspace()]
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+class Command(BaseCommand):
+    help = 'Compare p50/p99 latency of the in-memory typeahead against the database search for typed prefixes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--phrases', type=int, default=40, help='Number of phrases to type (default: 40)')
+        parser.add_argument('--rounds', type=int, default=5, help='Times each prefix is looked up (default: 5)')
+        parser.add_argument('--seed', type=int, default=1)
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        index = typeahead.reload()
+        build_ms = (time.perf_counter() - start) * 1000
+        if not len(index):
+            raise CommandError('The search index is empty; run index_search_content first')
+
+        # Phrases are section titles, typed out as one or two words
+        rng = random.Random(options['seed'])
+        titles = [words(result['section_title']) for result in index.results]
+        phrases = set()
+        for title in rng.sample(titles, min(options['phrases'], len(titles))):
+            if title:
+                phrases.add(' '.join(title[:rng.choice((1, 2))]))
+        queries = [query for phrase in sorted(phrases) for query in typed_prefixes(phrase)]
+
+        memory_timings = []
+        database_timings = []
+        for _ in range(options['rounds']):
+            for query in queries:
+                started = time.perf_counter()
+                index.suggest(normalize(query))
+                memory_timings.append(time.perf_counter() - started)
+
+                # The database path without the query cache, as a new keystroke would see it
+                started = time.perf_counter()
+                list(ranked_queryset(normalize(query)).order_by('-search_rank', 'id')[:8].values(*RESULT_FIELDS))
+                database_timings.append(time.perf_counter() - started)
+
+        self.stdout.write(
+            f'Typeahead index: {len(index)} sections, {len(index.prefixes)} prefixes, built in {build_ms:.1f}ms'
+        )
+        self.stdout.write(f'{len(queries)} prefixes of {len(phrases)} phrases x {options["rounds"]} round(s)')
+        self.stdout.write(f'{"backend":<10} {"p50":>10} {"p99":>10} {"max":>10} {"mean":>10}')
+        for name, timings in (('typeahead', memory_timings), ('database', database_timings)):
+            ms = [timing * 1000 for timing in timings]
+            self.stdout.write(
+                f'{name:<10} {percentile(ms, 0.5):>8.3f}ms {percentile(ms, 0.99):>8.3f}ms '
+                f'{max(ms):>8.3f}ms {statistics.mean(ms):>8.3f}ms'
+            )
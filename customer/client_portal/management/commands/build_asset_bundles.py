@@ -0,0 +1,129 @@
+# customer/client_portal/management/commands/build_asset_bundles.py
+import gzip
+import json
+import os
+import time
+
+import brotli
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory, override_settings
+from django.views.generic import TemplateView
+
+from ...asset_bundles import (
+    build_bundle, bundles_root, collecting, read_source, remove_stale_bundles, run_key, write_bundle,
+    write_manifest,
+)
+from ...views import cached_routes
+
+# Render with plain static URLs so runs are keyed by source names, whether or not collectstatic has run
+PLAIN_STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+
+def page_runs(path, initkwargs):
+    """[(kind, [static names])] of the bundle runs on one page"""
+    runs = []
+    token = collecting.set(runs)
+    try:
+        response = TemplateView.as_view(**initkwargs)(RequestFactory().get(path)).render()
+    finally:
+        collecting.reset(token)
+    if response.status_code != 200:
+        raise CommandError(f'{path}: HTTP {response.status_code}')
+    return runs
+
+
+def weights(content):
+    data = content.encode('utf-8')
+    return {
+        'minified': len(data),
+        'gzip': len(gzip.compress(data, compresslevel=9)),
+        'brotli': len(brotli.compress(data)),
+    }
+
+
+def format_size(size):
+    return f'{size / 1024:.1f}K'
+
+
+class Command(BaseCommand):
+    help = (
+        'Bundle and minify the CSS/JS of every customer page, report the asset weight per route '
+        'and fail when a page is over budget (collectstatic runs this too)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--budget', type=int, default=settings.ASSET_BUDGET_BYTES,
+            help='Maximum Brotli-compressed CSS+JS bytes per page (default: ASSET_BUDGET_BYTES)',
+        )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        with override_settings(STORAGES=PLAIN_STORAGES):
+            routes = {path: page_runs(path, view.view_initkwargs) for path, view in cached_routes()}
+
+        bundles = {}
+        sizes = {}
+        for runs in routes.values():
+            for kind, names in runs:
+                key = run_key(kind, names)
+                if key in bundles:
+                    continue
+                try:
+                    content, missing = build_bundle(kind, names)
+                except (OSError, UnicodeDecodeError) as exc:
+                    raise CommandError(f'Cannot bundle {", ".join(names)}: {exc}')
+                for name in missing:
+                    self.stderr.write(f'Missing static file left out of a bundle: {name}')
+                bundles[key] = write_bundle(kind, content)
+                sizes[key] = {
+                    'kind': kind,
+                    'files': len(names) - len(missing),
+                    'source': sum(len(read_source(name).encode('utf-8')) for name in names if name not in missing),
+                    **weights(content),
+                }
+
+        os.makedirs(bundles_root(), exist_ok=True)
+        removed = remove_stale_bundles(set(bundles.values()))
+        report = self.route_report(routes, sizes)
+        write_manifest(bundles, {path: [run_key(kind, names) for kind, names in runs] for path, runs in routes.items()})
+        with open(bundles_root() / 'report.json', 'w', encoding='utf-8') as f:
+            json.dump({'budget': options['budget'], 'routes': report}, f, indent=1)
+
+        self.write_report(report, options['budget'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Asset bundles: {len(bundles)} for {len(routes)} page(s), {removed} stale file(s) removed '
+            f'in {time.perf_counter() - start:.1f}s'
+        ))
+
+        over_budget = [path for path, row in report.items() if row['brotli'] > options['budget']]
+        if over_budget:
+            raise CommandError(
+                f'{len(over_budget)} page(s) over the {options["budget"]} byte asset budget: {", ".join(over_budget)}'
+            )
+
+    def route_report(self, routes, sizes):
+        report = {}
+        for path, runs in routes.items():
+            row = {'requests': len(runs), 'files': 0, 'source': 0, 'minified': 0, 'gzip': 0, 'brotli': 0}
+            for kind, names in runs:
+                for field, value in sizes[run_key(kind, names)].items():
+                    if field != 'kind':
+                        row[field] += value
+            report[path] = row
+        return report
+
+    def write_report(self, report, budget):
+        self.stdout.write(
+            f'{"route":<48} {"files":>5} {"reqs":>4} {"source":>8} {"minified":>8} {"gzip":>8} {"brotli":>8}'
+        )
+        for path, row in sorted(report.items(), key=lambda item: -item[1]['brotli']):
+            line = (
+                f'{path:<48} {row["files"]:>5} {row["requests"]:>4} {format_size(row["source"]):>8} '
+                f'{format_size(row["minified"]):>8} {format_size(row["gzip"]):>8} {format_size(row["brotli"]):>8}'
+            )
+            self.stdout.write(self.style.ERROR(line) if row['brotli'] > budget else line)
@@ -0,0 +1,31 @@
+# customer/client_portal/management/commands/build_video_derivatives.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...video_derivatives import build_renditions
+
+
+class Command(BaseCommand):
+    help = (
+        'Transcode the static videos to a bitrate ladder and extract poster frames with a local ffmpeg. '
+        'Commit the generated files and video_manifest.json.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ffmpeg', help='ffmpeg binary to use (default: FFMPEG_BINARY setting)')
+        parser.add_argument('--force', action='store_true', help='Rebuild every rendition, changed or not')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            result = build_renditions(ffmpeg=options['ffmpeg'], force=options['force'], log=self.stdout.write)
+        except FileNotFoundError as exc:
+            raise CommandError(f'{exc}; install ffmpeg or pass --ffmpeg')
+        for name, error in result['failed'].items():
+            self.stderr.write(f'{name}: {error}')
+        self.stdout.write(self.style.SUCCESS(
+            f"Video renditions: {result['built']} built, {result['skipped']} unchanged, "
+            f"{len(result['failed'])} failed, {result['removed']} stale file(s) removed "
+            f'in {time.perf_counter() - start:.1f}s'
+        ))
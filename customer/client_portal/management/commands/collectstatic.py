@@ -0,0 +1,20 @@
+# customer/client_portal/management/commands/collectstatic.py
+from django.contrib.staticfiles.management.commands.collectstatic import Command as CollectStaticCommand
+from django.core.management import call_command
+
+
+class Command(CollectStaticCommand):
+    """collectstatic that builds the responsive image derivatives and asset bundles before collecting"""
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument('--skip-images', action='store_true', help='Do not rebuild image derivatives')
+        parser.add_argument('--skip-bundles', action='store_true', help='Do not rebuild CSS/JS bundles')
+
+    def handle(self, **options):
+        if not options['skip_images'] and not options['dry_run']:
+            call_command('build_image_derivatives', verbosity=options['verbosity'], stdout=self.stdout)
+        if not options['skip_bundles'] and not options['dry_run']:
+            # Fails the build when a page is over its asset budget
+            call_command('build_asset_bundles', verbosity=options['verbosity'], stdout=self.stdout)
+        return super().handle(**options)
@@ -0,0 +1,32 @@
+# customer/client_portal/management/commands/index_search_content.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django.views.generic import TemplateView
+
+from ...site_search import index_pages
+from ...views import cached_routes
+
+
+class Command(BaseCommand):
+    help = 'Render every customer page and rebuild the searchable_content index from its sections'
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        pages = {}
+        for path, view in cached_routes():
+            # Render directly, bypassing the page cache
+            response = TemplateView.as_view(**view.view_initkwargs)(RequestFactory().get(path)).render()
+            if response.status_code != 200:
+                raise CommandError(f'{path}: HTTP {response.status_code}')
+            pages[path] = response.content.decode(response.charset)
+
+        indexed = index_pages(pages)
+        elapsed = time.perf_counter() - start
+        if indexed is None:
+            self.stdout.write(f'Search index already up to date ({len(pages)} pages, {elapsed:.1f}s)')
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'Indexed {indexed} section(s) from {len(pages)} page(s) in {elapsed:.1f}s'
+            ))
@@ -0,0 +1,81 @@
+# customer/client_portal/management/commands/loadtest_pages.py
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from dycetix_common.loadtest import RESULT_HEADER, compare_results, environment, format_result, run_scenario
+
+from ...page_cache import clear_pages
+from ...views import cached_routes
+
+API_SCENARIOS = {
+    'api: search': ('/api/search/', {'q': 'web development'}),
+    'api: suggest': ('/api/suggest/', {'q': 'mob'}),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Drive every customer page (and the search APIs) from concurrent threads and report throughput, '
+        'p50/p95/p99, queries per request and peak RSS. Pages are served from the page cache unless '
+        '--no-page-cache is given.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='Timed requests per scenario')
+        parser.add_argument('--concurrency', type=int, default=8, help='Concurrent client threads')
+        parser.add_argument('--route', action='append', help='Only run scenarios containing this text (repeatable)')
+        parser.add_argument('--no-page-cache', action='store_true', help='Render every request (PAGE_CACHE_ENABLED off)')
+        parser.add_argument('--output', help='Write the results to this JSON file')
+        parser.add_argument('--compare', help='Baseline JSON to compare against; fails on regressions')
+        parser.add_argument('--tolerance', type=float, default=0.10, help='Allowed p95/throughput change (default 0.10)')
+
+    def handle(self, *args, **options):
+        page_cache = settings.PAGE_CACHE_ENABLED and not options['no_page_cache']
+        scenarios = {
+            f'page: {path}': self.get(path)
+            for path, _ in cached_routes()
+        }
+        scenarios.update({name: self.get(path, params) for name, (path, params) in API_SCENARIOS.items()})
+        if options['route']:
+            scenarios = {name: run for name, run in scenarios.items() if any(part in name for part in options['route'])}
+        if not scenarios:
+            raise CommandError('No scenario matches --route')
+
+        if page_cache:
+            clear_pages()  # Every run starts cold; the warm-up requests fill it
+        results = {}
+        self.stdout.write(
+            f'{options["requests"]} requests per scenario, {options["concurrency"]} threads, '
+            f'page cache {"on" if page_cache else "off"}'
+        )
+        self.stdout.write(RESULT_HEADER)
+        with override_settings(ALLOWED_HOSTS=['testserver'], PAGE_CACHE_ENABLED=page_cache):
+            for name, scenario in scenarios.items():
+                result = run_scenario(scenario, options['requests'], options['concurrency'])
+                results[name] = result
+                line = format_result(name, result)
+                self.stdout.write(self.style.ERROR(line) if result['errors'] else line)
+
+        report = {
+            'suite': 'pages',
+            'environment': {**environment(), 'page_cache': page_cache},
+            'scenarios': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f'Results written to {options["output"]}')
+
+        if options['compare']:
+            with open(options['compare'], encoding='utf-8') as f:
+                regressions = compare_results(json.load(f), report, options['tolerance'])
+            if regressions:
+                raise CommandError('Regressions against the baseline:\n  ' + '\n  '.join(regressions))
+            self.stdout.write(self.style.SUCCESS('No regressions against the baseline'))
+
+    @staticmethod
+    def get(path, params=None):
+        return lambda client: client.get(path, params or {})
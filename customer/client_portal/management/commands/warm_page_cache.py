@@ -0,0 +1,40 @@
+# customer/client_portal/management/commands/warm_page_cache.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+
+from ...page_cache import clear_pages
+from ...views import cached_routes
+
+
+class Command(BaseCommand):
+    help = 'Render every cached marketing page into the page cache (run at deploy time)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--keep', action='store_true', help='Keep existing entries instead of clearing the cache first')
+
+    def handle(self, *args, **options):
+        if not options['keep']:
+            clear_pages()
+
+        factory = RequestFactory()
+        failed = []
+        total_bytes = 0
+        routes = list(cached_routes())
+        for path, view in routes:
+            start = time.perf_counter()
+            response = view(factory.get(path))
+            elapsed = (time.perf_counter() - start) * 1000
+            if response.status_code != 200:
+                failed.append(path)
+                self.stdout.write(self.style.ERROR(f'{path}: HTTP {response.status_code}'))
+                continue
+            total_bytes += len(response.content)
+            self.stdout.write(f'{path}: {len(response.content) // 1024}KB in {elapsed:.1f}ms')
+
+        if failed:
+            raise CommandError(f'{len(failed)} page(s) failed to render: {", ".join(failed)}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Warmed {len(routes)} page(s), {total_bytes // 1024}KB total'
+        ))
@@ -0,0 +1,94 @@
+# Generated by Django 5.2 on 2026-10-18 15:53
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+# PostgreSQL only: the column is kept current by a trigger, and the GIN
+# indexes use operator classes other backends don't have. On SQLite the
+# column simply stays NULL and search falls back to icontains.
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('english', coalesce(NEW.section_title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(NEW.page_title, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(NEW.section_description, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(NEW.content, '')), 'C')
+"""
+
+FORWARD_SQL = [
+    f"""
+    CREATE OR REPLACE FUNCTION searchable_content_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {SEARCH_VECTOR_SQL};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE TRIGGER searchable_content_search_vector_trigger
+    BEFORE INSERT OR UPDATE ON searchable_content
+    FOR EACH ROW EXECUTE FUNCTION searchable_content_search_vector_update();
+    """,
+    "CREATE INDEX idx_search_content_vector ON searchable_content USING gin (search_vector);",
+    "CREATE INDEX idx_search_content_content_trgm ON searchable_content USING gin (content gin_trgm_ops);",
+    "CREATE INDEX idx_search_content_title_trgm ON searchable_content USING gin (section_title gin_trgm_ops);",
+    "CREATE INDEX idx_search_content_page_title_trgm ON searchable_content USING gin (page_title gin_trgm_ops);",
+]
+
+REVERSE_SQL = [
+    "DROP INDEX IF EXISTS idx_search_content_page_title_trgm;",
+    "DROP INDEX IF EXISTS idx_search_content_title_trgm;",
+    "DROP INDEX IF EXISTS idx_search_content_content_trgm;",
+    "DROP INDEX IF EXISTS idx_search_content_vector;",
+    "DROP TRIGGER IF EXISTS searchable_content_search_vector_trigger ON searchable_content;",
+    "DROP FUNCTION IF EXISTS searchable_content_search_vector_update();",
+]
+
+
+def create_search_objects(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for statement in FORWARD_SQL:
+        schema_editor.execute(statement)
+
+
+def drop_search_objects(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for statement in REVERSE_SQL:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.CreateModel(
+            name='SearchableContent',
+            fields=[
+                ('id', models.BigAutoField(db_column='searchable_content_id', primary_key=True, serialize=False)),
+                ('page_url', models.CharField(max_length=500)),
+                ('page_title', models.CharField(max_length=200)),
+                ('section_name', models.CharField(max_length=100)),
+                ('section_title', models.CharField(max_length=200)),
+                ('section_description', models.TextField(blank=True, null=True)),
+                ('content', models.TextField()),
+                ('search_priority', models.IntegerField(default=1)),
+                ('is_active', models.BooleanField(default=True)),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'searchable_content',
+                'ordering': ['page_url', 'id'],
+                'indexes': [models.Index(fields=['page_url'], name='idx_search_content_page_url'), models.Index(condition=models.Q(('is_active', True)), fields=['search_priority', 'is_active'], name='idx_search_content_prio_act')],
+            },
+        ),
+        migrations.RunPython(create_search_objects, drop_search_objects),
+    ]
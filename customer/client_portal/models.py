@@ -0,0 +1,38 @@
+# customer/client_portal/models.py
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+
+class SearchableContent(models.Model):
+    """
+    One section of a rendered marketing page, as designed in
+    database-code.sql. Rows are (re)built by `manage.py index_search_content`;
+    on PostgreSQL a trigger keeps `search_vector` current.
+    """
+    id = models.BigAutoField(primary_key=True, db_column='searchable_content_id')
+    page_url = models.CharField(max_length=500)
+    page_title = models.CharField(max_length=200)
+    section_name = models.CharField(max_length=100)  # Element id, used as the #anchor
+    section_title = models.CharField(max_length=200)
+    section_description = models.TextField(blank=True, null=True)
+    content = models.TextField()
+    search_priority = models.IntegerField(default=1)
+    is_active = models.BooleanField(default=True)
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'searchable_content'
+        ordering = ['page_url', 'id']
+        indexes = [
+            models.Index(fields=['page_url'], name='idx_search_content_page_url'),
+            models.Index(
+                fields=['search_priority', 'is_active'],
+                name='idx_search_content_prio_act',
+                condition=models.Q(is_active=True),
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.page_url}#{self.section_name}'
@@ -0,0 +1,83 @@
+# customer/client_portal/page_cache.py
+"""
+Full-page cache for the marketing pages.
+
+Rendered pages are stored in the ``pages`` cache under their URL path and
+a version made of the newest template mtime and the static manifest hash,
+so editing a template or deploying new static files retires every cached
+page. Each entry carries a strong ETag and Last-Modified so browsers and
+the CDN can revalidate with a 304 instead of downloading the page again.
+"""
+import hashlib
+import os
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.template.autoreload import get_template_directories
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+PAGE_CACHE_ALIAS = 'pages'
+
+_templates_mtime = None
+
+
+def templates_mtime():
+    """Newest mtime across the project template directories"""
+    global _templates_mtime
+    # Templates only change on deploy in production; re-scan on every request in DEBUG
+    if _templates_mtime is None or settings.DEBUG:
+        latest = 0
+        for directory in get_template_directories():
+            for root, _, files in os.walk(directory):
+                for name in files:
+                    latest = max(latest, os.path.getmtime(os.path.join(root, name)))
+        _templates_mtime = int(latest)
+    return _templates_mtime
+
+
+def page_cache_key(path):
+    manifest_hash = getattr(staticfiles_storage, 'manifest_hash', '')
+    return f'page:{templates_mtime()}:{manifest_hash}:{path}'
+
+
+def get_page(path):
+    return caches[PAGE_CACHE_ALIAS].get(page_cache_key(path))
+
+
+def store_page(path, response):
+    """Cache a rendered 200 response and return the stored entry"""
+    content = response.content
+    entry = {
+        'content': content,
+        'content_type': response['Content-Type'],
+        'etag': f'"{hashlib.md5(content, usedforsecurity=False).hexdigest()}"',
+        'last_modified': templates_mtime(),
+    }
+    caches[PAGE_CACHE_ALIAS].set(page_cache_key(path), entry, settings.PAGE_CACHE_TIMEOUT)
+    return entry
+
+
+def clear_pages():
+    caches[PAGE_CACHE_ALIAS].clear()
+
+
+def page_response(request, entry):
+    """Serve a cached entry, answering conditional requests with a 304"""
+    response = get_conditional_response(
+        request, etag=entry['etag'], last_modified=entry['last_modified']
+    )
+    if response is None:
+        response = HttpResponse(entry['content'], content_type=entry['content_type'])
+
+    response['ETag'] = entry['etag']
+    response['Last-Modified'] = http_date(entry['last_modified'])
+    patch_cache_control(
+        response,
+        public=True,
+        max_age=settings.PAGE_CACHE_BROWSER_MAX_AGE,
+        s_maxage=settings.PAGE_CACHE_CDN_MAX_AGE,
+    )
+    return response
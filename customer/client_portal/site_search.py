@@ -0,0 +1,268 @@
+# customer/client_portal/site_search.py
+"""
+Site search over the rendered marketing pages.
+
+``manage.py index_search_content`` renders every page, splits the <main>
+content into its top-level <section>s and stores them in the
+``searchable_content`` table. On PostgreSQL a trigger maintains a weighted
+tsvector (GIN indexed) and pg_trgm indexes cover the titles and content;
+``search()`` ranks prefix full-text matches plus fuzzy title matches. Other
+backends (SQLite in development) fall back to icontains filters.
+
+Hot queries are answered from an in-process LRU. Entries are tied to the
+index version (row count and last update), which is re-read at most every
+SEARCH_INDEX_CHECK_INTERVAL seconds, so a re-index shows up in every worker
+without a restart.
+"""
+import re
+import threading
+import time
+from collections import OrderedDict
+from html.parser import HTMLParser
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db import connection, transaction
+from django.db.models import Count, F, FloatField, Max, Q, Value
+from django.db.models.functions import Cast, Greatest
+
+from .models import SearchableContent
+
+SEARCH_CONFIG = 'english'
+RESULT_FIELDS = ('page_url', 'page_title', 'section_name', 'section_title', 'section_description', 'content')
+SNIPPET_LENGTH = 300
+
+# Shared by many pages, so they would swamp the results
+EXCLUDED_SECTIONS = {'global-quote-form'}
+EXCLUDED_PAGES = {'/404/'}
+
+
+# ==================== EXTRACTION ====================
+
+class PageParser(HTMLParser):
+    """Collects the title, meta description and top-level <main> sections of a page"""
+
+    SKIP_TAGS = {'script', 'style', 'noscript', 'svg', 'template', 'form', 'select', 'button'}
+    HEADINGS = {'h1', 'h2', 'h3'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = []
+        self.description = ''
+        self.sections = []
+        self.loose = self.new_section('')  # <main> text outside any section
+        self.current = None
+        self.capture = None
+        self.in_title = False
+        self.main_depth = self.section_depth = self.skip_depth = 0
+
+    @staticmethod
+    def new_section(name):
+        return {'name': name, 'headings': [], 'paragraphs': [], 'text': []}
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'title':
+            self.in_title = True
+        elif tag == 'meta' and attrs.get('name') == 'description':
+            self.description = attrs.get('content') or ''
+        elif tag == 'main':
+            self.main_depth += 1
+        elif tag in self.SKIP_TAGS:
+            self.skip_depth += 1
+        elif self.main_depth and tag == 'section':
+            self.section_depth += 1
+            if self.section_depth == 1:
+                self.current = self.new_section(attrs.get('id') or '')
+                self.sections.append(self.current)
+        elif self.main_depth and tag in self.HEADINGS | {'p'} and self.capture is None:
+            self.capture = (tag, [])
+
+    def handle_endtag(self, tag):
+        if tag == 'title':
+            self.in_title = False
+        elif tag == 'main':
+            self.main_depth = max(0, self.main_depth - 1)
+        elif tag in self.SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif self.main_depth and tag == 'section':
+            self.section_depth = max(0, self.section_depth - 1)
+            if not self.section_depth:
+                self.current = None
+        elif self.capture and tag == self.capture[0]:
+            text = collapse(' '.join(self.capture[1]))
+            if text:
+                target = self.current or self.loose
+                target['paragraphs' if tag == 'p' else 'headings'].append(text)
+            self.capture = None
+
+    def handle_data(self, data):
+        if self.in_title:
+            self.title.append(data)
+        if not self.main_depth or self.skip_depth:
+            return
+        (self.current or self.loose)['text'].append(data)
+        if self.capture:
+            self.capture[1].append(data)
+
+
+def collapse(text):
+    return ' '.join(text.split())
+
+
+def extract_sections(page_url, html):
+    """SearchableContent rows (unsaved) for one rendered page"""
+    parser = PageParser()
+    parser.feed(html)
+    parser.close()
+
+    # "Web Development | Dycetix Technology Solutions" -> "Web Development"
+    page_title = collapse(''.join(parser.title)).split(' | ')[0][:200]
+    sections = [s for s in parser.sections if s['name'] not in EXCLUDED_SECTIONS]
+    if not any(collapse(' '.join(s['text'])) for s in sections):
+        # Form-only and sectionless pages are still found by their title and description
+        sections = [parser.loose]
+        parser.loose['name'] = ''
+        parser.loose['paragraphs'].insert(0, parser.description)
+
+    rows = []
+    for position, section in enumerate(sections):
+        content = collapse(' '.join(section['text'])) or collapse(parser.description)
+        if not content:
+            continue
+        description = next((p for p in section['paragraphs'] if p), '')
+        rows.append(SearchableContent(
+            page_url=page_url,
+            page_title=page_title,
+            section_name=section['name'][:100],
+            section_title=(section['headings'][0] if section['headings'] else page_title)[:200],
+            section_description=description[:SNIPPET_LENGTH],
+            content=content,
+            # Hero sections introduce the page, so they rank first among equals
+            search_priority=2 if position == 0 else 1,
+        ))
+    return rows
+
+
+def index_pages(pages):
+    """
+    Replace the index with the sections of `pages` ({url: html}). Returns
+    the number of rows, or None when nothing changed.
+    """
+    rows = [
+        row for url, html in pages.items() if url not in EXCLUDED_PAGES
+        for row in extract_sections(url, html)
+    ]
+    fields = ('page_url', 'page_title', 'section_name', 'section_title', 'section_description',
+              'content', 'search_priority')
+    new = [tuple(getattr(row, field) for field in fields) for row in rows]
+    with transaction.atomic():
+        current = list(SearchableContent.objects.filter(is_active=True).order_by('id').values_list(*fields))
+        if current == new:
+            return None
+        SearchableContent.objects.all().delete()
+        SearchableContent.objects.bulk_create(rows)
+    query_cache.clear()
+    return len(rows)
+
+
+# ==================== SEARCH ====================
+
+class QueryCache:
+    """Thread-safe LRU of search results, dropped whenever the index version changes"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.version = None
+        self.checked_at = 0.0
+
+    def current_version(self):
+        now = time.monotonic()
+        if now - self.checked_at >= settings.SEARCH_INDEX_CHECK_INTERVAL:
+            stats = SearchableContent.objects.aggregate(rows=Count('id'), updated=Max('updated_at'))
+            version = (stats['rows'], stats['updated'])
+            with self.lock:
+                if version != self.version:
+                    self.entries.clear()
+                    self.version = version
+                self.checked_at = now
+        return self.version
+
+    def get(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key]
+        return None
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.checked_at = 0.0
+
+
+query_cache = QueryCache(settings.SEARCH_CACHE_SIZE)
+
+
+def normalize(query):
+    return collapse(query.lower())[:100]
+
+
+def ranked_queryset(query):
+    queryset = SearchableContent.objects.filter(is_active=True)
+    if connection.vendor != 'postgresql':
+        return queryset.filter(
+            Q(section_title__icontains=query) |
+            Q(page_title__icontains=query) |
+            Q(section_description__icontains=query) |
+            Q(content__icontains=query)
+        ).annotate(search_rank=Cast(F('search_priority'), FloatField()))
+
+    terms = re.findall(r'\w+', query)
+    if not terms:
+        return queryset.none()
+    # Prefix-match every term, so "web dev" finds "web development" as it is typed
+    search_query = SearchQuery(' & '.join(f'{term}:*' for term in terms), search_type='raw', config=SEARCH_CONFIG)
+    similarity = Greatest(TrigramSimilarity('section_title', query), TrigramSimilarity('page_title', query))
+
+    matches = Q(search_vector=search_query)
+    # `%` operator and ILIKE, both served by the gin_trgm_ops indexes
+    matches |= Q(section_title__trigram_similar=query) | Q(page_title__trigram_similar=query)
+    if len(query) >= 3:
+        matches |= Q(content__icontains=query)
+
+    # Cast to double precision so the rank round-trips exactly through cursors
+    return queryset.filter(matches).annotate(
+        search_rank=Cast(
+            SearchRank(F('search_vector'), search_query) + similarity + F('search_priority') * Value(0.05),
+            FloatField(),
+        )
+    )
+
+
+def search(query, limit=8):
+    """Ranked section matches for `query` as JSON-ready dicts"""
+    query = normalize(query)
+    if len(query) < 2:
+        return []
+
+    key = (query, limit, query_cache.current_version())
+    results = query_cache.get(key)
+    if results is None:
+        rows = ranked_queryset(query).order_by('-search_rank', 'id')[:limit].values(*RESULT_FIELDS, 'search_rank')
+        results = []
+        for row in rows:
+            row['content'] = row['content'][:SNIPPET_LENGTH]
+            row['score'] = round(row.pop('search_rank'), 4)
+            results.append(row)
+        query_cache.put(key, results)
+    return results
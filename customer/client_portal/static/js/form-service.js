@@ -11,6 +11,7 @@ class FormService {
                             'https://dycetix-admin.onrender.com');
         
         this.apiEndpoint = adminBaseUrl + '/api/forms/submit/client-requirement/';
+        this.uploadsEndpoint = adminBaseUrl + '/api/forms/uploads/';
     }
     
     // === SHARED VALIDATION ===
@@ -50,35 +51,43 @@ class FormService {
     }
     
     // === SHARED FILE HANDLING ===
+    // Files go straight to storage: the admin API hands out an upload slot
+    // per file, each file is POSTed to its slot, and the form is submitted
+    // with the slots' tokens. If that fails the files are sent as multipart
+    // parts of the submission instead.
     async processFiles(fileInput) {
         if (!fileInput || !fileInput.files || fileInput.files.length === 0) {
             return [];
         }
         
-        const files = Array.from(fileInput.files);
-        const processedFiles = [];
-        
-        for (const file of files) {
-            const base64 = await this.fileToBase64(file);
-            processedFiles.push({
-                name: file.name,
-                type: file.type,
-                size: file.size,
-                data: base64.split(',')[1],
-                extension: '.' + file.name.split('.').pop().toLowerCase()
-            });
-        }
-        
-        return processedFiles;
+        return Array.from(fileInput.files);
     }
     
-    fileToBase64(file) {
-        return new Promise((resolve, reject) => {
-            const reader = new FileReader();
-            reader.readAsDataURL(file);
-            reader.onload = () => resolve(reader.result);
-            reader.onerror = error => reject(error);
+    async uploadFiles(files) {
+        const response = await fetch(this.uploadsEndpoint, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                files: files.map(file => ({ name: file.name, size: file.size, type: file.type }))
+            })
         });
+        if (!response.ok) {
+            throw new Error(`Upload slots request failed with status: ${response.status}`);
+        }
+        
+        const { uploads } = await response.json();
+        await Promise.all(uploads.map(async (slot, index) => {
+            const body = new FormData();
+            Object.entries(slot.fields).forEach(([key, value]) => body.append(key, value));
+            body.append('file', files[index]);  // Must come last for S3
+            
+            const result = await fetch(slot.url, { method: slot.method, body: body });
+            if (!result.ok) {
+                throw new Error(`Upload of ${files[index].name} failed with status: ${result.status}`);
+            }
+        }));
+        
+        return uploads.map(slot => slot.token);
     }
     
     // === SHARED DATA COLLECTION ===
@@ -101,20 +110,35 @@ class FormService {
     
     // === SHARED API SUBMISSION ===
     async submitToAPI(formData, files = []) {
-        const payload = {
-            ...formData,
-            files: files
-        };
+        const payload = new FormData();
+        
+        Object.entries(formData).forEach(([key, value]) => {
+            if (Array.isArray(value)) {
+                value.forEach(item => payload.append(key, item));
+            } else {
+                payload.append(key, value);
+            }
+        });
+        
+        if (files.length > 0) {
+            try {
+                const tokens = await this.uploadFiles(files);
+                tokens.forEach(token => payload.append('uploads', token));
+                files = [];
+            } catch (error) {
+                console.warn('Direct upload failed, sending the files with the form:', error);
+            }
+        }
+        
+        files.forEach(file => payload.append('files', file, file.name));
         
-        console.log(`Submitting ${this.formType} form:`, payload);
+        console.log(`Submitting ${this.formType} form:`, formData, `(${files.length} file(s))`);
         
         try {
+            // No Content-Type header: the browser sets the multipart boundary
             const response = await fetch(this.apiEndpoint, {
                 method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify(payload)
+                body: payload
             });
             
             if (!response.ok) {
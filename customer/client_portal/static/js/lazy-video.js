@@ -0,0 +1,31 @@
+// Start videos rendered with data-autoplay (see the responsive_video template tag)
+// once they scroll into view, and pause them again when they leave it.
+// Nothing is fetched before the page has loaded; visitors who prefer reduced
+// motion or less data keep the poster frame.
+(function () {
+  const videos = document.querySelectorAll('video[data-autoplay]');
+  if (!videos.length || !('IntersectionObserver' in window)) return;
+
+  const reducedMotion = window.matchMedia('(prefers-reduced-motion: reduce)').matches;
+  const saveData = navigator.connection && navigator.connection.saveData;
+  if (reducedMotion || saveData) return;
+
+  const observer = new IntersectionObserver((entries) => {
+    entries.forEach((entry) => {
+      const video = entry.target;
+      if (entry.isIntersecting) {
+        video.muted = true;
+        video.play().catch(() => {});
+      } else if (!video.paused) {
+        video.pause();
+      }
+    });
+  }, { rootMargin: '200px 0px' });
+
+  const start = () => videos.forEach((video) => observer.observe(video));
+  if (document.readyState === 'complete') {
+    start();
+  } else {
+    window.addEventListener('load', start, { once: true });
+  }
+})();
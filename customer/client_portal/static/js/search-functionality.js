@@ -114,7 +114,7 @@ document.addEventListener('DOMContentLoaded', function() {
         }
         
         performSearch(searchTerm);
-    }, 300));
+    }, 150));
 
     // Handle Enter key
     searchInput.addEventListener('keypress', function(e) {
@@ -161,7 +161,9 @@ document.addEventListener('DOMContentLoaded', function() {
     `;
 
     try {
-        const response = await fetch(`/api/search/?q=${encodeURIComponent(searchTerm)}`);
+        // Keystrokes use the in-memory typeahead; Enter runs the full ranked search
+        const endpoint = isEnterKeySearch ? '/api/search/' : '/api/suggest/';
+        const response = await fetch(`${endpoint}?q=${encodeURIComponent(searchTerm)}`);
         const data = await response.json();
         
         console.log('Search results:', data);
@@ -303,7 +305,9 @@ async function performSearch(searchTerm) {
     `;
 
     try {
-        const response = await fetch(`/api/search/?q=${encodeURIComponent(searchTerm)}`);
+        // Keystrokes use the in-memory typeahead; Enter runs the full ranked search
+        const endpoint = isEnterKeySearch ? '/api/search/' : '/api/suggest/';
+        const response = await fetch(`${endpoint}?q=${encodeURIComponent(searchTerm)}`);
         const data = await response.json();
         
         console.log('Search results:', data);
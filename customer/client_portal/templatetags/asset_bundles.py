@@ -0,0 +1,31 @@
+# customer/client_portal/templatetags/asset_bundles.py
+from django import template
+from django.utils.safestring import mark_safe
+
+from ..asset_bundles import TAG_PATTERNS, render_bundles
+
+register = template.Library()
+
+
+class BundleNode(template.Node):
+    def __init__(self, kind, nodelist):
+        self.kind = kind
+        self.nodelist = nodelist
+
+    def render(self, context):
+        return mark_safe(render_bundles(self.nodelist.render(context), self.kind))
+
+
+@register.tag
+def bundle(parser, token):
+    """
+    Serve the local stylesheets or scripts inside the block as minified
+    bundles (see asset_bundles.py), e.g.
+    {% bundle 'css' %}<link rel="stylesheet" href="{% static 'css/nav/nav.css' %}">{% endbundle %}
+    """
+    bits = token.split_contents()
+    if len(bits) != 2 or bits[1].strip('\'"') not in TAG_PATTERNS:
+        raise template.TemplateSyntaxError(f"{bits[0]} takes one argument, 'css' or 'js'")
+    nodelist = parser.parse(('endbundle',))
+    parser.delete_first_token()
+    return BundleNode(bits[1].strip('\'"'), nodelist)
@@ -0,0 +1,54 @@
+# customer/client_portal/templatetags/responsive_images.py
+import os
+
+from django import template
+from django.forms.utils import flatatt
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from ..image_derivatives import MIME_TYPES, derivatives_for
+
+register = template.Library()
+
+
+@register.simple_tag
+def responsive_image(name, sizes='100vw', **attrs):
+    """
+    <picture> with AVIF/WebP srcsets for a static image, e.g.
+    {% responsive_image 'images/main/adobe.jpg' alt="Adobe" sizes="50vw" class="hero" %}
+    Falls back to a plain <img> when no derivatives have been built.
+    """
+    attrs.setdefault('decoding', 'async')
+    img = format_html('<img src="{}"{}>', static(name), flatatt(attrs))
+
+    entry = derivatives_for(name)
+    if not entry:
+        return img
+
+    sources = format_html_join(
+        '',
+        '<source type="{}" srcset="{}" sizes="{}">',
+        (
+            (MIME_TYPES[fmt], ', '.join(f'{static(derivative)} {width}w' for width, derivative in variants), sizes)
+            for fmt, variants in entry['variants'].items()
+        ),
+    )
+    return format_html('<picture>{}{}</picture>', sources, img)
+
+
+@register.simple_tag
+def image_set(name, width=1600):
+    """
+    CSS image-set() for background images, using the largest derivative up
+    to `width` in each format and the original as the last candidate
+    """
+    entry = derivatives_for(name)
+    if not entry:
+        return f"url('{static(name)}')"
+
+    original = f"url('{static(name)}') type('{MIME_TYPES[os.path.splitext(name)[1].lower()]}')"
+    candidates = []
+    for fmt, variants in entry['variants'].items():
+        fitting = [derivative for w, derivative in variants if w <= width] or [variants[0][1]]
+        candidates.append(f"url('{static(fitting[-1])}') type('{MIME_TYPES[fmt]}')")
+    return f"image-set({', '.join(candidates + [original])})"
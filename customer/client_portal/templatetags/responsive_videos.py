@@ -0,0 +1,61 @@
+# customer/client_portal/templatetags/responsive_videos.py
+from django import template
+from django.forms.utils import flatatt
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from ..video_derivatives import renditions_for
+
+register = template.Library()
+
+
+@register.simple_tag
+def responsive_video(name, **attrs):
+    """
+    <video preload="none"> with the generated poster and the ladder
+    renditions, smallest first, e.g.
+    {% responsive_video 'videos/web-dev-hero.mp4' class="hero" muted=True loop=True %}
+
+    Boolean attributes take True; underscores become hyphens (aria_label).
+    `autoplay` is rendered as data-autoplay so nothing downloads before
+    js/lazy-video.js starts playback once the video scrolls into view.
+    Falls back to the original file when no renditions have been built.
+    """
+    attrs = {key.replace('_', '-'): value for key, value in attrs.items()}
+    attrs['preload'] = 'none'
+    if attrs.pop('autoplay', False):
+        attrs['data-autoplay'] = True
+        # Browsers only allow unattended playback of muted, inline videos
+        attrs.setdefault('muted', True)
+        attrs.setdefault('playsinline', True)
+
+    entry = renditions_for(name)
+    if not entry:
+        return format_html(
+            '<video{}><source src="{}" type="video/mp4"></video>', flatatt(attrs), static(name)
+        )
+
+    attrs.setdefault('poster', static(entry['poster']['webp']))
+    attrs.setdefault('width', entry['width'])
+    attrs.setdefault('height', entry['height'])
+
+    # The first playable <source> wins: every rung but the largest is limited
+    # to viewports no wider than itself, and browsers that ignore `media`
+    # settle for the smallest file
+    sources = entry['sources']
+    largest = max(sources, key=lambda source: source['width'])
+    return format_html(
+        '<video{}>{}</video>',
+        flatatt(attrs),
+        format_html_join(
+            '',
+            '<source src="{}" type="video/mp4"{}>',
+            (
+                (
+                    static(source['name']),
+                    flatatt({} if source is largest else {'media': f"(max-width: {source['width']}px)"}),
+                )
+                for source in sources
+            ),
+        ),
+    )
@@ -0,0 +1,6 @@
+# customer/client_portal/tests/__init__.py
+# Local-memory caches: tests never touch the configured cache backends
+TEST_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'default'},
+    'pages': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'pages'},
+}
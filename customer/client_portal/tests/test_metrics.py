@@ -0,0 +1,61 @@
+# customer/client_portal/tests/test_metrics.py
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from prometheus_client import REGISTRY
+
+from dycetix_common.metrics import RequestMetricsMiddleware
+
+from ..models import SearchableContent
+
+
+def sample(name, view):
+    return REGISTRY.get_sample_value(name, {'view': view}) or 0
+
+
+class MetricsEndpointTests(TestCase):
+
+    @override_settings(METRICS_TOKEN='scrape-token')
+    def test_requires_the_token(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong').status_code, 403)
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer scrape-token')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'django_request_duration_seconds', response.content)
+
+
+class RequestMetricsMiddlewareTests(TestCase):
+
+    def test_sync_requests_count_their_queries(self):
+        def view(request):
+            SearchableContent.objects.count()
+            return HttpResponse('ok')
+
+        middleware = RequestMetricsMiddleware(view)
+        self.assertFalse(iscoroutinefunction(middleware))
+        before = sample('django_request_sql_queries_sum', 'unresolved')
+        middleware(RequestFactory().get('/'))
+        self.assertEqual(sample('django_request_sql_queries_sum', 'unresolved') - before, 1)
+
+    async def test_async_requests_count_their_queries(self):
+        async def view(request):
+            await sync_to_async(SearchableContent.objects.count)()
+            return HttpResponse('ok')
+
+        middleware = RequestMetricsMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        before = sample('django_request_sql_queries_sum', 'unresolved')
+        response = await middleware(RequestFactory().get('/'))
+        self.assertEqual(response.content, b'ok')
+        self.assertEqual(sample('django_request_sql_queries_sum', 'unresolved') - before, 1)
+
+    async def test_async_client_requests_are_timed(self):
+        before = REGISTRY.get_sample_value(
+            'django_request_duration_seconds_count', {'view': 'health/', 'method': 'GET', 'status': '200'},
+        ) or 0
+        response = await self.async_client.get('/health/')
+        self.assertEqual(response.status_code, 200)
+        after = REGISTRY.get_sample_value(
+            'django_request_duration_seconds_count', {'view': 'health/', 'method': 'GET', 'status': '200'},
+        )
+        self.assertEqual(after - before, 1)
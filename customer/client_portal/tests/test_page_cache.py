@@ -0,0 +1,85 @@
+# customer/client_portal/tests/test_page_cache.py
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.views.generic import TemplateView
+
+from .. import page_cache
+from . import TEST_CACHES
+
+# Plain static storage: no collectstatic manifest is needed to render pages
+TEST_STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+
+@override_settings(
+    CACHES=TEST_CACHES,
+    STORAGES=TEST_STORAGES,
+    PAGE_CACHE_ENABLED=True,
+    PAGE_CACHE_BROWSER_MAX_AGE=300,
+    PAGE_CACHE_CDN_MAX_AGE=3600,
+)
+class PageCacheTests(TestCase):
+    url = '/about-us/'
+
+    def setUp(self):
+        page_cache.clear_pages()
+        page_cache._templates_mtime = None
+        self.addCleanup(setattr, page_cache, '_templates_mtime', None)
+
+    def test_served_from_cache_with_validators(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, 200)
+        self.assertRegex(first['ETag'], r'^"[0-9a-f]{32}"$')  # Strong: no W/ prefix
+        self.assertIn('Last-Modified', first)
+        self.assertEqual(
+            set(first['Cache-Control'].split(', ')), {'public', 'max-age=300', 's-maxage=3600'}
+        )
+
+        with mock.patch.object(TemplateView, 'get') as render:
+            second = self.client.get(self.url)
+        render.assert_not_called()
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['ETag'], first['ETag'])
+
+    def test_if_none_match_gets_304(self):
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH='"stale"').status_code, 200)
+
+    def test_template_change_retires_cached_pages(self):
+        template_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, template_dir)
+        templates = [{**settings.TEMPLATES[0], 'DIRS': [*settings.TEMPLATES[0]['DIRS'], template_dir]}]
+        # DEBUG: template mtimes are re-read on every request
+        with override_settings(TEMPLATES=templates, DEBUG=True):
+            first = self.client.get(self.url)
+            key = page_cache.page_cache_key(self.url)
+
+            template = os.path.join(template_dir, 'edited.html')
+            with open(template, 'w'):
+                pass
+            os.utime(template, (page_cache.templates_mtime() + 60,) * 2)
+
+            self.assertNotEqual(page_cache.page_cache_key(self.url), key)
+            self.assertIsNone(page_cache.get_page(self.url))
+            second = self.client.get(self.url)
+
+        self.assertNotEqual(second['Last-Modified'], first['Last-Modified'])
+        self.assertEqual(second['ETag'], first['ETag'])  # Same bytes
+
+    @override_settings(PAGE_CACHE_ENABLED=False)
+    def test_disabled(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('ETag', response)
+        self.assertIsNone(page_cache.get_page(self.url))
@@ -0,0 +1,54 @@
+# customer/client_portal/tests/test_site_search.py
+from django.test import TestCase, override_settings
+
+from ..models import SearchableContent
+from ..site_search import index_pages, query_cache
+from . import TEST_CACHES
+
+PAGES = {
+    '/web-development/': '''
+        <html><head><title>Web Development | Dycetix</title></head><body><main>
+        <section id="hero"><h1>Web Development</h1><p>Fast websites and web applications.</p></section>
+        <section id="stack"><h2>Our Stack</h2><p>Django, React and PostgreSQL.</p></section>
+        <section id="global-quote-form"><h2>Get a quote</h2><p>Web development pricing.</p></section>
+        </main></body></html>
+    ''',
+    '/graphic-design/': '''
+        <html><head><title>Graphic Design | Dycetix</title></head><body><main>
+        <section id="hero"><h1>Graphic Design</h1><p>Logos, branding and web graphics.</p></section>
+        </main></body></html>
+    ''',
+    '/404/': '<html><head><title>Not found</title></head><body><main><section><p>Web</p></section></main></body></html>',
+}
+
+
+@override_settings(CACHES=TEST_CACHES, SEARCH_BROWSER_MAX_AGE=60)
+class SiteSearchTests(TestCase):
+
+    def setUp(self):
+        query_cache.clear()
+        self.assertEqual(index_pages(PAGES), 3)
+
+    def test_index_pages(self):
+        self.assertEqual(
+            sorted(SearchableContent.objects.values_list('page_url', 'section_name', 'section_title')),
+            [
+                ('/graphic-design/', 'hero', 'Graphic Design'),
+                ('/web-development/', 'hero', 'Web Development'),
+                ('/web-development/', 'stack', 'Our Stack'),
+            ],
+        )
+        self.assertIsNone(index_pages(PAGES))  # Unchanged: nothing rewritten
+
+    def test_search_api(self):
+        response = self.client.get('/api/search/', {'q': 'Web Development'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Cache-Control'], 'public, max-age=60')
+        results = response.json()['results']
+        # Hero first; the shared quote form isn't indexed
+        self.assertEqual(
+            [(result['page_url'], result['section_name']) for result in results],
+            [('/web-development/', 'hero'), ('/web-development/', 'stack')],
+        )
+        self.assertEqual(self.client.get('/api/search/', {'q': 'w'}).json()['results'], [])  # Too short
+        self.assertEqual(len(self.client.get('/api/search/', {'q': 'web', 'limit': 1}).json()['results']), 1)
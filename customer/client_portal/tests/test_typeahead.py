@@ -0,0 +1,42 @@
+# customer/client_portal/tests/test_typeahead.py
+from django.test import TestCase, override_settings
+
+from ..site_search import index_pages, query_cache
+from ..typeahead import typeahead
+from . import TEST_CACHES
+from .test_site_search import PAGES
+
+
+@override_settings(CACHES=TEST_CACHES)
+class TypeaheadTests(TestCase):
+
+    def setUp(self):
+        query_cache.clear()
+        typeahead.index = None
+        index_pages(PAGES)
+
+    def test_suggest_api(self):
+        body = self.client.get('/api/suggest/', {'q': 'web de'}).json()
+        self.assertEqual(body['completions'][0], 'web development')
+        self.assertEqual(body['results'][0]['section_title'], 'Web Development')
+
+        # A trailing stopword is matched as typed, not completed from the word before it
+        body = self.client.get('/api/suggest/', {'q': 'web and'}).json()
+        self.assertEqual(body['completions'], [])
+        self.assertEqual(body['results'][0]['section_title'], 'Web Development')
+
+        body = self.client.get('/api/suggest/', {'q': 'brand'}).json()
+        self.assertEqual([result['page_url'] for result in body['results']], ['/graphic-design/'])
+        self.assertEqual(self.client.get('/api/suggest/', {'q': 'zzz'}).json()['results'], [])
+
+    def test_reindex_reaches_search_and_suggestions(self):
+        self.assertEqual(self.client.get('/api/suggest/', {'q': 'photo'}).json()['results'], [])
+        index_pages({**PAGES, '/photography-and-videography/': '''
+            <html><head><title>Photography | Dycetix</title></head><body><main>
+            <section id="hero"><h1>Photography</h1><p>Product and event photography.</p></section>
+            </main></body></html>
+        '''})
+        suggestions = self.client.get('/api/suggest/', {'q': 'photo'}).json()['results']
+        self.assertEqual(suggestions[0]['page_url'], '/photography-and-videography/')
+        results = self.client.get('/api/search/', {'q': 'photography'}).json()['results']
+        self.assertEqual(results[0]['page_url'], '/photography-and-videography/')
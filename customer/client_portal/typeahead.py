@@ -0,0 +1,191 @@
+# customer/client_portal/typeahead.py
+"""
+In-memory typeahead over the searchable_content sections.
+
+The whole corpus (a few hundred sections) is loaded into a sorted-prefix
+index: every prefix of every indexed word maps to a bitmask of the sections
+containing it, a compact ranked array of those sections and the most common
+completions. A keystroke is then a dict lookup plus a slice; multi-word
+queries AND the bitmasks and walk the ranked array of the most selective
+word. Apart from the periodic index version check, keystrokes never touch
+the database.
+
+The index is built when a worker starts (``preload()``, called from wsgi.py
+and asgi.py) and rebuilt by the first lookup after the search index
+version changes (the same periodic check site_search.QueryCache uses), so
+``index_search_content`` reaches every worker without a restart. Concurrent lookups keep using the previous
+index while the rebuild runs.
+"""
+import logging
+import re
+import threading
+import time
+from array import array
+
+from .models import SearchableContent
+from .site_search import normalize, query_cache
+
+logger = logging.getLogger(__name__)
+
+MAX_RESULTS = 20
+MAX_COMPLETIONS = 5
+MAX_PREFIX_LENGTH = 20
+SNIPPET_LENGTH = 150
+
+# Where a word appears decides how strongly it suggests the section
+FIELD_WEIGHTS = (('section_title', 8), ('page_title', 4), ('section_description', 2), ('content', 1))
+STOPWORDS = frozenset(
+    'a an and are as at be but by can for from has have how in is it its of on or our that the their '
+    'this to we what when which who will with you your'.split()
+)
+WORD_PATTERN = re.compile(r'[a-z0-9]+(?:[&+#][a-z0-9]*)?')
+
+
+def words(text):
+    return WORD_PATTERN.findall((text or '').lower())
+
+
+class PrefixIndex:
+    """Immutable prefix -> (mask, ranked sections, completions) lookup over one index version"""
+
+    def __init__(self, rows, version=None):
+        self.version = version
+        self.results = []
+        term_scores = {}  # term -> {section: score}
+        for position, row in enumerate(rows):
+            self.results.append({
+                'page_url': row['page_url'],
+                'page_title': row['page_title'],
+                'section_name': row['section_name'],
+                'section_title': row['section_title'],
+                'section_description': row['section_description'] or '',
+                'content': row['content'][:SNIPPET_LENGTH],
+            })
+            # Hero sections introduce the page, so they win ties
+            section = {}
+            for field, weight in FIELD_WEIGHTS:
+                for word in words(row[field]):
+                    if len(word) >= 2 and word not in STOPWORDS:
+                        section[word] = section.get(word, row['search_priority'] * 0.1) + weight
+            for word, score in section.items():
+                term_scores.setdefault(word, {})[position] = score
+
+        prefix_scores = {}  # prefix -> {section: best score of any word with that prefix}
+        prefix_terms = {}   # prefix -> {term: total score}
+        for term, scores in term_scores.items():
+            total = sum(scores.values())
+            for end in range(1, min(len(term), MAX_PREFIX_LENGTH) + 1):
+                prefix = term[:end]
+                best = prefix_scores.setdefault(prefix, {})
+                for position, score in scores.items():
+                    if score > best.get(position, 0):
+                        best[position] = score
+                prefix_terms.setdefault(prefix, {})[term] = total
+
+        self.prefixes = {}
+        for prefix, scores in prefix_scores.items():
+            ranked = sorted(scores, key=lambda position: (-scores[position], position))
+            mask = 0
+            for position in ranked:
+                mask |= 1 << position
+            terms = prefix_terms[prefix]
+            completions = tuple(sorted(terms, key=lambda term: (-terms[term], term))[:MAX_COMPLETIONS])
+            self.prefixes[prefix] = (mask, array('H', ranked), completions)
+
+    def __len__(self):
+        return len(self.results)
+
+    def lookup(self, prefix):
+        return self.prefixes.get(prefix[:MAX_PREFIX_LENGTH])
+
+    def suggest(self, query, limit=8):
+        """{'results': [...], 'completions': [...]} for a partially typed query"""
+        typed = words(query)
+        tokens = [word for word in typed if word not in STOPWORDS] or typed
+        if not tokens:
+            return {'results': [], 'completions': []}
+
+        entries = [self.lookup(token) for token in tokens]
+        if any(entry is None for entry in entries):
+            return {'results': [], 'completions': []}
+
+        # Only the word being typed is completed; earlier words are already whole.
+        # Stopwords aren't indexed, so one being typed has nothing to complete.
+        completions = []
+        if typed[-1] not in STOPWORDS:
+            head = ' '.join(typed[:-1])
+            completions = [f'{head} {term}'.lstrip() for term in entries[-1][2]]
+
+        limit = min(limit, MAX_RESULTS)
+        if len(entries) == 1:
+            ranked = entries[0][1][:limit]
+        else:
+            mask = entries[0][0]
+            for entry in entries[1:]:
+                mask &= entry[0]
+            rarest = min(entries, key=lambda entry: len(entry[1]))[1]
+            ranked = [position for position in rarest if mask >> position & 1][:limit]
+        return {'results': [self.results[position] for position in ranked], 'completions': completions}
+
+
+class Typeahead:
+    """Holds the current PrefixIndex and swaps in a new one when the search index changes"""
+
+    def __init__(self):
+        self.index = None
+        self.lock = threading.Lock()
+
+    def build(self, version=None):
+        start = time.perf_counter()
+        rows = SearchableContent.objects.filter(is_active=True).order_by('-search_priority', 'id').values(
+            'page_url', 'page_title', 'section_name', 'section_title', 'section_description', 'content',
+            'search_priority',
+        )
+        index = PrefixIndex(rows, version)
+        logger.info(
+            'Typeahead index built: %s sections, %s prefixes in %.1fms',
+            len(index), len(index.prefixes), (time.perf_counter() - start) * 1000,
+        )
+        return index
+
+    def reload(self):
+        """Rebuild now (the hot-reload hook); the old index keeps serving until the swap"""
+        with self.lock:
+            self.index = self.build(query_cache.current_version())
+        return self.index
+
+    def current(self):
+        version = query_cache.current_version()
+        index = self.index
+        if index is not None and index.version == version:
+            return index
+        if index is None:
+            return self.reload()
+        # Someone else is already rebuilding; answer from the previous version meanwhile
+        if not self.lock.acquire(blocking=False):
+            return index
+        try:
+            self.index = self.build(version)
+        finally:
+            self.lock.release()
+        return self.index
+
+    def suggest(self, query, limit=8):
+        query = normalize(query)
+        if not query:
+            return {'results': [], 'completions': []}
+        return self.current().suggest(query, limit)
+
+
+typeahead = Typeahead()
+
+
+def preload():
+    """
+    Load the index before the first keystroke arrives. A failure here only
+    delays it to the first lookup.
+    """
+    try:
+        typeahead.reload()
+    except Exception:
+        logger.exception('Typeahead index could not be built at startup')
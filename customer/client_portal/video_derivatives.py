@@ -0,0 +1,213 @@
+# customer/client_portal/video_derivatives.py
+"""
+Bitrate ladders and poster frames for the static videos.
+
+This is an offline stage: ``manage.py build_video_derivatives`` runs a
+local ffmpeg over every MP4 under ``static/videos/`` and writes H.264
+renditions at the VIDEO_LADDER heights (never upscaled, audio dropped for
+the muted hero loops, moov atom up front) plus a JPEG and a WebP poster to
+``static/videos/derived/``. Commit the output together with
+``video_manifest.json``, which records each source's hash, dimensions,
+poster and renditions for the ``responsive_video`` template tag. Sources
+whose hash has not changed are skipped.
+"""
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+from django.conf import settings
+
+from .image_derivatives import file_digest
+
+APP_STATIC_ROOT = Path(__file__).resolve().parent / 'static'
+SOURCE_PREFIX = 'videos/'
+OUTPUT_PREFIX = 'videos/derived/'
+SOURCE_EXTENSIONS = ('.mp4', '.mov', '.webm')
+MANIFEST_PATH = Path(__file__).resolve().parent / 'video_manifest.json'
+
+
+def recipe():
+    """Build parameters; changing any of them rebuilds every rendition"""
+    return {
+        'ladder': [dict(rung) for rung in settings.VIDEO_LADDER],
+        'poster_offset': settings.VIDEO_POSTER_OFFSET,
+        'strip_audio': settings.VIDEO_STRIP_AUDIO,
+    }
+
+
+# ==================== MANIFEST ====================
+
+_manifest = None
+_manifest_mtime = None
+
+
+def read_manifest():
+    try:
+        with open(MANIFEST_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def renditions_for(name):
+    """Manifest entry for a static video name, or None if nothing was built"""
+    global _manifest, _manifest_mtime
+    try:
+        mtime = MANIFEST_PATH.stat().st_mtime
+    except OSError:
+        return None
+    if mtime != _manifest_mtime:
+        _manifest = read_manifest().get('videos', {})
+        _manifest_mtime = mtime
+    return _manifest.get(name)
+
+
+def write_manifest(videos):
+    tmp_path = MANIFEST_PATH.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'recipe': recipe(), 'videos': videos}, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+# ==================== BUILD ====================
+
+def find_source_videos():
+    """{static name: absolute path} for the videos shipped with client_portal"""
+    sources = {}
+    for path in sorted((APP_STATIC_ROOT / SOURCE_PREFIX).rglob('*')):
+        name = path.relative_to(APP_STATIC_ROOT).as_posix()
+        if path.is_file() and name.lower().endswith(SOURCE_EXTENSIONS) and not name.startswith(OUTPUT_PREFIX):
+            sources[name] = path
+    return sources
+
+
+def run_ffmpeg(ffmpeg, *args):
+    result = subprocess.run(
+        [ffmpeg, '-y', '-hide_banner', '-loglevel', 'error', *args],
+        capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f'ffmpeg exited with {result.returncode}')
+
+
+def extract_poster(ffmpeg, source_path, stem, offset):
+    """JPEG + WebP poster frames; returns ({format: name}, (width, height))"""
+    from PIL import Image
+
+    jpeg_name = f'{stem}-poster.jpg'
+    jpeg_path = APP_STATIC_ROOT / jpeg_name
+    # Fall back to the first frame for clips shorter than the offset
+    for seek in (offset, 0):
+        run_ffmpeg(ffmpeg, '-ss', str(seek), '-i', str(source_path), '-frames:v', '1', '-q:v', '3', str(jpeg_path))
+        if jpeg_path.exists():
+            break
+    else:
+        raise RuntimeError('no frame could be extracted')
+
+    webp_name = f'{stem}-poster.webp'
+    with Image.open(jpeg_path) as frame:
+        size = frame.size
+        frame.save(APP_STATIC_ROOT / webp_name, 'WEBP', quality=80)
+    return {'jpg': jpeg_name, 'webp': webp_name}, size
+
+
+def ladder_for(height, ladder):
+    """
+    Rungs below the source height, plus the source height itself (encoded
+    with the settings of the next rung up) if it is not taller than the ladder
+    """
+    ladder = sorted(ladder, key=lambda rung: rung['height'])
+    rungs = [rung for rung in ladder if rung['height'] < height]
+    above = [rung for rung in ladder if rung['height'] >= height]
+    if above:
+        rungs.append(dict(above[0], height=height))
+    return rungs
+
+
+def render_renditions(ffmpeg, name, source_path, digest, build_recipe):
+    # Keep the source extension in derived names, as the image derivatives do
+    stem = OUTPUT_PREFIX + name[len(SOURCE_PREFIX):]
+    os.makedirs(APP_STATIC_ROOT / os.path.dirname(stem), exist_ok=True)
+
+    poster, (width, height) = extract_poster(ffmpeg, source_path, stem, build_recipe['poster_offset'])
+    sources = []
+    for rung in ladder_for(height, build_recipe['ladder']):
+        rendition = f'{stem}-{rung["height"]}p.mp4'
+        maxrate = rung['maxrate']
+        args = ['-i', str(source_path)]
+        if build_recipe['strip_audio']:
+            args.append('-an')
+        args += [
+            # -2 keeps the width even, as H.264 requires
+            '-vf', f'scale=-2:{rung["height"]}',
+            '-c:v', 'libx264', '-preset', 'slow', '-crf', str(rung['crf']),
+            '-maxrate', maxrate, '-bufsize', f'{int(maxrate.rstrip("k")) * 2}k',
+            '-pix_fmt', 'yuv420p', '-movflags', '+faststart',
+            str(APP_STATIC_ROOT / rendition),
+        ]
+        run_ffmpeg(ffmpeg, *args)
+        sources.append({
+            'name': rendition,
+            'height': rung['height'],
+            'width': round(width * rung['height'] / height / 2) * 2,
+            'size': (APP_STATIC_ROOT / rendition).stat().st_size,
+        })
+
+    sources.sort(key=lambda source: source['size'])
+    return {'hash': digest, 'width': width, 'height': height, 'poster': poster, 'sources': sources}
+
+
+def output_names(entry):
+    return set(entry['poster'].values()) | {source['name'] for source in entry['sources']}
+
+
+def build_renditions(ffmpeg=None, force=False, log=None):
+    """
+    Bring the renditions up to date with the source videos. Returns the
+    built/skipped/removed counts and a {name: error} dict of failed sources.
+    """
+    ffmpeg = ffmpeg or settings.FFMPEG_BINARY
+    if not shutil.which(ffmpeg):
+        raise FileNotFoundError(f'ffmpeg binary not found: {ffmpeg}')
+    build_recipe = recipe()
+    previous = read_manifest()
+    if force or previous.get('recipe') != build_recipe:
+        previous_videos = {}
+    else:
+        previous_videos = previous.get('videos', {})
+
+    videos = {}
+    failed = {}
+    built = 0
+    for name, source_path in find_source_videos().items():
+        digest = file_digest(source_path)
+        entry = previous_videos.get(name)
+        if entry and entry['hash'] == digest and all(
+            (APP_STATIC_ROOT / output).exists() for output in output_names(entry)
+        ):
+            videos[name] = entry
+            continue
+
+        if log:
+            log(f'Transcoding {name}...')
+        try:
+            videos[name] = render_renditions(ffmpeg, name, source_path, digest, build_recipe)
+            built += 1
+        except (OSError, RuntimeError) as exc:
+            failed[name] = str(exc)
+
+    # Drop outputs that no current source produces
+    current = set().union(*(output_names(entry) for entry in videos.values()))
+    removed = 0
+    for entry in previous.get('videos', {}).values():
+        for output in output_names(entry) - current:
+            try:
+                (APP_STATIC_ROOT / output).unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+
+    write_manifest(videos)
+    return {'built': built, 'skipped': len(videos) - built, 'removed': removed, 'failed': failed}
@@ -0,0 +1,128 @@
+# customer/client_portal/views.py
+import logging
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
+from django.urls import URLResolver, get_resolver
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare
+from django.utils.cache import patch_cache_control
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_GET
+from django.views.generic import TemplateView
+
+from dycetix_common.database import check_database, get_pool_stats
+from dycetix_common.metrics import render_metrics
+
+from .page_cache import get_page, page_response, store_page
+from .site_search import search
+from .typeahead import MAX_RESULTS, typeahead
+
+logger = logging.getLogger(__name__)
+
+
+class CachedTemplateView(TemplateView):
+    """TemplateView served from the full-page cache (see page_cache.py)"""
+
+    def get(self, request, *args, **kwargs):
+        if not settings.PAGE_CACHE_ENABLED:
+            return super().get(request, *args, **kwargs)
+
+        entry = get_page(request.path)
+        if entry is None:
+            response = super().get(request, *args, **kwargs).render()
+            if response.status_code != 200:
+                return response
+            entry = store_page(request.path, response)
+        return page_response(request, entry)
+
+
+def cached_routes(patterns=None, prefix='/'):
+    """Yield (path, view) for every argument-free route served by CachedTemplateView"""
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    for pattern in patterns:
+        route = prefix + str(pattern.pattern)
+        if isinstance(pattern, URLResolver):
+            yield from cached_routes(pattern.url_patterns, route)
+            continue
+        view_class = getattr(pattern.callback, 'view_class', None)
+        if view_class and issubclass(view_class, CachedTemplateView) and '<' not in route:
+            yield route, pattern.callback
+
+
+def result_limit(request, default=8):
+    try:
+        return min(max(int(request.GET.get('limit', default)), 1), MAX_RESULTS)
+    except ValueError:
+        return default
+
+
+@require_GET
+def search_api(request):
+    """Ranked site search for the nav search box: /api/search/?q=web+dev"""
+    query = request.GET.get('q', '')
+    limit = result_limit(request)
+
+    try:
+        results = search(query, limit=limit)
+    except Exception:
+        logger.exception('Site search failed for %r', query)
+        return JsonResponse({'success': False, 'error': 'Search temporarily unavailable', 'results': []}, status=503)
+
+    response = JsonResponse({'success': True, 'query': query, 'count': len(results), 'results': results})
+    patch_cache_control(response, public=True, max_age=settings.SEARCH_BROWSER_MAX_AGE)
+    return response
+
+
+@require_GET
+def suggest_api(request):
+    """Search-as-you-type from the in-memory typeahead index: /api/suggest/?q=web+de"""
+    query = request.GET.get('q', '')
+    limit = result_limit(request)
+
+    try:
+        suggestions = typeahead.suggest(query, limit=limit)
+    except Exception:
+        logger.exception('Typeahead failed for %r', query)
+        return JsonResponse({'success': False, 'error': 'Search temporarily unavailable', 'results': []}, status=503)
+
+    response = JsonResponse({
+        'success': True,
+        'query': query,
+        'count': len(suggestions['results']),
+        'results': suggestions['results'],
+        'completions': suggestions['completions'],
+    })
+    patch_cache_control(response, public=True, max_age=settings.SEARCH_BROWSER_MAX_AGE)
+    return response
+
+
+@never_cache
+@require_GET
+def health(request):
+    """Liveness/readiness for the load balancer, with this worker's DB pool metrics"""
+    database = check_database()
+    healthy = database == 'connected'
+    return JsonResponse({
+        'success': healthy,
+        'data': {
+            'status': 'ok' if healthy else 'degraded',
+            'database': database,
+            'pool': get_pool_stats(),
+            'timestamp': timezone.now().isoformat(),
+        }
+    }, status=200 if healthy else 503)
+
+
+@never_cache
+@require_GET
+def metrics(request):
+    """Prometheus scrape endpoint; requires `Authorization: Bearer <METRICS_TOKEN>` when a token is set"""
+    if settings.METRICS_TOKEN:
+        supplied = request.META.get('HTTP_AUTHORIZATION', '').removeprefix('Bearer ')
+        if not constant_time_compare(supplied, settings.METRICS_TOKEN):
+            return HttpResponseForbidden()
+
+    body, content_type = render_metrics()
+    return HttpResponse(body, content_type=content_type)
@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dycetix_project.settings')
 
 application = get_asgi_application()
+
+# Load the typeahead index before the first keystroke arrives, as wsgi.py does
+from client_portal import typeahead  # noqa: E402
+
+typeahead.preload()
@@ -0,0 +1,29 @@
+# customer/dycetix_project/gunicorn.conf.py
+"""
+Gunicorn settings for the customer site: ``gunicorn -c
+dycetix_project/gunicorn.conf.py`` from the customer directory. Shared
+settings and hooks are in dycetix_common/gunicorn_config.py.
+
+The default GUNICORN_WORKER_MODE is sync (dycetix_project.wsgi): pages
+come from the page cache and requests are short.
+"""
+import os
+import sys
+
+# Gunicorn reads this before settings.py puts the repository root (dycetix_common) on the path
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
+from dycetix_common.gunicorn_config import *  # noqa: E402,F401,F403
+from dycetix_common.gunicorn_config import app_module, read_worker_mode, worker_counts  # noqa: E402
+
+worker_mode = read_worker_mode(default='sync')
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8001')}"
+wsgi_app = app_module('dycetix_project', worker_mode)
+worker_class, workers, threads = worker_counts(worker_mode)
+
+# The site takes no uploads (forms post to the admin API), so a stuck request
+# is a bug and its worker is recycled quickly
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '30'))
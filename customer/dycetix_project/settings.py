@@ -1,10 +1,15 @@
 # dycetix_system/customer/dycetix_project/settings.py
 import os
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
+# The repository root holds dycetix_common, shared with the admin site
+if str(BASE_DIR) not in sys.path:
+    sys.path.append(str(BASE_DIR))
+
 # Quick-start development settings - unsuitable for production
 SECRET_KEY = os.environ.get('CUSTOMER_SECRET_KEY', 'django-insecure-^huz9$!zd%=7dn^&qf^nxxd1fsc0jw+*&ilvw2u_6o82^7vsn5')
 DEBUG = os.environ.get('DEBUG', 'True').lower() in ('true', '1', 't')
@@ -107,6 +112,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # dycetix_system/customer/dycetix_project/settings.py
 import os
+import tempfile
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -119,18 +125,23 @@ ALLOWED_HOSTS = os.environ.get('CUSTOMER_ALLOWED_HOSTS', 'localhost,127.0.0.1,0.
 
 # Application definition
 INSTALLED_APPS = [
+    # Listed before staticfiles so its collectstatic (which builds image derivatives) wins
+    'client_portal',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
-    # Add your customer apps here when you create them
-    'client_portal',  # Uncomment when you create the app
+    'django.contrib.postgres',  # Trigram lookups for the site search
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Serves the precompressed .br/.gz files, with far-future caching for hashed names
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    # After WhiteNoise, so static files are not counted
+    'dycetix_common.metrics.RequestMetricsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -199,10 +210,42 @@ USE_TZ = True
 
 # Static files
 STATIC_URL = 'static/'
+# Responsive image derivatives (client_portal/image_derivatives.py), built by collectstatic
+IMAGE_DERIVATIVES_ROOT = BASE_DIR / 'customer' / 'derived_static'
+IMAGE_DERIVATIVE_WIDTHS = (480, 800, 1200, 1600)
+IMAGE_DERIVATIVE_FORMATS = {
+    'avif': {'quality': 55, 'speed': 6},
+    'webp': {'quality': 80, 'method': 4},
+}
+
+# Video renditions and posters (client_portal/video_derivatives.py), built
+# offline with `manage.py build_video_derivatives` and committed
+FFMPEG_BINARY = os.environ.get('FFMPEG_BINARY', 'ffmpeg')
+VIDEO_LADDER = (
+    {'height': 360, 'crf': 30, 'maxrate': '600k'},
+    {'height': 720, 'crf': 27, 'maxrate': '1800k'},
+    {'height': 1080, 'crf': 25, 'maxrate': '4000k'},
+)
+VIDEO_POSTER_OFFSET = 0.5  # Seconds; skips fade-ins from black
+VIDEO_STRIP_AUDIO = True  # Every video on the site plays muted
+
+# Minified per-page CSS/JS bundles (client_portal/asset_bundles.py), built by collectstatic;
+# the build fails when a page's Brotli-compressed CSS+JS exceeds the budget
+ASSET_BUNDLES_ROOT = BASE_DIR / 'customer' / 'derived_static' / 'bundles'
+ASSET_BUNDLES_ENABLED = os.environ.get('ASSET_BUNDLES_ENABLED', 'True').lower() in ('true', '1', 't')
+ASSET_BUDGET_BYTES = int(os.environ.get('ASSET_BUDGET_BYTES', 32 * 1024))
+
 STATICFILES_DIRS = [
     BASE_DIR / 'client_portal/static',
+    IMAGE_DERIVATIVES_ROOT / 'files',
+    ASSET_BUNDLES_ROOT / 'files',
 ]
 STATIC_ROOT = BASE_DIR / 'staticfiles'
+# Hashed names (cacheable forever) plus precompressed .br/.gz copies of every text asset
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage'},
+}
 
 # Media files (if needed)
 MEDIA_URL = '/media/'
@@ -211,6 +254,35 @@ MEDIA_ROOT = BASE_DIR / 'media'
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Caches
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Rendered marketing pages, shared by all workers on the host and filled
+    # by `manage.py warm_page_cache` at deploy time
+    'pages': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('PAGE_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'dycetix-page-cache')),
+        'OPTIONS': {'MAX_ENTRIES': 1000},
+    },
+}
+
+# Full-page cache for the marketing pages (client_portal/page_cache.py)
+PAGE_CACHE_ENABLED = os.environ.get('PAGE_CACHE_ENABLED', 'True').lower() in ('true', '1', 't')
+PAGE_CACHE_TIMEOUT = int(os.environ.get('PAGE_CACHE_TIMEOUT', 60 * 60 * 24))  # Keys change with templates anyway
+PAGE_CACHE_BROWSER_MAX_AGE = int(os.environ.get('PAGE_CACHE_BROWSER_MAX_AGE', 300))
+PAGE_CACHE_CDN_MAX_AGE = int(os.environ.get('PAGE_CACHE_CDN_MAX_AGE', 60 * 60))
+
+# Request metrics (dycetix_common/metrics.py), scraped from /metrics
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')  # Bearer token required by /metrics when set
+METRICS_SLOW_REQUEST_MS = int(os.environ.get('METRICS_SLOW_REQUEST_MS', '1000'))  # Logged with their SQL
+
+# Site search (client_portal/site_search.py), indexed by `manage.py index_search_content`
+SEARCH_CACHE_SIZE = 512  # Hot queries kept per process
+SEARCH_INDEX_CHECK_INTERVAL = 5  # Seconds between checks for a re-index
+SEARCH_BROWSER_MAX_AGE = 60
+
 # ============================================
 # RENDER PRODUCTION SETTINGS (REPLACE ENTIRE SECTION)
 # ============================================
@@ -224,7 +296,6 @@ if os.environ.get('RENDER'):
     DATABASES = {
         'default': dj_database_url.config(
             default=os.environ.get('DATABASE_URL'),
-            conn_max_age=600,
             ssl_require=True
         )
     }
@@ -257,11 +328,11 @@ if os.environ.get('RENDER'):
     # Static files
     STATIC_URL = '/static/'
     STATIC_ROOT = os.path.join(CUSTOMER_BASE_DIR, 'staticfiles')
-    STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
-    STATICFILES_DIRS = [CUSTOMER_BASE_DIR / 'client_portal/static']
-    
-    # WhiteNoise middleware
-    MIDDLEWARE.insert(1, 'whitenoise.middleware.WhiteNoiseMiddleware')
+    STATICFILES_DIRS = [
+        CUSTOMER_BASE_DIR / 'client_portal/static',
+        IMAGE_DERIVATIVES_ROOT / 'files',
+        ASSET_BUNDLES_ROOT / 'files',
+    ]
     
     # Logging
     LOGGING = {
@@ -276,4 +347,11 @@ if os.environ.get('RENDER'):
             'handlers': ['console'],
             'level': 'INFO',
         },
-    }
\ No newline at end of file
+    }
+
+
+# Connection pooling on PostgreSQL, persistent connections otherwise
+# (WEB_CONCURRENCY, DB_MAX_CONNECTIONS, DB_POOL*: see dycetix_common/database.py)
+from dycetix_common.database import configure_connections  # noqa: E402
+
+DB_POOL_ENABLED = configure_connections(DATABASES['default'])
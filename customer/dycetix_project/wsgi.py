@@ -5,4 +5,9 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dycetix_project.settings')
 
 application = get_wsgi_application()
 
-# WhiteNoise will be added by middleware
\ No newline at end of file
+# Load the typeahead index before the first keystroke arrives
+from client_portal import typeahead  # noqa: E402
+
+typeahead.preload()
+
+# WhiteNoise will be added by middleware
@@ -0,0 +1,6 @@
+# dycetix_common/__init__.py
+"""
+Helpers shared by the admin and customer Django projects: request metrics,
+database health and the load-test runner. Each project's settings put the
+repository root on sys.path so this package imports from either one.
+"""
@@ -0,0 +1,96 @@
+# dycetix_common/database.py
+"""
+Database connection settings, plus connectivity and connection pool
+metrics for the health endpoint.
+
+The pool lives in the worker process, so the numbers describe the worker
+that answered the request (its pid is included) and count from its start.
+"""
+import os
+from importlib.util import find_spec
+
+from django.db import connection
+
+# Engines whose backend takes OPTIONS['pool'] (psycopg 3)
+POOLED_ENGINES = ('django.db.backends.postgresql', 'django.contrib.gis.db.backends.postgis')
+
+# psycopg_pool counters -> names reported by the health endpoint
+POOL_COUNTERS = {
+    'requests_num': 'checkouts',
+    'requests_queued': 'checkouts_waited',
+    'requests_wait_ms': 'wait_ms_total',
+    'requests_errors': 'timeouts',
+    'connections_num': 'connections_opened',
+    'connections_errors': 'connection_errors',
+    'connections_lost': 'connections_lost',
+    'returns_bad': 'returns_bad',
+}
+
+
+def configure_connections(database):
+    """
+    Set up connection reuse for `database`, a DATABASES entry, and return
+    whether it is pooled. On PostgreSQL each worker process keeps a psycopg
+    pool, sized so all gunicorn workers (WEB_CONCURRENCY) together stay
+    within DB_MAX_CONNECTIONS. Other engines, installs without
+    psycopg_pool and DB_POOL=False use persistent connections instead.
+    """
+    pooled = (
+        database['ENGINE'] in POOLED_ENGINES
+        and find_spec('psycopg_pool') is not None
+        and os.environ.get('DB_POOL', 'True').lower() in ('true', '1', 't')
+    )
+    if pooled:
+        workers = int(os.environ.get('WEB_CONCURRENCY', '2'))
+        max_connections = int(os.environ.get('DB_MAX_CONNECTIONS', '20'))
+        database['CONN_MAX_AGE'] = 0  # Pooling replaces persistent connections
+        database.setdefault('OPTIONS', {})['pool'] = {
+            'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', '1')),
+            'max_size': max(1, max_connections // workers),
+            'timeout': float(os.environ.get('DB_POOL_TIMEOUT', '10')),  # Seconds to wait for a free connection
+            'max_idle': 300,
+            'max_lifetime': 1800,
+        }
+    else:
+        database['CONN_MAX_AGE'] = 600
+    # Ping a connection before it is handed out (pool) or reused (persistent)
+    database['CONN_HEALTH_CHECKS'] = True
+    return pooled
+
+
+def check_database():
+    """'connected', or 'disconnected: <reason>'"""
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        return 'connected'
+    except Exception as e:
+        return f'disconnected: {str(e)}'
+
+
+def get_pool_stats():
+    """Size and counters of this process's connection pool"""
+    pool = getattr(connection, 'pool', None)  # Only the PostgreSQL backend pools
+    if pool is None:
+        return {
+            'enabled': False,
+            'pid': os.getpid(),
+            'conn_max_age': connection.settings_dict.get('CONN_MAX_AGE'),
+        }
+
+    stats = pool.get_stats()
+    data = {
+        'enabled': True,
+        'pid': os.getpid(),
+        'min_size': stats.get('pool_min', pool.min_size),
+        'max_size': stats.get('pool_max', pool.max_size),
+        'size': stats.get('pool_size', 0),
+        'available': stats.get('pool_available', 0),
+        'waiting': stats.get('requests_waiting', 0),
+        'timeout': pool.timeout,
+    }
+    # Counters are missing until they first move
+    for counter, name in POOL_COUNTERS.items():
+        data[name] = stats.get(counter, 0)
+    data['wait_ms_avg'] = round(data['wait_ms_total'] / data['checkouts'], 2) if data['checkouts'] else 0.0
+    return data
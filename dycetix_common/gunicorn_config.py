@@ -0,0 +1,155 @@
+# dycetix_common/gunicorn_config.py
+"""
+Gunicorn settings and hooks shared by the admin and customer configs.
+
+Each project's ``gunicorn.conf.py`` star-imports this module for the
+common settings and hooks. It then sets what differs per app: the
+default worker mode, the port, the Django project module and the timeout.
+
+GUNICORN_WORKER_MODE picks the worker model:
+    uvicorn  ASGI (<project>.asgi)
+    gthread  WSGI with GUNICORN_THREADS threads per worker
+    sync     WSGI, one request per worker
+WEB_CONCURRENCY overrides the CPU-based worker count and, through the
+settings, sizes each worker's database pool.
+"""
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+__all__ = [
+    'preload_app', 'max_requests', 'max_requests_jitter', 'graceful_timeout', 'keepalive',
+    'worker_tmp_dir', 'forwarded_allow_ips', 'accesslog', 'errorlog', 'loglevel', 'access_log_format',
+    'on_starting', 'when_ready', 'post_fork', 'pre_request', 'post_request', 'worker_exit', 'child_exit',
+]
+
+logger = logging.getLogger('gunicorn.error')
+
+WORKER_CLASSES = {
+    'sync': 'sync',
+    'gthread': 'gthread',
+    'uvicorn': 'uvicorn.workers.UvicornWorker',
+}
+
+
+def cpu_count():
+    try:
+        return len(os.sched_getaffinity(0))  # CPUs this container may use
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def read_worker_mode(default):
+    worker_mode = os.environ.get('GUNICORN_WORKER_MODE', default)
+    if worker_mode not in WORKER_CLASSES:
+        raise RuntimeError(f'Unknown GUNICORN_WORKER_MODE {worker_mode!r}')
+    return worker_mode
+
+
+def app_module(project, worker_mode):
+    """The Django entry point gunicorn serves: ``<project>.asgi`` under uvicorn, else ``<project>.wsgi``"""
+    return f'{project}.asgi:application' if worker_mode == 'uvicorn' else f'{project}.wsgi:application'
+
+
+def worker_counts(worker_mode):
+    """(worker_class, workers, threads) for `worker_mode`"""
+    # Sync workers handle one request at a time, so they need more processes;
+    # threaded and async workers overlap I/O inside each process.
+    default_workers = cpu_count() * 2 + 1 if worker_mode == 'sync' else cpu_count() + 1
+    workers = int(os.environ.get('WEB_CONCURRENCY', default_workers))
+    threads = int(os.environ.get('GUNICORN_THREADS', '4')) if worker_mode == 'gthread' else 1
+    os.environ['WEB_CONCURRENCY'] = str(workers)  # Read by the settings to size the DB pools
+    return WORKER_CLASSES[worker_mode], workers, threads
+
+
+# ==================== WORKERS ====================
+
+# Import Django once in the master and fork: workers share its pages copy-on-write
+preload_app = True
+
+# Each worker writes its metrics here and /metrics merges them (dycetix_common/metrics.py).
+# Must be set before the app, and so prometheus_client, is imported.
+if not os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+    os.environ['PROMETHEUS_MULTIPROC_DIR'] = tempfile.mkdtemp(prefix='prometheus-')
+
+# Recycle workers to cap slow memory growth; jitter keeps them from restarting together
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', '100'))
+
+# ==================== TIMEOUTS ====================
+
+graceful_timeout = 30
+keepalive = 5  # Render's proxy reuses connections; ignored by sync workers
+
+worker_tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None  # Heartbeat off the container's disk
+forwarded_allow_ips = '*'  # Behind Render's proxy
+
+# ==================== LOGGING ====================
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+access_log_format = '%(h)s "%(r)s" %(s)s %(b)s %(M)sms "%(a)s"'
+slow_request_ms = int(os.environ.get('GUNICORN_SLOW_REQUEST_MS', '1000'))
+
+# ==================== HOOKS ====================
+
+
+def on_starting(server):
+    # Counters from a previous run of this server would otherwise be summed in
+    metrics_dir = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def when_ready(server):
+    # The master may have queried the database while preloading; forked
+    # workers must not inherit its connections or pool
+    from django.db import connections
+
+    connections.close_all()
+    for connection in connections.all():
+        if hasattr(connection, 'close_pool'):
+            connection.close_pool()
+    server.log.info(
+        'Serving %s with %s %s worker(s) x %s thread(s)',
+        server.cfg.wsgi_app, server.cfg.workers, server.cfg.worker_class_str, server.cfg.threads,
+    )
+
+
+def post_fork(server, worker):
+    worker.request_stats = {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'slow': 0}
+
+
+# pre_request/post_request run for sync and gthread workers; uvicorn workers
+# log their own request lines instead
+def pre_request(worker, req):
+    req.started_at = time.perf_counter()
+
+
+def post_request(worker, req, environ, resp):
+    elapsed_ms = (time.perf_counter() - req.started_at) * 1000
+    stats = worker.request_stats
+    stats['count'] += 1
+    stats['total_ms'] += elapsed_ms
+    stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+    if elapsed_ms >= slow_request_ms:
+        stats['slow'] += 1
+        logger.warning('Slow request: %s %s took %.0fms (%s)', req.method, req.path, elapsed_ms, resp.status)
+
+
+def worker_exit(server, worker):
+    stats = getattr(worker, 'request_stats', None)
+    if stats and stats['count']:
+        server.log.info(
+            'Worker %s served %s request(s): mean %.1fms, max %.0fms, %s slow',
+            worker.pid, stats['count'], stats['total_ms'] / stats['count'], stats['max_ms'], stats['slow'],
+        )
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,155 @@
+# dycetix_common/loadtest.py
+"""
+In-process concurrent load generator used by the ``loadtest_*`` commands.
+
+Each scenario is a callable taking a django.test.Client and returning the
+response. ``run_scenario`` drives it from N threads, each with its own
+client and database connection. It records per-request latency and SQL
+query count (via ``connection.execute_wrapper``) and returns throughput,
+p50/p95/p99 and the process's peak RSS. Results are plain dicts, ready to
+be written to JSON and compared between commits with ``compare_results``.
+"""
+import platform
+import resource
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import django
+from django.db import connection
+from django.test import Client
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=5, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def environment():
+    return {
+        'commit': git_revision(),
+        'database': connection.vendor,
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+    }
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def run_scenario(scenario, requests, concurrency, make_client=Client, warmup=5):
+    """Send `requests` requests through `scenario(client)` from `concurrency` threads"""
+    local = threading.local()
+
+    def client():
+        if not hasattr(local, 'client'):
+            local.client = make_client()
+        return local.client
+
+    def one_request(_):
+        request_client = client()  # Created (and logged in) outside the timing
+        counter = QueryCounter()
+        start = time.perf_counter()
+        with connection.execute_wrapper(counter):
+            response = scenario(request_client)
+        elapsed = time.perf_counter() - start
+        return elapsed, counter.count, response.status_code
+
+    # Connections can only be closed by their own thread: the barrier puts one
+    # close on every worker thread
+    barrier = threading.Barrier(concurrency)
+
+    def close_connection(_):
+        barrier.wait(timeout=30)
+        connection.close()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one_request, range(warmup)))
+        started = time.perf_counter()
+        samples = list(pool.map(one_request, range(requests)))
+        wall = time.perf_counter() - started
+        list(pool.map(close_connection, range(concurrency)))
+
+    latencies = [elapsed * 1000 for elapsed, _, _ in samples]
+    statuses = {}
+    for _, _, status in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    return {
+        'requests': requests,
+        'concurrency': concurrency,
+        'throughput_rps': round(requests / wall, 1) if wall else 0.0,
+        'latency_ms': {
+            'p50': round(percentile(latencies, 0.50), 2),
+            'p95': round(percentile(latencies, 0.95), 2),
+            'p99': round(percentile(latencies, 0.99), 2),
+            'max': round(max(latencies, default=0.0), 2),
+        },
+        'queries_per_request': round(sum(count for _, count, _ in samples) / max(requests, 1), 2),
+        'errors': sum(1 for _, _, status in samples if status >= 400),
+        'status_codes': statuses,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def format_result(name, result):
+    latency = result['latency_ms']
+    return (
+        f'{name:<40} {result["throughput_rps"]:>9.1f} {latency["p50"]:>8.2f} {latency["p95"]:>8.2f} '
+        f'{latency["p99"]:>8.2f} {result["queries_per_request"]:>7.1f} {result["errors"]:>6} {result["peak_rss_mb"]:>8.1f}'
+    )
+
+
+RESULT_HEADER = (
+    f'{"scenario":<40} {"req/s":>9} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8} {"queries":>7} {"errors":>6} {"rss MB":>8}'
+)
+
+
+def compare_results(baseline, current, tolerance=0.10):
+    """Lines describing scenarios whose p95 or throughput regressed by more than `tolerance`"""
+    regressions = []
+    for name, result in current['scenarios'].items():
+        before = baseline.get('scenarios', {}).get(name)
+        if not before:
+            continue
+        if before['concurrency'] != result['concurrency']:
+            regressions.append(
+                f'{name}: not comparable (baseline concurrency {before["concurrency"]}, now {result["concurrency"]})'
+            )
+            continue
+        p95_before, p95_now = before['latency_ms']['p95'], result['latency_ms']['p95']
+        if p95_before and p95_now > p95_before * (1 + tolerance):
+            regressions.append(f'{name}: p95 {p95_before:.2f}ms -> {p95_now:.2f}ms')
+        rps_before, rps_now = before['throughput_rps'], result['throughput_rps']
+        if rps_before and rps_now < rps_before * (1 - tolerance):
+            regressions.append(f'{name}: throughput {rps_before:.1f} -> {rps_now:.1f} req/s')
+        if result['queries_per_request'] > before['queries_per_request']:
+            regressions.append(
+                f'{name}: queries/request {before["queries_per_request"]} -> {result["queries_per_request"]}'
+            )
+    return regressions
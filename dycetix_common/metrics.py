@@ -0,0 +1,155 @@
+# dycetix_common/metrics.py
+"""
+Request and SQL instrumentation, exported in the Prometheus text format.
+
+RequestMetricsMiddleware times every request and wraps the database
+connection with ``connection.execute_wrapper`` to count and time its SQL.
+Series are labelled by URL route (e.g. ``api/search/``), which keeps the
+label set bounded. The middleware is sync and async capable, so the admin's
+ASGI stack (config.asgi under uvicorn) is not forced through a thread for
+every request. Sync views there run on the request's thread-sensitive
+thread, which is where the execute wrapper is installed.
+
+Under gunicorn each worker has its own registry. The gunicorn config points
+PROMETHEUS_MULTIPROC_DIR at a shared directory, and ``render_metrics()``
+merges every worker's files, so a scrape sees the whole server whichever
+worker answers it. Without that variable (runserver, tests) the in-process
+registry is used.
+"""
+import logging
+import os
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connection
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client import multiprocess
+
+logger = logging.getLogger(__name__)
+
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, float('inf'))
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, float('inf'))
+MAX_CAPTURED_QUERIES = 100  # Statements kept per request for the slow-request log
+
+REQUEST_LATENCY = Histogram(
+    'django_request_duration_seconds', 'Request latency by view', ['view', 'method', 'status'],
+)
+REQUEST_QUERIES = Histogram(
+    'django_request_sql_queries', 'SQL queries per request', ['view'], buckets=QUERY_COUNT_BUCKETS,
+)
+REQUEST_SQL_TIME = Histogram(
+    'django_request_sql_duration_seconds', 'Time spent in SQL per request', ['view'],
+)
+RESPONSE_SIZE = Histogram(
+    'django_response_size_bytes', 'Response body size (non-streaming responses)', ['view'], buckets=SIZE_BUCKETS,
+)
+UPLOAD_BYTES = Counter(
+    'django_request_upload_bytes', 'Request body bytes received', ['view'],
+)
+SLOW_REQUESTS = Counter(
+    'django_slow_requests', 'Requests slower than METRICS_SLOW_REQUEST_MS', ['view'],
+)
+
+
+class QueryRecorder:
+    """connection.execute_wrapper callable that counts, times and keeps the statements of one request"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.count += 1
+            self.duration += elapsed
+            if len(self.statements) < MAX_CAPTURED_QUERIES:
+                self.statements.append((elapsed, sql))
+
+
+def view_label(request):
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unresolved'
+    return match.route or match.view_name
+
+
+class RequestMetricsMiddleware:
+    """Records latency, SQL, response size and upload bytes per view; logs slow requests with their SQL"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - start
+
+        try:
+            self.record(request, response, recorder, elapsed)
+        except Exception:
+            logger.exception('Could not record metrics for %s', request.path)
+        return response
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        # `connection` is per thread: wrap the one the sync views and ORM calls will use
+        await sync_to_async(lambda: connection.execute_wrappers.append(recorder))()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(lambda: connection.execute_wrappers.remove(recorder))()
+        elapsed = time.perf_counter() - start
+
+        try:
+            self.record(request, response, recorder, elapsed)
+        except Exception:
+            logger.exception('Could not record metrics for %s', request.path)
+        return response
+
+    def record(self, request, response, recorder, elapsed):
+        view = view_label(request)
+        REQUEST_LATENCY.labels(view, request.method, str(response.status_code)).observe(elapsed)
+        REQUEST_QUERIES.labels(view).observe(recorder.count)
+        REQUEST_SQL_TIME.labels(view).observe(recorder.duration)
+        if not response.streaming:
+            RESPONSE_SIZE.labels(view).observe(len(response.content))
+        upload_bytes = int(request.META.get('CONTENT_LENGTH') or 0)
+        if upload_bytes:
+            UPLOAD_BYTES.labels(view).inc(upload_bytes)
+
+        if elapsed * 1000 >= settings.METRICS_SLOW_REQUEST_MS:
+            SLOW_REQUESTS.labels(view).inc()
+            slowest = sorted(recorder.statements, key=lambda statement: -statement[0])[:10]
+            logger.warning(
+                'Slow request: %s %s -> %s in %.0fms, %s queries in %.0fms%s',
+                request.method, request.path, response.status_code, elapsed * 1000,
+                recorder.count, recorder.duration * 1000,
+                ''.join(f'\n  {duration * 1000:.1f}ms {sql[:500]}' for duration, sql in slowest),
+            )
+
+
+def render_metrics():
+    """(body, content type) of the Prometheus text exposition for all workers"""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST